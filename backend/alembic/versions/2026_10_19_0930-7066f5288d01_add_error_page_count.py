@@ -0,0 +1,24 @@
+"""Add page_count to errors for template block findings
+
+Revision ID: 7066f5288d01
+Revises: 7a4ae170b612
+Create Date: 2026-10-19 09:30:12.418205
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7066f5288d01'
+down_revision = '7a4ae170b612'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('errors', sa.Column('page_count', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('errors', 'page_count')
@@ -0,0 +1,24 @@
+"""Add language_bytes to pages
+
+Revision ID: 3c52b8f1e9a4
+Revises: 7066f5288d01
+Create Date: 2026-10-19 14:15:41.902337
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3c52b8f1e9a4'
+down_revision = '7066f5288d01'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('pages', sa.Column('language_bytes', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('pages', 'language_bytes')
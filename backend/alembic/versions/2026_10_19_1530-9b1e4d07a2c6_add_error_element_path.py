@@ -0,0 +1,24 @@
+"""Add element_path to errors
+
+Revision ID: 9b1e4d07a2c6
+Revises: 3c52b8f1e9a4
+Create Date: 2026-10-19 15:30:08.551902
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9b1e4d07a2c6'
+down_revision = '3c52b8f1e9a4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('errors', sa.Column('element_path', sa.String(length=500), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('errors', 'element_path')
@@ -0,0 +1,36 @@
+"""Add asset error type
+
+Revision ID: 5d2e8c4a7f13
+Revises: 9b1e4d07a2c6
+Create Date: 2026-10-19 17:00:42.118305
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5d2e8c4a7f13'
+down_revision = '9b1e4d07a2c6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # A value added by ALTER TYPE ... ADD VALUE cannot be used in the
+    # transaction that added it: commit it outside the migration transaction
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE errortype ADD VALUE IF NOT EXISTS 'ASSET'")
+
+
+def downgrade() -> None:
+    # PostgreSQL cannot drop a value from an enum type: remove the asset
+    # errors and recreate the type without it
+    op.execute("DELETE FROM errors WHERE error_type = 'ASSET'")
+    op.execute("ALTER TYPE errortype RENAME TO errortype_old")
+    op.execute("CREATE TYPE errortype AS ENUM ('SPELLING', 'ADDRESS', 'BROKEN_LINK', 'SEO', 'PHONE')")
+    op.execute(
+        "ALTER TABLE errors ALTER COLUMN error_type TYPE errortype "
+        "USING error_type::text::errortype"
+    )
+    op.execute("DROP TYPE errortype_old")
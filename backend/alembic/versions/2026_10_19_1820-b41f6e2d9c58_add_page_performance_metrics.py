@@ -0,0 +1,52 @@
+"""Add page performance metrics
+
+Revision ID: b41f6e2d9c58
+Revises: 5d2e8c4a7f13
+Create Date: 2026-10-19 18:20:17.402661
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b41f6e2d9c58'
+down_revision = '5d2e8c4a7f13'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('pages', sa.Column('ttfb_ms', sa.Integer(), nullable=True))
+    op.add_column('pages', sa.Column('download_ms', sa.Integer(), nullable=True))
+    op.add_column('pages', sa.Column('transfer_size', sa.Integer(), nullable=True))
+    op.add_column('pages', sa.Column('content_size', sa.Integer(), nullable=True))
+    op.add_column('pages', sa.Column('redirect_count', sa.Integer(), nullable=True))
+    op.add_column('pages', sa.Column('content_encoding', sa.String(length=50), nullable=True))
+    op.add_column('scan_sessions', sa.Column('performance', sa.JSON(), nullable=True))
+
+    # A value added by ALTER TYPE ... ADD VALUE cannot be used in the
+    # transaction that added it: commit it outside the migration transaction
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE errortype ADD VALUE IF NOT EXISTS 'PERFORMANCE'")
+
+
+def downgrade() -> None:
+    # PostgreSQL cannot drop a value from an enum type: remove the
+    # performance errors and recreate the type without it
+    op.execute("DELETE FROM errors WHERE error_type = 'PERFORMANCE'")
+    op.execute("ALTER TYPE errortype RENAME TO errortype_old")
+    op.execute("CREATE TYPE errortype AS ENUM ('SPELLING', 'ADDRESS', 'BROKEN_LINK', 'SEO', 'PHONE', 'ASSET')")
+    op.execute(
+        "ALTER TABLE errors ALTER COLUMN error_type TYPE errortype "
+        "USING error_type::text::errortype"
+    )
+    op.execute("DROP TYPE errortype_old")
+
+    op.drop_column('scan_sessions', 'performance')
+    op.drop_column('pages', 'content_encoding')
+    op.drop_column('pages', 'redirect_count')
+    op.drop_column('pages', 'content_size')
+    op.drop_column('pages', 'transfer_size')
+    op.drop_column('pages', 'download_ms')
+    op.drop_column('pages', 'ttfb_ms')
@@ -0,0 +1,24 @@
+"""Add page check data
+
+Revision ID: c7f3a1d2e845
+Revises: b41f6e2d9c58
+Create Date: 2026-10-19 19:45:08.215934
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c7f3a1d2e845'
+down_revision = 'b41f6e2d9c58'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('pages', sa.Column('check_data', sa.JSON(none_as_null=True), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('pages', 'check_data')
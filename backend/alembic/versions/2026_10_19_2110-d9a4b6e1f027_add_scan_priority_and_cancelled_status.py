@@ -0,0 +1,51 @@
+"""Add scan priority and cancelled status
+
+Revision ID: d9a4b6e1f027
+Revises: c7f3a1d2e845
+Create Date: 2026-10-19 21:10:42.518377
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd9a4b6e1f027'
+down_revision = 'c7f3a1d2e845'
+branch_labels = None
+depends_on = None
+
+
+scanpriority = sa.Enum('INTERACTIVE', 'SCHEDULED', name='scanpriority')
+
+
+def upgrade() -> None:
+    scanpriority.create(op.get_bind(), checkfirst=True)
+    op.add_column(
+        'scan_sessions',
+        sa.Column('priority', scanpriority, server_default='INTERACTIVE', nullable=False),
+    )
+
+    # A value added by ALTER TYPE ... ADD VALUE cannot be used in the
+    # transaction that added it: commit it outside the migration transaction
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE scanstatus ADD VALUE IF NOT EXISTS 'CANCELLED'")
+
+
+def downgrade() -> None:
+    # PostgreSQL cannot drop a value from an enum type: report cancelled
+    # scans as failed and recreate the type without it
+    op.execute(
+        "UPDATE scan_sessions SET status = 'FAILED', error_message = 'Cancelled' "
+        "WHERE status = 'CANCELLED'"
+    )
+    op.execute("ALTER TYPE scanstatus RENAME TO scanstatus_old")
+    op.execute("CREATE TYPE scanstatus AS ENUM ('PENDING', 'RUNNING', 'COMPLETED', 'FAILED')")
+    op.execute(
+        "ALTER TABLE scan_sessions ALTER COLUMN status TYPE scanstatus "
+        "USING status::text::scanstatus"
+    )
+    op.execute("DROP TYPE scanstatus_old")
+
+    op.drop_column('scan_sessions', 'priority')
+    scanpriority.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,24 @@
+"""Add scan preferences hash
+
+Revision ID: e5c8f2a9b314
+Revises: d9a4b6e1f027
+Create Date: 2026-10-19 22:30:41.508127
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5c8f2a9b314'
+down_revision = 'd9a4b6e1f027'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('scan_sessions', sa.Column('preferences_hash', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('scan_sessions', 'preferences_hash')
@@ -0,0 +1,28 @@
+"""Add website scan schedule
+
+Revision ID: f1b7d3c6a820
+Revises: e5c8f2a9b314
+Create Date: 2026-10-19 23:45:12.731946
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f1b7d3c6a820'
+down_revision = 'e5c8f2a9b314'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('websites', sa.Column('scan_interval_hours', sa.Integer(), nullable=True))
+    op.add_column('websites', sa.Column('next_scan_at', sa.DateTime(timezone=True), nullable=True))
+    op.create_index(op.f('ix_websites_next_scan_at'), 'websites', ['next_scan_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_websites_next_scan_at'), table_name='websites')
+    op.drop_column('websites', 'next_scan_at')
+    op.drop_column('websites', 'scan_interval_hours')
@@ -0,0 +1,30 @@
+"""Store error element_path as text
+
+Revision ID: a3e9c5d1b762
+Revises: f1b7d3c6a820
+Create Date: 2026-10-20 09:15:41.208317
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3e9c5d1b762'
+down_revision = 'f1b7d3c6a820'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column('errors', 'element_path', type_=sa.Text(), existing_type=sa.String(length=500), existing_nullable=True)
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'errors', 'element_path',
+        type_=sa.String(length=500),
+        existing_type=sa.Text(),
+        existing_nullable=True,
+        postgresql_using='left(element_path, 500)',
+    )
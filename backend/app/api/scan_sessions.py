@@ -1,14 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.orm import selectinload
 from typing import List
+from datetime import datetime
 
+from app.core.config import settings
 from app.core.database import get_db
 from app.models import ScanSession, Website, Page
 from app.models.scan_session import ScanStatus
 from app.schemas.scan_session import ScanSessionCreate, ScanSessionResponse, ScanSessionDetail
-from app.tasks.scan_website import scan_website_task
+from app.services.scan_coalescer import scan_coalescer
+from app.services.scan_events import scan_events
+from app.tasks.scan_website import scan_task_priority, scan_website_task
 
 router = APIRouter()
 
@@ -16,9 +21,15 @@ router = APIRouter()
 @router.post("/", response_model=ScanSessionResponse, status_code=201)
 async def create_scan(
     scan_in: ScanSessionCreate,
+    response: Response,
     db: AsyncSession = Depends(get_db)
 ):
-    """Create a new scan session and start scanning."""
+    """
+    Create a new scan session and start scanning.
+    
+    If the website already has a pending or running scan with the same
+    preferences, that scan is returned (200) instead, unless force is set.
+    """
     # Check if website exists
     result = await db.execute(
         select(Website).where(Website.id == scan_in.website_id)
@@ -28,18 +39,33 @@ async def create_scan(
     if not website:
         raise HTTPException(status_code=404, detail="Website not found")
     
-    # Create scan session
-    scan_session = ScanSession(
-        website_id=website.id,
-        status=ScanStatus.PENDING,
-    )
+    preferences_hash = scan_coalescer.preferences_hash(website.preferences)
     
-    db.add(scan_session)
-    await db.commit()
-    await db.refresh(scan_session)
+    async with scan_coalescer.lock(website.id):
+        if settings.SCAN_COALESCE_ENABLED and not scan_in.force:
+            duplicate = await scan_coalescer.find_duplicate(db, website.id, preferences_hash)
+            if duplicate:
+                response.status_code = 200
+                return duplicate
+        
+        # Create scan session
+        scan_session = ScanSession(
+            website_id=website.id,
+            status=ScanStatus.PENDING,
+            priority=scan_in.priority,
+            preferences_hash=preferences_hash,
+        )
+        
+        db.add(scan_session)
+        await db.commit()
+        await db.refresh(scan_session)
     
-    # Start scan in background (Celery)
-    scan_website_task.delay(scan_session.id)
+    # Start scan in background (Celery); interactive scans are queued
+    # ahead of scheduled ones, small scans ahead of large ones
+    scan_website_task.apply_async(
+        kwargs={"scan_session_id": scan_session.id},
+        priority=scan_task_priority(scan_session.priority, website.preferences),
+    )
     
     return scan_session
 
@@ -105,6 +131,48 @@ async def delete_scan(
     return None
 
 
+@router.post("/{scan_id}/cancel", response_model=ScanSessionResponse)
+async def cancel_scan(
+    scan_id: int,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Cancel a pending or running scan.
+    
+    A running scan stops within SCAN_CANCEL_CHECK_INTERVAL seconds; pages
+    and errors found so far are kept.
+    """
+    result = await db.execute(
+        update(ScanSession)
+        .where(
+            ScanSession.id == scan_id,
+            ScanSession.status.in_([ScanStatus.PENDING, ScanStatus.RUNNING]),
+        )
+        .values(status=ScanStatus.CANCELLED, completed_at=datetime.utcnow())
+        .returning(ScanSession.id)
+    )
+    cancelled = result.scalar_one_or_none() is not None
+    await db.commit()
+    
+    result = await db.execute(
+        select(ScanSession).where(ScanSession.id == scan_id)
+    )
+    scan = result.scalar_one_or_none()
+    
+    if not scan:
+        raise HTTPException(status_code=404, detail="Scan session not found")
+    if not cancelled:
+        raise HTTPException(status_code=409, detail="Scan session is not pending or running")
+    
+    await scan_events.publish_status_async(scan.id, scan.status.value, {
+        "pages_found": scan.pages_found,
+        "pages_processed": scan.pages_processed,
+        "errors_found": scan.errors_found,
+    })
+    
+    return scan
+
+
 @router.get("/{scan_id}/status")
 async def get_scan_status(
     scan_id: int,
@@ -128,3 +196,39 @@ async def get_scan_status(
         "progress": (scan.pages_processed / scan.pages_found * 100) if scan.pages_found > 0 else 0,
     }
 
+
+
+@router.get("/{scan_id}/events")
+async def stream_scan_events(
+    scan_id: int,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Stream live progress of a scan as Server-Sent Events.
+    
+    The first event is the progress stored in the database; then the
+    progress and newly found errors published by the workers follow,
+    until the scan completes, fails or is cancelled. Without live events
+    (disabled or Redis unavailable) the stream ends after the first event.
+    """
+    result = await db.execute(
+        select(ScanSession).where(ScanSession.id == scan_id)
+    )
+    scan = result.scalar_one_or_none()
+    
+    if not scan:
+        raise HTTPException(status_code=404, detail="Scan session not found")
+    
+    progress = {
+        "status": scan.status.value,
+        "pages_found": scan.pages_found,
+        "pages_processed": scan.pages_processed,
+        "errors_found": scan.errors_found,
+        "error_message": scan.error_message,
+    }
+    
+    return StreamingResponse(
+        scan_events.stream(scan.id, progress),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
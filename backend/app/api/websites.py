@@ -2,11 +2,13 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from typing import List
+from datetime import datetime
 from urllib.parse import urlparse
 
 from app.core.database import get_db
 from app.models import Website
 from app.schemas.website import WebsiteCreate, WebsiteUpdate, WebsiteResponse
+from app.services.scan_scheduler import next_scan_time
 
 router = APIRouter()
 
@@ -36,9 +38,16 @@ async def create_website(
         domain=domain,
         name=website_in.name or domain,
         preferences=website_in.preferences,
+        scan_interval_hours=website_in.scan_interval_hours,
     )
     
     db.add(website)
+    await db.flush()
+    
+    # Schedule the first recurring scan (needs the id)
+    if website.scan_interval_hours:
+        website.next_scan_at = next_scan_time(website.id, website.scan_interval_hours, datetime.utcnow())
+    
     await db.commit()
     await db.refresh(website)
     
@@ -96,6 +105,16 @@ async def update_website(
         website.name = website_in.name
     if website_in.preferences is not None:
         website.preferences = website_in.preferences
+    # Set to null to stop the recurring scans
+    if (
+        "scan_interval_hours" in website_in.model_fields_set
+        and website_in.scan_interval_hours != website.scan_interval_hours
+    ):
+        website.scan_interval_hours = website_in.scan_interval_hours
+        website.next_scan_at = (
+            next_scan_time(website.id, website.scan_interval_hours, datetime.utcnow())
+            if website.scan_interval_hours else None
+        )
     
     await db.commit()
     await db.refresh(website)
@@ -1,5 +1,9 @@
+import os
+
 from celery import Celery
+from celery.signals import worker_process_init, worker_process_shutdown, worker_ready
 from app.core.config import settings
+from app.services.language_tool import language_tool_manager, language_tool_managers
 
 celery_app = Celery(
     "site_checker",
@@ -16,8 +20,64 @@ celery_app.conf.update(
     task_track_started=True,
     task_time_limit=30 * 60,  # 30 minutes
     task_soft_time_limit=25 * 60,  # 25 minutes
+    # Spell checks run on their own workers so scans never wait for a
+    # worker slot held by another scan
+    task_routes={
+        "check_spelling_batch": {"queue": "spellcheck"},
+    },
+    # Task priorities 0 (first) to 9 (last), see SCAN_FAIR_SHARE_PAGES.
+    # Workers take one task at a time, so a task queued with a higher
+    # priority is not stuck behind tasks prefetched earlier.
+    broker_transport_options={
+        "priority_steps": list(range(10)),
+        "sep": ":",
+        "queue_order_strategy": "priority",
+    },
+    task_default_priority=0,
+    worker_prefetch_multiplier=1,
 )
 
-# Import tasks to register them
-from app.tasks import scan_website  # noqa: F401, E402
+# Recurring scans (celery beat)
+if settings.SCAN_SCHEDULER_ENABLED:
+    celery_app.conf.beat_schedule = {
+        "schedule-scans": {
+            "task": "schedule_scans",
+            "schedule": settings.SCAN_SCHEDULER_INTERVAL,
+        },
+    }
+
+
+@worker_process_init.connect
+def start_language_tool(**kwargs):
+    """Start one LanguageTool per worker process, shared by all scans."""
+    if not settings.LANGUAGETOOL_URL:
+        language_tool_manager.start()
+
+
+@worker_process_shutdown.connect
+def stop_language_tool(**kwargs):
+    """Stop the worker's LanguageTool servers."""
+    for manager in language_tool_managers.values():
+        manager.close()
+
+
+@worker_ready.connect
+def check_data_files(**kwargs):
+    """
+    Warn once per worker about missing data files: they are not part of
+    the repository or the image, and without them the checks using them
+    are skipped (see "Data files" in the README).
+    """
+    data_files = [
+        (settings.SPELL_PREFILTER_ENABLED, settings.SPELL_WORDLIST_PATH, "spell pre-filter", "make wordlist"),
+        (settings.GAZETTEER_ENABLED, settings.GAZETTEER_PATH, "address place name checks", "make gazetteer"),
+    ]
+    for enabled, path, feature, command in data_files:
+        if enabled and not os.path.exists(path):
+            print(f"⚠️ {path} not found: {feature} disabled (build it with `{command}`)")
+
+
+# Import tasks to register them (the package imports every task module,
+# in dependency order)
+import app.tasks  # noqa: F401, E402
 
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 from pydantic_settings import BaseSettings
 from pydantic import AnyHttpUrl, field_validator
 
@@ -12,6 +12,44 @@ class Settings(BaseSettings):
     # Database
     DATABASE_URL: str
     DATABASE_URL_SYNC: str
+    DATABASE_ECHO: bool = False  # log SQL statements of the Celery workers
+    # Pages per write transaction of a scan
+    SCAN_WRITE_BATCH_PAGES: int = 20
+    # Check the pages of a scan in parallel check_pages tasks across the
+    # workers instead of in the scan task
+    SCAN_FANOUT_ENABLED: bool = False
+    SCAN_FANOUT_BATCH_PAGES: int = 20  # pages per check_pages task
+    # Live scan progress pushed to the UI (Redis pub/sub, Server-Sent Events)
+    SCAN_EVENTS_ENABLED: bool = True
+    SCAN_EVENTS_INTERVAL: float = 1.0  # seconds between progress events of a scan
+    SCAN_EVENTS_MAX_ERRORS: int = 20  # findings per page in an event
+    SCAN_EVENTS_KEEPALIVE: int = 15  # seconds between keep-alive comments
+    SCAN_EVENTS_TTL: int = 3600  # seconds the latest progress is kept in Redis
+    # Seconds between checks of a running scan for cancellation
+    SCAN_CANCEL_CHECK_INTERVAL: float = 2.0
+    # Scan scheduling: Celery task priorities 0 (first) to 9 (last). Scheduled
+    # scans start SCAN_SCHEDULED_PRIORITY_OFFSET levels below interactive
+    # ones; in fan-out mode each check_pages batch of a scan drops one more
+    # level for every SCAN_FAIR_SHARE_PAGES pages before it (times the
+    # website's scan_weight), so large scans interleave with small ones.
+    # Without fan-out a scan is one task, which drops a level for every
+    # SCAN_FAIR_SHARE_PAGES pages of its max_pages: small scans start first
+    SCAN_SCHEDULED_PRIORITY_OFFSET: int = 3
+    SCAN_FAIR_SHARE_PAGES: int = 200
+    # Creating a scan of a website returns its pending or running scan with
+    # the same preferences instead (unless forced); the check is guarded by
+    # a Redis lock per website, held for at most SCAN_CREATE_LOCK_TIMEOUT s.
+    # Scans created or started more than SCAN_COALESCE_MAX_AGE seconds ago
+    # (the Celery task time limit) are considered stuck and not returned
+    SCAN_COALESCE_ENABLED: bool = True
+    SCAN_CREATE_LOCK_TIMEOUT: int = 10
+    SCAN_COALESCE_MAX_AGE: int = 30 * 60
+    # Recurring scans started by Celery beat every SCAN_SCHEDULER_INTERVAL
+    # seconds, while fewer than SCAN_SCHEDULER_MAX_ACTIVE scans are pending
+    # or running
+    SCAN_SCHEDULER_ENABLED: bool = True
+    SCAN_SCHEDULER_INTERVAL: int = 60
+    SCAN_SCHEDULER_MAX_ACTIVE: int = 8
     
     # Redis
     REDIS_URL: str
@@ -40,6 +78,81 @@ class Settings(BaseSettings):
     
     # LanguageTool
     LANGUAGETOOL_ENABLED: bool = True
+    LANGUAGETOOL_HEALTH_CHECK_INTERVAL: int = 60  # seconds
+    # URL of a LanguageTool HTTP server (e.g. http://languagetool:8010).
+    # When set, spell checking uses the server instead of an in-process JVM.
+    LANGUAGETOOL_URL: Optional[str] = None
+    LANGUAGETOOL_MAX_CONCURRENCY: int = 8  # requests in flight per scan
+    LANGUAGETOOL_MAX_RETRIES: int = 3
+    LANGUAGETOOL_TIMEOUT: int = 30
+    # Sentences are packed into requests of about this many characters;
+    # longer sentences are split at word boundaries at the maximum length
+    LANGUAGETOOL_CHUNK_SIZE: int = 5000
+    LANGUAGETOOL_MAX_CHUNK_LENGTH: int = 20000
+    # Part of spell-check cache keys: bump when upgrading LanguageTool
+    LANGUAGETOOL_VERSION: str = "6.4"
+    
+    # Spell-check result cache (per sentence)
+    SPELL_CACHE_ENABLED: bool = True
+    SPELL_CACHE_REDIS_ENABLED: bool = True
+    SPELL_CACHE_SIZE: int = 100000  # sentences kept in process memory
+    SPELL_CACHE_TTL: int = 30 * 24 * 3600  # seconds in Redis
+    
+    # Host-level SEO probes (robots.txt, /favicon.ico), cached per origin
+    HOST_CACHE_REDIS_ENABLED: bool = True
+    HOST_CACHE_TTL: int = 24 * 3600  # seconds in Redis
+    
+    # Asset (image, script, stylesheet) checks: unique assets of a scan are
+    # probed concurrently; larger files are reported (sizes in bytes)
+    ASSET_CHECK_CONCURRENCY: int = 10
+    ASSET_MAX_IMAGE_SIZE: int = 500 * 1024
+    ASSET_MAX_SCRIPT_SIZE: int = 300 * 1024
+    ASSET_MAX_STYLESHEET_SIZE: int = 150 * 1024
+    
+    # Page performance checks, from the crawler's fetch of each page
+    PERF_SLOW_TTFB_MS: int = 800
+    PERF_SLOW_DOWNLOAD_MS: int = 3000
+    PERF_MAX_PAGE_SIZE: int = 500 * 1024  # bytes of HTML
+    PERF_MIN_COMPRESS_SIZE: int = 10 * 1024  # larger HTML should be compressed
+    
+    # Site-wide duplicate detection: pages whose text SimHashes differ in at
+    # most MAX_DISTANCE of 64 bits are near duplicates (0-63; the SimHashes
+    # are split into MAX_DISTANCE + 1 bands, so larger distances compare more
+    # pages). Pages with fewer than MIN_WORDS words of unique text are skipped
+    SEO_SIMHASH_MAX_DISTANCE: int = 3
+    SEO_SIMHASH_MIN_WORDS: int = 50
+    
+    # Dictionary pre-filter: only sentences with unknown words or suspicious
+    # patterns go to LanguageTool (built by scripts/build_wordlist.py)
+    SPELL_PREFILTER_ENABLED: bool = True
+    SPELL_WORDLIST_PATH: str = "data/uk_words.marisa"
+    
+    # Spell checking on the dedicated "spellcheck" Celery queue
+    SPELL_CHECK_QUEUE_ENABLED: bool = False  # False: check inline in the scan task
+    SPELL_BATCH_PAGES: int = 20  # pages per spell-check task
+    SPELL_MAX_IN_FLIGHT: int = 8  # batches queued or running per scan
+    SPELL_CHECK_TIMEOUT: int = 300  # seconds per batch
+    
+    # Language detection per text block: only Ukrainian blocks are sent to
+    # the uk-UA checker (and English blocks to the English one, if enabled)
+    LANGUAGE_DETECTION_ENABLED: bool = True
+    SPELL_CHECK_ENGLISH: bool = False
+    SPELL_ENGLISH_LANGUAGE: str = "en-US"
+    
+    # Gazetteer of settlements and streets for address validation
+    # (built by scripts/build_gazetteer.py)
+    GAZETTEER_ENABLED: bool = True
+    GAZETTEER_PATH: str = "data/uk_gazetteer.marisa"
+    
+    # Regex engine for the address and phone scanners: "re2" (linear time,
+    # needs google-re2) or "re"; falls back to "re" if RE2 is unavailable
+    REGEX_ENGINE: str = "re2"
+    
+    # Template (boilerplate) detection: blocks found on at least
+    # max(MIN_PAGES, MIN_RATIO * pages) pages are checked once per scan
+    BOILERPLATE_ENABLED: bool = True
+    BOILERPLATE_MIN_PAGES: int = 3
+    BOILERPLATE_MIN_RATIO: float = 0.3
     
     class Config:
         env_file = ".env"
@@ -21,10 +21,11 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
-# Sync engine for Celery
+# Sync engine for Celery (scans write many rows: statements are only
+# logged with DATABASE_ECHO)
 sync_engine = create_engine(
     settings.DATABASE_URL_SYNC,
-    echo=settings.DEBUG,
+    echo=settings.DATABASE_ECHO,
 )
 
 SyncSessionLocal = sessionmaker(
@@ -0,0 +1,53 @@
+from typing import Callable, Optional
+
+import redis
+import redis.asyncio as aioredis
+
+from app.core.config import settings
+
+
+class OptionalRedis:
+    """
+    Lazily created Redis clients of a feature that works without Redis
+    (caches, scan events, locks).
+    
+    Commands time out after TIMEOUT seconds, so an unavailable Redis does
+    not hold scans or requests up for long. The clients are None while the
+    feature is disabled or if they cannot be created; callers then skip
+    Redis, and log and carry on when a command fails. The sync client is
+    for workers (and threads of the scan's event loop); the asyncio client
+    is bound to the event loop that first uses it, so only the API uses it.
+    """
+    
+    TIMEOUT = 1  # seconds
+    
+    def __init__(self, name: str, enabled: Callable[[], bool] = lambda: True):
+        self.name = name
+        self.enabled = enabled
+        self._client = None
+        self._async_client = None
+    
+    def connect(self, client_class):
+        try:
+            return client_class.from_url(
+                settings.REDIS_URL,
+                socket_connect_timeout=self.TIMEOUT,
+                socket_timeout=self.TIMEOUT,
+            )
+        except Exception as e:
+            print(f"⚠️ {self.name} Redis connection failed: {e}")
+            return None
+    
+    @property
+    def client(self) -> Optional[redis.Redis]:
+        """Redis client (None if the feature is disabled or Redis is unavailable)."""
+        if self._client is None and self.enabled():
+            self._client = self.connect(redis.Redis)
+        return self._client
+    
+    @property
+    def async_client(self) -> Optional[aioredis.Redis]:
+        """Asyncio client of the API (None if the feature is disabled or Redis is unavailable)."""
+        if self._async_client is None and self.enabled():
+            self._async_client = self.connect(aioredis.Redis)
+        return self._async_client
@@ -8,6 +8,8 @@ from app.models.error import (
     BrokenLink,
     SEOIssue,
     PhoneError,
+    AssetError,
+    PerformanceIssue,
 )
 
 __all__ = [
@@ -20,5 +22,7 @@ __all__ = [
     "BrokenLink",
     "SEOIssue",
     "PhoneError",
+    "AssetError",
+    "PerformanceIssue",
 ]
 
@@ -11,6 +11,8 @@ class ErrorType(str, enum.Enum):
     BROKEN_LINK = "broken_link"
     SEO = "seo"
     PHONE = "phone"
+    ASSET = "asset"
+    PERFORMANCE = "performance"
 
 
 class ErrorSeverity(str, enum.Enum):
@@ -22,7 +24,7 @@ class ErrorSeverity(str, enum.Enum):
 
 class Error(Base):
     __tablename__ = "errors"
-
+    
     id = Column(Integer, primary_key=True, index=True)
     page_id = Column(Integer, ForeignKey("pages.id", ondelete="CASCADE"), nullable=False)
     
@@ -37,11 +39,16 @@ class Error(Base):
     # Location in page
     line_number = Column(Integer, nullable=True)
     column_number = Column(Integer, nullable=True)
+    element_path = Column(Text, nullable=True)  # DOM path of the text block
     
     # For links
     link_url = Column(String(1000), nullable=True)
     link_status_code = Column(Integer, nullable=True)
     
+    # For site-level findings in template blocks (menus, footers):
+    # number of pages the block appears on
+    page_count = Column(Integer, nullable=True)
+    
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # Relationships
@@ -91,3 +98,16 @@ class PhoneError(Error):
         "polymorphic_identity": ErrorType.PHONE,
     }
 
+
+class AssetError(Error):
+    """Broken, mistyped or oversized images, scripts and stylesheets."""
+    __mapper_args__ = {
+        "polymorphic_identity": ErrorType.ASSET,
+    }
+
+
+class PerformanceIssue(Error):
+    """Slow or heavy pages."""
+    __mapper_args__ = {
+        "polymorphic_identity": ErrorType.PERFORMANCE,
+    }
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Boolean, JSON
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -6,7 +6,7 @@ from app.core.database import Base
 
 class Page(Base):
     __tablename__ = "pages"
-
+    
     id = Column(Integer, primary_key=True, index=True)
     scan_session_id = Column(Integer, ForeignKey("scan_sessions.id", ondelete="CASCADE"), nullable=False)
     
@@ -23,6 +23,23 @@ class Page(Base):
     meta_keywords = Column(Text, nullable=True)
     has_favicon = Column(Boolean, default=False)
     
+    # Size of the page's text per detected language in bytes,
+    # e.g. {"uk": 10240, "en": 512, "other": 64}
+    language_bytes = Column(JSON, nullable=True)
+    
+    # Load performance of the crawler's fetch of the page
+    ttfb_ms = Column(Integer, nullable=True)  # time to first byte
+    download_ms = Column(Integer, nullable=True)  # total download time
+    transfer_size = Column(Integer, nullable=True)  # bytes transferred (compressed)
+    content_size = Column(Integer, nullable=True)  # bytes of HTML (uncompressed)
+    redirect_count = Column(Integer, nullable=True)
+    content_encoding = Column(String(50), nullable=True)
+    
+    # Inputs of the per-page checks of a fan-out scan (text blocks and html
+    # without template blocks, block languages, element locations), written
+    # by the crawl task and cleared once the page is checked
+    check_data = Column(JSON(none_as_null=True), nullable=True)
+    
     # Depth in site structure
     depth = Column(Integer, default=0)
     
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum as SQLEnum, Text
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum as SQLEnum, Text, JSON
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -10,21 +10,40 @@ class ScanStatus(str, enum.Enum):
     RUNNING = "running"
     COMPLETED = "completed"
     FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+class ScanPriority(str, enum.Enum):
+    INTERACTIVE = "interactive"  # started by a user, who waits for it
+    SCHEDULED = "scheduled"  # started automatically
 
 
 class ScanSession(Base):
     __tablename__ = "scan_sessions"
-
+    
     id = Column(Integer, primary_key=True, index=True)
     website_id = Column(Integer, ForeignKey("websites.id", ondelete="CASCADE"), nullable=False)
     
     status = Column(SQLEnum(ScanStatus), default=ScanStatus.PENDING, nullable=False, index=True)
+    priority = Column(
+        SQLEnum(ScanPriority),
+        default=ScanPriority.INTERACTIVE,
+        server_default=ScanPriority.INTERACTIVE.name,
+        nullable=False,
+    )
+    # SHA-256 of the website's preferences when the scan was created, to
+    # find duplicate scans (see ScanCoalescer)
+    preferences_hash = Column(String(64), nullable=True)
     
     # Statistics
     pages_found = Column(Integer, default=0)
     pages_processed = Column(Integer, default=0)
     errors_found = Column(Integer, default=0)
     
+    # Site-level percentiles of page load metrics,
+    # e.g. {"pages": 120, "ttfb_ms_p50": 180, "ttfb_ms_p95": 950, ...}
+    performance = Column(JSON, nullable=True)
+    
     # Error message if failed
     error_message = Column(Text, nullable=True)
     
@@ -6,7 +6,7 @@ from app.core.database import Base
 
 class Website(Base):
     __tablename__ = "websites"
-
+    
     id = Column(Integer, primary_key=True, index=True)
     url = Column(String(500), nullable=False, unique=True, index=True)
     domain = Column(String(255), nullable=False, index=True)
@@ -19,12 +19,21 @@ class Website(Base):
         "check_links": True,
         "check_phones": True,
         "check_seo": True,
+        "check_assets": True,
+        "check_performance": True,
         "max_pages": 100,
         "max_depth": 5,
         "exclude_paths": [],
         "whitelist_words": [],
+        "spell_full_check": False,
+        "scan_weight": 1,
     })
     
+    # Recurring scans: hours between scheduled scans (None: not scheduled)
+    # and when the next one is due (see scan_scheduler.next_scan_time())
+    scan_interval_hours = Column(Integer, nullable=True)
+    next_scan_at = Column(DateTime(timezone=True), nullable=True, index=True)
+    
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
@@ -12,8 +12,12 @@ class ErrorResponse(BaseModel):
     message: str
     context: Optional[str] = None
     suggestion: Optional[str] = None
+    line_number: Optional[int] = None
+    column_number: Optional[int] = None
+    element_path: Optional[str] = None
     link_url: Optional[str] = None
     link_status_code: Optional[int] = None
+    page_count: Optional[int] = None
     created_at: datetime
 
     class Config:
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional, List
+from typing import Optional, List, Dict
 from datetime import datetime
 
 
@@ -11,6 +11,13 @@ class PageResponse(BaseModel):
     status_code: Optional[int] = None
     meta_description: Optional[str] = None
     has_favicon: bool = False
+    language_bytes: Optional[Dict[str, int]] = None
+    ttfb_ms: Optional[int] = None
+    download_ms: Optional[int] = None
+    transfer_size: Optional[int] = None
+    content_size: Optional[int] = None
+    redirect_count: Optional[int] = None
+    content_encoding: Optional[str] = None
     depth: int
     scanned_at: datetime
     errors: List["ErrorResponse"] = []
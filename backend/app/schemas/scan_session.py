@@ -1,25 +1,30 @@
 from pydantic import BaseModel
-from typing import Optional, List
+from typing import Optional, List, Dict, Any
 from datetime import datetime
-from app.models.scan_session import ScanStatus
+from app.models.scan_session import ScanPriority, ScanStatus
 
 
 class ScanSessionCreate(BaseModel):
     website_id: int
+    priority: ScanPriority = ScanPriority.INTERACTIVE
+    # Start a new scan even if one with the same preferences is in progress
+    force: bool = False
 
 
 class ScanSessionResponse(BaseModel):
     id: int
     website_id: int
     status: ScanStatus
+    priority: ScanPriority
     pages_found: int
     pages_processed: int
     errors_found: int
+    performance: Optional[Dict[str, Any]] = None
     error_message: Optional[str] = None
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     created_at: datetime
-
+    
     class Config:
         from_attributes = True
 
@@ -27,7 +32,7 @@ class ScanSessionResponse(BaseModel):
 class ScanSessionDetail(ScanSessionResponse):
     """Extended response with pages and errors."""
     pages: List["PageResponse"] = []
-
+    
     class Config:
         from_attributes = True
 
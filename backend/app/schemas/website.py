@@ -12,11 +12,17 @@ class WebsiteBase(BaseModel):
         "check_links": True,
         "check_phones": True,
         "check_seo": True,
+        "check_assets": True,
+        "check_performance": True,
         "max_pages": 100,
         "max_depth": 5,
         "exclude_paths": [],
         "whitelist_words": [],
+        "spell_full_check": False,
+        "scan_weight": 1,
     })
+    # Hours between scheduled scans (None: not scheduled)
+    scan_interval_hours: Optional[int] = Field(default=None, ge=1)
 
 
 class WebsiteCreate(WebsiteBase):
@@ -26,6 +32,7 @@ class WebsiteCreate(WebsiteBase):
 class WebsiteUpdate(BaseModel):
     name: Optional[str] = None
     preferences: Optional[Dict[str, Any]] = None
+    scan_interval_hours: Optional[int] = Field(default=None, ge=1)
 
 
 class WebsiteResponse(WebsiteBase):
@@ -33,7 +40,8 @@ class WebsiteResponse(WebsiteBase):
     domain: str
     created_at: datetime
     updated_at: Optional[datetime] = None
-
+    next_scan_at: Optional[datetime] = None
+    
     class Config:
         from_attributes = True
 
@@ -3,6 +3,7 @@ from app.services.spell_checker import SpellCheckerService
 from app.services.address_validator import AddressValidatorService
 from app.services.link_checker import LinkCheckerService
 from app.services.seo_checker import SEOCheckerService
+from app.services.asset_checker import AssetCheckerService
 
 __all__ = [
     "CrawlerService",
@@ -10,5 +11,6 @@ __all__ = [
     "AddressValidatorService",
     "LinkCheckerService",
     "SEOCheckerService",
+    "AssetCheckerService",
 ]
 
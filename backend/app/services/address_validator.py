@@ -1,65 +1,197 @@
 import re
-from typing import List, Dict, Optional
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
+
+from app.services.gazetteer import gazetteer
+from app.services.regex_engine import compile_pattern, normalize_spaces
 
 
 class AddressValidatorService:
     """Service for validating Ukrainian address formats."""
     
+    # Street name: capitalized word, optionally followed by more words of
+    # either case ("Тараса Шевченка", "Лесі Українки", "Січових Стрільців").
+    # Words are separated by whitespace explicitly (no whitespace inside the
+    # repeated character class), so the end of the name is unambiguous.
+    # All patterns are RE2-compatible (see regex_engine).
+    STREET_NAME = r"[А-ЯІЇЄҐ][а-яіїєґ'\-]+(?:\s+[А-ЯІЇЄҐа-яіїєґ'\-]+)*"
+    
     # Correct address patterns
     CORRECT_PATTERNS = [
         # м. [місто], вул. [вулиця], [номер]
-        r'м\.\s+[А-ЯІЇЄҐ][а-яіїєґ\'\-]+,\s+вул\.\s+[А-ЯІЇЄҐ][а-яіїєґ\'\-\s]+,\s+\d+',
+        r"м\.\s+[А-ЯІЇЄҐ][а-яіїєґ'\-]+,\s+вул\.\s+" + STREET_NAME + r",\s+\d+",
         # м. [місто], пров. [провулок], [номер]
-        r'м\.\s+[А-ЯІЇЄҐ][а-яіїєґ\'\-]+,\s+пров\.\s+[А-ЯІЇЄҐ][а-яіїєґ\'\-\s]+,\s+\d+',
+        r"м\.\s+[А-ЯІЇЄҐ][а-яіїєґ'\-]+,\s+пров\.\s+" + STREET_NAME + r",\s+\d+",
         # м. [місто], проспект [назва], [номер]
-        r'м\.\s+[А-ЯІЇЄҐ][а-яіїєґ\'\-]+,\s+проспект\s+[А-ЯІЇЄҐ][а-яіїєґ\'\-\s]+,\s+\d+',
+        r"м\.\s+[А-ЯІЇЄҐ][а-яіїєґ'\-]+,\s+проспект\s+" + STREET_NAME + r",\s+\d+",
         # м. [місто], бульвар [назва], [номер]
-        r'м\.\s+[А-ЯІЇЄҐ][а-яіїєґ\'\-]+,\s+бульвар\s+[А-ЯІЇЄҐ][а-яіїєґ\'\-\s]+,\s+\d+',
+        r"м\.\s+[А-ЯІЇЄҐ][а-яіїєґ'\-]+,\s+бульвар\s+" + STREET_NAME + r",\s+\d+",
         # With building/apartment: м. [місто], вул. [вулиця], [номер], кв. [номер]
-        r'м\.\s+[А-ЯІЇЄҐ][а-яіїєґ\'\-]+,\s+вул\.\s+[А-ЯІЇЄҐ][а-яіїєґ\'\-\s]+,\s+\d+,\s+кв\.\s+\d+',
+        r"м\.\s+[А-ЯІЇЄҐ][а-яіїєґ'\-]+,\s+вул\.\s+" + STREET_NAME + r",\s+\d+,\s+кв\.\s+\d+",
     ]
     
     # Patterns to detect potential addresses (even incorrectly formatted)
     DETECTION_PATTERNS = [
         # Any text that looks like it might be an address
-        r'[мМ]\.?\s*[А-ЯІЇЄҐ][а-яіїєґ\'\-]+[\s,]+(?:вул|пров|проспект|бульвар)\.?\s*[А-ЯІЇЄҐ][а-яіїєґ\'\-\s]+[\s,]+\d+',
-        r'(?:місто|м)[\s\.]*[А-ЯІЇЄҐ][а-яіїєґ\'\-]+',
-        r'(?:вулиця|вул)[\s\.]*[А-ЯІЇЄҐ][а-яіїєґ\'\-\s]+[\s,]+\d+',
+        r"[мМ]\.?\s*[А-ЯІЇЄҐ][а-яіїєґ'\-]+[\s,]+(?:вул|пров|проспект|бульвар)\.?\s*" + STREET_NAME + r"[\s,]+\d+",
+        r"(?:місто|м)[\s\.]*[А-ЯІЇЄҐ][а-яіїєґ'\-]+",
+        r"(?:вулиця|вул)[\s\.]*" + STREET_NAME + r"[\s,]+\d+",
     ]
     
-    def __init__(self):
-        self.correct_compiled = [re.compile(p, re.UNICODE) for p in self.CORRECT_PATTERNS]
-        self.detection_compiled = [re.compile(p, re.UNICODE) for p in self.DETECTION_PATTERNS]
+    # Checks explaining what is wrong with an address
+    MISSING_CITY_ABBREVIATION = r'(?:^|[^м])(?:місто|М[А-ЯІЇЄҐ])'
+    FULL_STREET_TYPE = r'(?:вулиця|провулок)\s+[А-ЯІЇЄҐ]'
+    MISSING_SPACE = r'[мвп]\.[А-ЯІЇЄҐ]'
+    
+    # City and street names, checked against the gazetteer
+    CITY_NAME = r"(?:м\.|місто)\s*([А-ЯІЇЄҐ][а-яіїєґ'\-]+)"
+    STREET = r"(?:вул\.|вулиця|пров\.|провулок|проспект|бульвар)\s*(" + STREET_NAME + r")"
+    
+    # Text allowed between two detected parts of one address
+    # (e.g. the city and the street)
+    PART_GAP = re.compile(r'[\s,.]*')
+    
+    def __init__(self, cache_size: int = 1024):
+        # All detection patterns in one alternation (longest first), so the
+        # text is scanned once; correct formats in one union for fullmatch
+        self.detection_compiled = compile_pattern(
+            '|'.join(f'(?:{p})' for p in self.DETECTION_PATTERNS)
+        )
+        self.correct_compiled = compile_pattern(
+            '|'.join(f'(?:{p})' for p in self.CORRECT_PATTERNS)
+        )
+        self.missing_city_abbreviation = compile_pattern(self.MISSING_CITY_ABBREVIATION)
+        self.full_street_type = compile_pattern(self.FULL_STREET_TYPE)
+        self.missing_space = compile_pattern(self.MISSING_SPACE)
+        self.city_name = compile_pattern(self.CITY_NAME)
+        self.street_name = compile_pattern(self.STREET)
+        # Validation results per normalized address: footers and contact
+        # blocks repeat the same address on every page
+        self.check_address = lru_cache(maxsize=cache_size)(self._check_address)
+    
+    @staticmethod
+    def normalize(address: str) -> str:
+        """Collapse whitespace in an address."""
+        return re.sub(r'\s+', ' ', address).strip()
     
     def is_correct_format(self, address: str) -> bool:
         """Check if address matches correct format."""
-        address = address.strip()
-        return any(pattern.fullmatch(address) for pattern in self.correct_compiled)
+        return self.correct_compiled.fullmatch(self.normalize(address)) is not None
     
     def find_addresses(self, text: str) -> List[Dict]:
-        """Find all potential addresses in text."""
-        found_addresses = []
+        """
+        Find all potential addresses in text.
         
-        for pattern in self.detection_compiled:
-            matches = pattern.finditer(text)
-            for match in matches:
-                address_text = match.group(0)
-                start_pos = match.start()
-                end_pos = match.end()
-                
-                # Get context (100 chars before and after)
-                context_start = max(0, start_pos - 100)
-                context_end = min(len(text), end_pos + 100)
-                context = text[context_start:context_end]
-                
-                found_addresses.append({
-                    'address': address_text,
-                    'context': context,
-                    'position': start_pos,
-                })
+        The text is scanned once with all detection patterns; parts of one
+        address matched separately (e.g. "м.Київ" and "вулиця Хрещатик 1")
+        are merged into a single candidate.
+        """
+        text = normalize_spaces(text)
+        spans = []
+        for match in self.detection_compiled.finditer(text):
+            start_pos, end_pos = match.start(), match.end()
+            if spans and self.PART_GAP.fullmatch(text, spans[-1][1], start_pos):
+                spans[-1][1] = max(spans[-1][1], end_pos)
+            else:
+                spans.append([start_pos, end_pos])
+        
+        found_addresses = []
+        for start_pos, end_pos in spans:
+            # Get context (100 chars before and after)
+            context_start = max(0, start_pos - 100)
+            context_end = min(len(text), end_pos + 100)
+            context = text[context_start:context_end]
+            
+            found_addresses.append({
+                'address': text[start_pos:end_pos],
+                'context': context,
+                'position': start_pos,
+            })
         
         return found_addresses
     
+    def check_place_names(self, address: str) -> Tuple[List[str], str]:
+        """
+        Check city and street names against the gazetteer.
+        
+        Only names with a known name at edit distance 1 are reported
+        (the gazetteer does not list every village or street).
+        
+        Returns the issues found and the address with names corrected.
+        """
+        if not gazetteer.enabled:
+            return [], address
+        
+        issues = []
+        corrected = address
+        checks = [
+            (gazetteer.SETTLEMENT, self.city_name, 'Невідома назва населеного пункту'),
+            (gazetteer.STREET, self.street_name, 'Невідома назва вулиці'),
+        ]
+        
+        for kind, pattern, label in checks:
+            match = pattern.search(address)
+            if not match:
+                continue
+            name = match.group(1)
+            suggestions = gazetteer.suggest(kind, name)
+            if suggestions:
+                issues.append(f'{label} "{name}", можливо, "{suggestions[0]}"')
+                corrected = corrected.replace(name, suggestions[0], 1)
+        
+        return issues, corrected
+    
+    def _check_address(self, address: str) -> Optional[Dict]:
+        """
+        Validate a normalized address.
+        
+        Returns None if the address is correct, otherwise dict with the
+        issues found, the suggested correction and the error message.
+        """
+        if self.correct_compiled.fullmatch(address):
+            name_issues, corrected = self.check_place_names(address)
+            if not name_issues:
+                return None
+            return {
+                'issues': name_issues,
+                'suggestion': corrected,
+                'message': f"Можлива помилка в адресі. {' '.join(name_issues)}",
+            }
+        
+        # Determine what's wrong
+        issues = []
+        
+        # Check for missing "м."
+        if self.missing_city_abbreviation.search(address):
+            issues.append('Відсутнє скорочення "м." перед назвою міста')
+        
+        # Check for missing "вул.", "пров." etc.
+        if self.full_street_type.search(address):
+            issues.append('Використовуйте скорочення "вул." або "пров." замість повної назви')
+        
+        # Check for missing comma
+        if ',' not in address:
+            issues.append('Відсутні коми між частинами адреси')
+        
+        # Check for missing spaces after abbreviations
+        if self.missing_space.search(address):
+            issues.append('Відсутній пробіл після скорочення')
+        
+        message = f"Неправильний формат адреси. {' '.join(issues) if issues else 'Використовуйте формат: м. Місто, вул. Назва, 123'}"
+        
+        suggestion = self.suggest_correction(address)
+        name_issues, corrected = self.check_place_names(suggestion or address)
+        if name_issues:
+            issues.extend(name_issues)
+            message = f"{message} {' '.join(name_issues)}"
+            suggestion = corrected
+        
+        return {
+            'issues': issues,
+            'suggestion': suggestion,
+            'message': message,
+        }
+    
     def validate_text(self, text: str) -> List[Dict]:
         """
         Find and validate addresses in text.
@@ -71,37 +203,19 @@ class AddressValidatorService:
         
         for addr_data in addresses:
             address = addr_data['address']
+            result = self.check_address(self.normalize(address))
+            if result is None:
+                continue
             
-            if not self.is_correct_format(address):
-                # Determine what's wrong
-                issues = []
-                
-                # Check for missing "м."
-                if re.search(r'(?:^|[^м])(?:місто|М[А-ЯІЇЄҐ])', address):
-                    issues.append('Відсутнє скорочення "м." перед назвою міста')
-                
-                # Check for missing "вул.", "пров." etc.
-                if re.search(r'(?:вулиця|провулок)\s+[А-ЯІЇЄҐ]', address):
-                    issues.append('Використовуйте скорочення "вул." або "пров." замість повної назви')
-                
-                # Check for missing comma
-                if ',' not in address:
-                    issues.append('Відсутні коми між частинами адреси')
-                
-                # Check for missing spaces after abbreviations
-                if re.search(r'[мвп]\.[А-ЯІЇЄҐ]', address):
-                    issues.append('Відсутній пробіл після скорочення')
-                
-                suggestion = self.suggest_correction(address)
-                
-                error = {
-                    'address': address,
-                    'context': addr_data['context'],
-                    'issues': issues,
-                    'suggestion': suggestion,
-                    'message': f"Неправильний формат адреси. {' '.join(issues) if issues else 'Використовуйте формат: м. Місто, вул. Назва, 123'}",
-                }
-                errors.append(error)
+            error = {
+                'address': address,
+                'context': addr_data['context'],
+                'position': addr_data['position'],
+                'issues': list(result['issues']),
+                'suggestion': result['suggestion'],
+                'message': result['message'],
+            }
+            errors.append(error)
         
         return errors
     
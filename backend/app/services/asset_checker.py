@@ -0,0 +1,161 @@
+import asyncio
+import httpx
+from typing import Dict, List, Optional
+from bs4 import BeautifulSoup
+from urllib.parse import urljoin, urlparse
+from app.core.config import settings
+from app.services.link_checker import LinkCheckerService
+
+
+class AssetCheckerService:
+    """
+    Service for checking images, scripts and stylesheets of pages.
+    
+    Assets are collected from every page by the crawler and deduplicated
+    across the scan (a site's logo, CSS and JS are on nearly every page),
+    then probed concurrently through the link checker, whose cache they
+    share with links.
+    """
+    
+    IMAGE = 'image'
+    SCRIPT = 'script'
+    STYLESHEET = 'stylesheet'
+    
+    # Asset kind -> expected Content-Type prefixes
+    CONTENT_TYPES = {
+        IMAGE: ('image/',),
+        SCRIPT: ('application/javascript', 'text/javascript', 'application/x-javascript', 'application/ecmascript'),
+        STYLESHEET: ('text/css',),
+    }
+    
+    KIND_NAMES = {
+        IMAGE: 'зображення',
+        SCRIPT: 'скрипт',
+        STYLESHEET: 'стилі CSS',
+    }
+    
+    def __init__(self, link_checker: Optional[LinkCheckerService] = None):
+        self.timeout = settings.REQUEST_TIMEOUT
+        self.link_checker = link_checker or LinkCheckerService()
+        self.max_sizes = {
+            self.IMAGE: settings.ASSET_MAX_IMAGE_SIZE,
+            self.SCRIPT: settings.ASSET_MAX_SCRIPT_SIZE,
+            self.STYLESHEET: settings.ASSET_MAX_STYLESHEET_SIZE,
+        }
+    
+    @classmethod
+    def extract_assets(cls, soup: BeautifulSoup, base_url: str) -> List[Dict]:
+        """
+        Collect the images, scripts and stylesheets of a page.
+        
+        Must run before scripts are removed from the soup. Returns list of
+        dicts with url (absolute), kind, tag and href (as written in the
+        page), one per asset URL.
+        """
+        found = []
+        for tag in soup.find_all(['img', 'script', 'link']):
+            if tag.name == 'img':
+                kind, href = cls.IMAGE, tag.get('src')
+            elif tag.name == 'script':
+                kind, href = cls.SCRIPT, tag.get('src')
+            else:
+                rel = tag.get('rel') or []
+                if isinstance(rel, str):
+                    rel = rel.split()
+                if 'stylesheet' not in [r.lower() for r in rel]:
+                    continue
+                kind, href = cls.STYLESHEET, tag.get('href')
+            
+            href = (href or '').strip()
+            if not href or href.startswith('data:'):
+                continue
+            url = urljoin(base_url, href)
+            if urlparse(url).scheme not in ('http', 'https'):
+                continue
+            found.append({'url': url, 'kind': kind, 'tag': tag.name, 'href': href})
+        
+        unique = {}
+        for asset in found:
+            unique.setdefault(asset['url'], asset)
+        return list(unique.values())
+    
+    async def probe_assets(self, urls: List[str]) -> Dict[str, Dict]:
+        """
+        Probe assets concurrently through one client (the link checker's,
+        if it has one).
+        
+        Returns dict url -> LinkCheckerService.check_link() result.
+        """
+        semaphore = asyncio.Semaphore(settings.ASSET_CHECK_CONCURRENCY)
+        
+        async def probe(client, url):
+            async with semaphore:
+                return await self.link_checker.check_link(url, client=client)
+        
+        if self.link_checker.client is not None:
+            results = await asyncio.gather(*(probe(self.link_checker.client, url) for url in urls))
+        else:
+            async with httpx.AsyncClient(timeout=self.timeout, follow_redirects=True) as client:
+                results = await asyncio.gather(*(probe(client, url) for url in urls))
+        
+        return dict(zip(urls, results))
+    
+    @staticmethod
+    def format_size(size: int) -> str:
+        return f"{size // 1024} КБ" if size >= 1024 else f"{size} Б"
+    
+    def check_asset(self, asset: Dict, result: Dict) -> List[Dict]:
+        """Issues of a probed asset: broken, wrong content type, oversized."""
+        kind = asset['kind']
+        name = self.KIND_NAMES[kind]
+        
+        if result['is_broken']:
+            status = result['status_code']
+            return [{
+                'message': f"Недоступний файл ({name}): {asset['url']} (HTTP {status})"
+                           if status else f"Недоступний файл ({name}): {asset['url']} ({result['error']})",
+                'suggestion': 'Виправте адресу ресурсу або видаліть посилання на нього',
+                'severity': 'error',
+            }]
+        
+        issues = []
+        content_type = result.get('content_type')
+        if content_type and not content_type.startswith(self.CONTENT_TYPES[kind]):
+            issues.append({
+                'message': f"Неочікуваний тип вмісту файлу ({name}): {content_type}",
+                'suggestion': f"Перевірте адресу {asset['url']} та заголовок Content-Type на сервері",
+                'severity': 'error',
+            })
+        
+        size = result.get('size')
+        if size and size > self.max_sizes[kind]:
+            issues.append({
+                'message': f"Завеликий файл ({name}): {self.format_size(size)}",
+                'suggestion': f"Рекомендований розмір до {self.format_size(self.max_sizes[kind])}: "
+                              "стисніть файл або використайте сучасний формат",
+                'severity': 'warning',
+            })
+        
+        return issues
+    
+    async def check_assets(self, assets: List[Dict]) -> Dict[str, List[Dict]]:
+        """
+        Probe unique assets and check them.
+        
+        Returns dict url -> issues (only assets with issues), each issue
+        with message, suggestion, severity, status_code, content_type and
+        size.
+        """
+        results = await self.probe_assets([asset['url'] for asset in assets])
+        
+        issues = {}
+        for asset in assets:
+            result = results[asset['url']]
+            asset_issues = self.check_asset(asset, result)
+            for issue in asset_issues:
+                issue['status_code'] = result['status_code']
+                issue['content_type'] = result.get('content_type')
+                issue['size'] = result.get('size')
+            if asset_issues:
+                issues[asset['url']] = asset_issues
+        return issues
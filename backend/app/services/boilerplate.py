@@ -0,0 +1,122 @@
+import hashlib
+import re
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from bs4 import BeautifulSoup, NavigableString
+
+from app.core.config import settings
+from app.services.text_extractor import TextExtractor
+
+
+class BoilerplateDetector:
+    """
+    Detects text blocks repeated across pages of a site.
+    
+    Every page of a site usually repeats the same navigation, header, footer
+    and sidebar. The detector fingerprints the text blocks of each page as
+    pages come in; blocks found on many pages are template blocks, which are
+    checked once per scan and reported as site-level findings, while per-page
+    checks only run on the page's unique content.
+    """
+    
+    def __init__(self, min_pages: Optional[int] = None, min_ratio: Optional[float] = None):
+        self.min_pages = min_pages or settings.BOILERPLATE_MIN_PAGES
+        self.min_ratio = settings.BOILERPLATE_MIN_RATIO if min_ratio is None else min_ratio
+        self.pages_seen = 0
+        # fingerprint -> number of pages containing the block
+        self.block_pages: Dict[str, int] = defaultdict(int)
+        # fingerprint -> key of the first page containing the block
+        self.first_page: Dict[str, int] = {}
+        self.extractor = TextExtractor()
+    
+    @staticmethod
+    def fingerprint(text: str) -> str:
+        """Fingerprint of a block's normalized text."""
+        normalized = re.sub(r'\s+', ' ', text).strip()
+        return hashlib.sha1(normalized.encode('utf-8')).hexdigest()[:16]
+    
+    def add_page(self, page_key: int, blocks: Optional[List[Dict]]) -> None:
+        """Register the text blocks of a page (as extracted by the crawler)."""
+        self.pages_seen += 1
+        if not blocks:
+            return
+        
+        fingerprints = {self.fingerprint(block['text']) for block in blocks}
+        for fingerprint in fingerprints:
+            self.block_pages[fingerprint] += 1
+            self.first_page.setdefault(fingerprint, page_key)
+    
+    @property
+    def threshold(self) -> int:
+        """Number of pages a block must appear on to count as template."""
+        return max(self.min_pages, int(self.pages_seen * self.min_ratio))
+    
+    def is_shared(self, fingerprint: str) -> bool:
+        """Check if a block is repeated on enough pages to be template."""
+        return self.block_pages.get(fingerprint, 0) >= self.threshold
+    
+    def split_page(self, html_content: Optional[str], blocks: Optional[List[Dict]]) -> Dict:
+        """
+        Split a page into unique content and template blocks.
+        
+        Returns dict with:
+            text: Text of the page without template blocks, one block per line
+            blocks: Text blocks of the page without template blocks
+            html: HTML of the page without template blocks
+            shared_blocks: Template blocks of the page (text block fields
+                plus fingerprint, html and page_count)
+        """
+        blocks = blocks or []
+        unique_blocks = []
+        shared_blocks = {}
+        
+        for block in blocks:
+            fingerprint = self.fingerprint(block['text'])
+            if self.is_shared(fingerprint):
+                shared_blocks.setdefault(fingerprint, {
+                    **block,
+                    'fingerprint': fingerprint,
+                    'html': None,
+                    'page_count': self.block_pages[fingerprint],
+                })
+            else:
+                unique_blocks.append(block)
+        
+        result = {
+            'text': '\n'.join(block['text'] for block in unique_blocks),
+            'blocks': unique_blocks,
+            'html': html_content,
+            'shared_blocks': list(shared_blocks.values()),
+        }
+        if not html_content or not shared_blocks:
+            return result
+        
+        # Remove template blocks from the HTML too, for the HTML-based checks
+        soup = BeautifulSoup(html_content, 'lxml')
+        for block, strings in self.extractor.iter_blocks(soup):
+            fingerprint = self.fingerprint(self.extractor.block_text(strings))
+            if fingerprint not in shared_blocks:
+                continue
+            if shared_blocks[fingerprint]['html'] is None:
+                shared_blocks[fingerprint]['html'] = str(block)
+            
+            # Remove the block from the page: the whole element if it has no
+            # nested blocks, otherwise only its own text and inline elements
+            block_tags = list(self.extractor.BLOCK_TAGS)
+            if block.name != 'body' and not block.find(block_tags):
+                block.decompose()
+                continue
+            for string in strings:
+                top = string
+                while top.parent is not None and top.parent is not block:
+                    top = top.parent
+                if top.parent is None:
+                    continue  # already removed with another inline element
+                if isinstance(top, NavigableString) or top.find(block_tags):
+                    string.extract()
+                else:
+                    top.decompose()
+        
+        result['html'] = str(soup)
+        return result
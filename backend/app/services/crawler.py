@@ -3,20 +3,33 @@ from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
 from typing import Set, List, Dict, Optional
 import asyncio
+import time
 from app.core.config import settings
+from app.services.asset_checker import AssetCheckerService
+from app.services.source_index import SourceIndex
+from app.services.text_extractor import TextExtractor
 
 
 class CrawlerService:
     """Service for crawling websites and extracting content."""
     
-    def __init__(self, base_url: str, max_pages: int = None, max_depth: int = None):
+    def __init__(
+        self,
+        base_url: str,
+        max_pages: int = None,
+        max_depth: int = None,
+        client: Optional[httpx.AsyncClient] = None,
+    ):
         self.base_url = base_url.rstrip('/')
         self.domain = urlparse(base_url).netloc
         self.max_pages = max_pages or settings.MAX_PAGES_PER_SCAN
         self.max_depth = max_depth or settings.MAX_DEPTH
         self.visited_urls: Set[str] = set()
         self.pages_data: List[Dict] = []
-        
+        self.text_extractor = TextExtractor()
+        # Shared client of the scan (a client per request if None)
+        self.client = client
+    
     def normalize_url(self, url: str) -> str:
         """Normalize URL by removing fragments and trailing slashes."""
         parsed = urlparse(url)
@@ -34,77 +47,26 @@ class CrawlerService:
         # Skip non-http(s) protocols
         if parsed.scheme not in ['http', 'https']:
             return False
-            
+        
         # Skip common file extensions
         skip_extensions = ['.pdf', '.jpg', '.jpeg', '.png', '.gif', '.svg', 
                           '.zip', '.tar', '.gz', '.doc', '.docx', '.xls', 
                           '.xlsx', '.ppt', '.pptx', '.mp3', '.mp4', '.avi']
         if any(parsed.path.lower().endswith(ext) for ext in skip_extensions):
             return False
-            
+        
         return True
     
     async def fetch_page(self, url: str) -> Optional[Dict]:
         """Fetch a single page and extract its content."""
         try:
+            if self.client is not None:
+                return await self.fetch_response(self.client, url)
             async with httpx.AsyncClient(
                 timeout=settings.REQUEST_TIMEOUT,
                 follow_redirects=True
             ) as client:
-                response = await client.get(url)
-                
-                if response.status_code != 200:
-                    return {
-                        'url': url,
-                        'status_code': response.status_code,
-                        'title': None,
-                        'html_content': None,
-                        'text_content': None,
-                        'links': [],
-                        'meta': {},
-                    }
-                
-                # Parse HTML
-                soup = BeautifulSoup(response.text, 'lxml')
-                
-                # Extract text content (remove scripts and styles)
-                for script in soup(["script", "style", "noscript"]):
-                    script.decompose()
-                text_content = soup.get_text(separator=' ', strip=True)
-                
-                # Extract links
-                links = []
-                for link in soup.find_all('a', href=True):
-                    href = link['href']
-                    absolute_url = urljoin(url, href)
-                    if self.is_valid_url(absolute_url):
-                        links.append(absolute_url)
-                
-                # Extract meta information
-                meta = {}
-                title_tag = soup.find('title')
-                meta['title'] = title_tag.string.strip() if title_tag else None
-                
-                meta_desc = soup.find('meta', attrs={'name': 'description'})
-                meta['description'] = meta_desc['content'] if meta_desc and meta_desc.get('content') else None
-                
-                meta_keywords = soup.find('meta', attrs={'name': 'keywords'})
-                meta['keywords'] = meta_keywords['content'] if meta_keywords and meta_keywords.get('content') else None
-                
-                # Check for favicon
-                favicon = soup.find('link', rel=lambda x: x and 'icon' in x.lower())
-                meta['has_favicon'] = favicon is not None
-                
-                return {
-                    'url': url,
-                    'status_code': response.status_code,
-                    'title': meta['title'],
-                    'html_content': str(soup),
-                    'text_content': text_content,
-                    'links': links,
-                    'meta': meta,
-                }
-                
+                return await self.fetch_response(client, url)
         except httpx.TimeoutException:
             return {
                 'url': url,
@@ -120,6 +82,103 @@ class CrawlerService:
                 'links': [],
             }
     
+    async def fetch_response(self, client: httpx.AsyncClient, url: str) -> Dict:
+        """Fetch a page through a client and extract its content."""
+        # Time to first byte (headers of the final response, after
+        # redirects) and total download time
+        started = time.perf_counter()
+        async with client.stream('GET', url) as response:
+            ttfb = time.perf_counter() - started
+            await response.aread()
+        download_time = time.perf_counter() - started
+        
+        metrics = {
+            'ttfb_ms': round(ttfb * 1000),
+            'download_ms': round(download_time * 1000),
+            'transfer_size': response.num_bytes_downloaded,
+            'content_size': len(response.content),
+            'redirect_count': len(response.history),
+            'content_encoding': response.headers.get('content-encoding'),
+        }
+        
+        if response.status_code != 200:
+            return {
+                'url': url,
+                'status_code': response.status_code,
+                'metrics': metrics,
+                'title': None,
+                'html_content': None,
+                'text_content': None,
+                'text_blocks': [],
+                'element_locations': {},
+                'assets': [],
+                'links': [],
+                'meta': {},
+            }
+        
+        # Parsing is CPU-bound: run it in a worker thread so other pages
+        # keep downloading
+        return await asyncio.to_thread(self.parse_page, url, response.status_code, response.text, metrics)
+    
+    def parse_page(self, url: str, status_code: int, source: str, metrics: Dict) -> Dict:
+        """Extract the content of a fetched page."""
+        # Parse HTML
+        soup = BeautifulSoup(source, 'lxml')
+        
+        # Index of the page source, to report line/column of findings
+        source_index = SourceIndex(source)
+        element_locations = source_index.element_locations(soup)
+        
+        # Images, scripts and stylesheets (before scripts are removed)
+        assets = AssetCheckerService.extract_assets(soup, url)
+        
+        # Extract text blocks (remove scripts and styles); the
+        # text content has one block per line
+        for script in soup(["script", "style", "noscript"]):
+            script.decompose()
+        text_blocks = self.text_extractor.extract(soup, source_index)
+        text_content = '\n'.join(block['text'] for block in text_blocks)
+        
+        # Extract links
+        links = []
+        for link in soup.find_all('a', href=True):
+            href = link['href']
+            absolute_url = urljoin(url, href)
+            if self.is_valid_url(absolute_url):
+                links.append(absolute_url)
+        
+        # Extract meta information
+        meta = {}
+        title_tag = soup.find('title')
+        meta['title'] = title_tag.string.strip() if title_tag else None
+        
+        meta_desc = soup.find('meta', attrs={'name': 'description'})
+        meta['description'] = meta_desc['content'] if meta_desc and meta_desc.get('content') else None
+        
+        meta_keywords = soup.find('meta', attrs={'name': 'keywords'})
+        meta['keywords'] = meta_keywords['content'] if meta_keywords and meta_keywords.get('content') else None
+        
+        h1 = soup.find('h1')
+        meta['h1'] = h1.get_text(' ', strip=True) if h1 else None
+        
+        # Check for favicon
+        favicon = soup.find('link', rel=lambda x: x and 'icon' in x.lower())
+        meta['has_favicon'] = favicon is not None
+        
+        return {
+            'url': url,
+            'status_code': status_code,
+            'title': meta['title'],
+            'html_content': str(soup),
+            'text_content': text_content,
+            'text_blocks': text_blocks,
+            'element_locations': element_locations,
+            'assets': assets,
+            'metrics': metrics,
+            'links': links,
+            'meta': meta,
+        }
+    
     async def crawl_recursive(self, url: str, depth: int = 0) -> None:
         """Recursively crawl pages starting from the given URL."""
         # Check limits
@@ -127,12 +186,12 @@ class CrawlerService:
             return
         if len(self.visited_urls) >= self.max_pages:
             return
-            
+        
         # Normalize and check if already visited
         normalized_url = self.normalize_url(url)
         if normalized_url in self.visited_urls:
             return
-            
+        
         # Check if same domain
         if not self.is_same_domain(url):
             return
@@ -0,0 +1,139 @@
+import hashlib
+import re
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from app.core.config import settings
+
+
+class DuplicateDetector:
+    """
+    Finds pages of a scan sharing a title, meta description or H1, and pages
+    with near-duplicate content.
+    
+    Pages are added as the scan processes them; only hashes and page indexes
+    are kept, so the detector does not need the page contents afterwards.
+    Exact duplicates are grouped by the hash of the normalized value. Near
+    duplicates are found with a 64-bit SimHash of the page text, split into
+    SEO_SIMHASH_MAX_DISTANCE + 1 bands: two pages within the distance differ
+    in at most that many bands, so they share at least one and only pages in
+    the same band bucket are compared.
+    """
+    
+    FIELDS = ('title', 'description', 'h1')
+    
+    BITS = 64
+    MASK = (1 << 64) - 1
+    SHINGLE_SIZE = 3
+    WORD_PATTERN = re.compile(r'\w+', re.UNICODE)
+    
+    def __init__(self, max_distance: Optional[int] = None, min_words: Optional[int] = None):
+        self.max_distance = settings.SEO_SIMHASH_MAX_DISTANCE if max_distance is None else max_distance
+        self.min_words = settings.SEO_SIMHASH_MIN_WORDS if min_words is None else min_words
+        if not 0 <= self.max_distance < self.BITS:
+            raise ValueError(f"SimHash max distance must be between 0 and {self.BITS - 1}, got {self.max_distance}")
+        # (shift, mask) of each band of the SimHash bits
+        band_count = self.max_distance + 1
+        self.band_bits = []
+        for band in range(band_count):
+            start, end = band * self.BITS // band_count, (band + 1) * self.BITS // band_count
+            self.band_bits.append((start, (1 << (end - start)) - 1))
+        # field -> value hash -> page indexes
+        self.exact: Dict[str, Dict[str, List[int]]] = {field: defaultdict(list) for field in self.FIELDS}
+        # field -> value hash -> value as written on the first page
+        self.values: Dict[str, Dict[str, str]] = {field: {} for field in self.FIELDS}
+        # page index -> SimHash of the page text
+        self.simhashes: Dict[int, int] = {}
+        # (band, band value) -> page indexes
+        self.bands: Dict[tuple, List[int]] = defaultdict(list)
+        # Union-find parents of near-duplicate pages
+        self.parent: Dict[int, int] = {}
+    
+    @staticmethod
+    def value_hash(value: str) -> str:
+        normalized = re.sub(r'\s+', ' ', value).strip().lower()
+        return hashlib.sha1(normalized.encode('utf-8')).hexdigest()[:16]
+    
+    def simhash(self, words: List[str]) -> int:
+        """
+        64-bit SimHash of a text's word shingles.
+        
+        Shingles are hashed with hash(), which is randomized per process:
+        SimHashes are only comparable within one detector.
+        """
+        shingles = zip(*(words[i:] for i in range(self.SHINGLE_SIZE)))
+        hashes = {hash(shingle) & self.MASK for shingle in shingles}
+        if not hashes:
+            return 0
+        # Count the ones in each bit position (column) of all shingle hashes
+        bits = ''.join([format(h, '064b') for h in hashes])
+        half = len(hashes) / 2
+        value = 0
+        for position in range(self.BITS):
+            value = (value << 1) | (bits[position::self.BITS].count('1') > half)
+        return value
+    
+    def add_page(
+        self,
+        index: int,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        h1: Optional[str] = None,
+        text: Optional[str] = None,
+    ) -> None:
+        """Register the meta values and text of a page."""
+        for field, value in zip(self.FIELDS, (title, description, h1)):
+            if value and value.strip():
+                key = self.value_hash(value)
+                self.exact[field][key].append(index)
+                self.values[field].setdefault(key, value.strip())
+        
+        words = self.WORD_PATTERN.findall(text.lower()) if text else []
+        if len(words) < self.min_words:
+            return
+        
+        simhash = self.simhash(words)
+        self.simhashes[index] = simhash
+        self.parent[index] = index
+        
+        for band, (shift, mask) in enumerate(self.band_bits):
+            bucket = self.bands[(band, (simhash >> shift) & mask)]
+            for other in bucket:
+                # Every page within the distance is linked: groups are
+                # chains of near duplicates, which need not all be near
+                # each other
+                if self._find(other) == self._find(index):
+                    continue
+                if bin(simhash ^ self.simhashes[other]).count('1') <= self.max_distance:
+                    self._union(index, other)
+            bucket.append(index)
+    
+    def _find(self, index: int) -> int:
+        while self.parent[index] != index:
+            self.parent[index] = self.parent[self.parent[index]]
+            index = self.parent[index]
+        return index
+    
+    def _union(self, a: int, b: int) -> None:
+        self.parent[self._find(a)] = self._find(b)
+    
+    def duplicate_groups(self) -> List[Dict]:
+        """
+        Groups of pages sharing a value.
+        
+        Returns list of dicts with field ('title', 'description', 'h1'),
+        value and pages (page indexes in the order they were added).
+        """
+        groups = []
+        for field in self.FIELDS:
+            for key, pages in self.exact[field].items():
+                if len(pages) > 1:
+                    groups.append({'field': field, 'value': self.values[field][key], 'pages': pages})
+        return groups
+    
+    def near_duplicate_groups(self) -> List[List[int]]:
+        """Groups of pages with near-duplicate text (page indexes)."""
+        groups = defaultdict(list)
+        for index in self.simhashes:
+            groups[self._find(index)].append(index)
+        return [pages for pages in groups.values() if len(pages) > 1]
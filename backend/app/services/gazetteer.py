@@ -0,0 +1,100 @@
+import os
+import threading
+from typing import List, Optional
+
+from app.core.config import settings
+
+try:
+    import marisa_trie
+except ImportError:  # pragma: no cover - address validation works without it
+    marisa_trie = None
+
+
+class Gazetteer:
+    """
+    Ukrainian settlements and street names for address validation.
+    
+    The gazetteer is a marisa-trie file built by scripts/build_gazetteer.py
+    from an open dataset and memory-mapped, so all worker processes share
+    one copy. Keys are lowercase names prefixed with their kind ("c:" for
+    settlements, "s:" for streets); values are the names as written in the
+    dataset. Misspelled names are corrected by looking up all names at edit
+    distance 1. Without the file the gazetteer is disabled.
+    """
+    
+    SETTLEMENT = 'c'
+    STREET = 's'
+    
+    ALPHABET = "абвгґдеєжзиіїйклмнопрстуфхцчшщьюя'-"
+    APOSTROPHES = str.maketrans({'’': "'", 'ʼ': "'"})
+    
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or settings.GAZETTEER_PATH
+        self.trie = None
+        self.loaded = False
+        self._lock = threading.Lock()
+    
+    def load(self) -> None:
+        """Load (memory-map) the gazetteer once per process."""
+        with self._lock:
+            if self.loaded:
+                return
+            self.loaded = True
+            
+            if marisa_trie is None or not self.path or not os.path.exists(self.path):
+                print(f"⚠️ Gazetteer {self.path} not found, place name checks disabled")
+                return
+            
+            try:
+                trie = marisa_trie.BytesTrie()
+                trie.mmap(self.path)
+                self.trie = trie
+                print(f"✅ Gazetteer loaded: {self.path}")
+            except Exception as e:
+                print(f"⚠️ Gazetteer loading failed: {e}")
+                self.trie = None
+    
+    @property
+    def enabled(self) -> bool:
+        if not settings.GAZETTEER_ENABLED:
+            return False
+        if not self.loaded:
+            self.load()
+        return self.trie is not None
+    
+    def normalize(self, name: str) -> str:
+        return name.translate(self.APOSTROPHES).lower().strip()
+    
+    def lookup(self, kind: str, name: str) -> Optional[str]:
+        """Return the name as written in the gazetteer, or None if unknown."""
+        values = self.trie.get(f"{kind}:{self.normalize(name)}")
+        return values[0].decode('utf-8') if values else None
+    
+    def edits(self, word: str) -> List[str]:
+        """All strings at edit distance 1 from a word."""
+        splits = [(word[:i], word[i:]) for i in range(len(word) + 1)]
+        deletes = [left + right[1:] for left, right in splits if right]
+        transposes = [left + right[1] + right[0] + right[2:] for left, right in splits if len(right) > 1]
+        replaces = [left + c + right[1:] for left, right in splits if right for c in self.ALPHABET]
+        inserts = [left + c + right for left, right in splits for c in self.ALPHABET]
+        return list(dict.fromkeys(deletes + transposes + replaces + inserts))
+    
+    def suggest(self, kind: str, name: str) -> List[str]:
+        """
+        Known names at edit distance 1 from an unknown name.
+        
+        Returns an empty list if the name is known or nothing is close.
+        """
+        if self.lookup(kind, name) is not None:
+            return []
+        
+        suggestions = []
+        for candidate in self.edits(self.normalize(name)):
+            known = self.lookup(kind, candidate)
+            if known is not None and known not in suggestions:
+                suggestions.append(known)
+        return suggestions
+
+
+# Shared by all scans of a worker process
+gazetteer = Gazetteer()
@@ -0,0 +1,47 @@
+import json
+from typing import Dict, Optional
+
+from app.core.config import settings
+from app.core.redis_client import OptionalRedis
+
+
+class HostInfoCache:
+    """
+    Cache of host-level SEO probes (robots.txt, /favicon.ico, sitemap).
+    
+    The answers are the same for every page of a host, so they are fetched
+    once and kept in Redis (with TTL) by origin ("https://example.com"),
+    letting rescans of the same site skip the probes too. The methods
+    block on Redis: call them from a worker thread in asyncio code.
+    """
+    
+    KEY_PREFIX = "hostinfo:"
+    
+    def __init__(self):
+        self.redis = OptionalRedis("Host info cache", lambda: settings.HOST_CACHE_REDIS_ENABLED)
+    
+    def get(self, origin: str) -> Optional[Dict]:
+        """Cached probe results for an origin, or None."""
+        client = self.redis.client
+        if client is None:
+            return None
+        try:
+            value = client.get(self.KEY_PREFIX + origin)
+        except Exception as e:
+            print(f"⚠️ Host info cache read failed: {e}")
+            return None
+        return json.loads(value) if value is not None else None
+    
+    def set(self, origin: str, info: Dict) -> None:
+        """Store probe results for an origin."""
+        client = self.redis.client
+        if client is None:
+            return
+        try:
+            client.setex(self.KEY_PREFIX + origin, settings.HOST_CACHE_TTL, json.dumps(info))
+        except Exception as e:
+            print(f"⚠️ Host info cache write failed: {e}")
+
+
+# Shared by all scans of a worker process
+host_info_cache = HostInfoCache()
@@ -0,0 +1,105 @@
+import re
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+
+class LanguageDetector:
+    """
+    Lightweight character n-gram language identifier for text blocks.
+    
+    Tells Ukrainian from Russian and English (and from blocks that are not
+    natural language at all: code, SKUs, numbers), so only Ukrainian text
+    goes to the uk-UA spell checker. Scores are based on letters unique to
+    each alphabet and on profiles of the most frequent character trigrams.
+    """
+    
+    UKRAINIAN = 'uk'
+    RUSSIAN = 'ru'
+    ENGLISH = 'en'
+    OTHER = 'other'
+    
+    # Letters that only occur in one of the Cyrillic alphabets
+    UNIQUE_LETTERS = {
+        UKRAINIAN: set('іїєґ'),
+        RUSSIAN: set('ыэъё'),
+    }
+    
+    # Most frequent trigrams, most frequent first (weighted by rank);
+    # "_" marks a word boundary
+    TRIGRAM_PROFILES = {
+        UKRAINIAN: (
+            '_на _пр _по ння на_ ого _ві ти_ ий_ _за ськ від ати про ому ії_ '
+            'ів_ _що що_ _як як_ ої_ _не ть_ ся_ _та та_ _до до_ іст ост ими '
+            'ють ний ної ува _бу ці_ ні_ _із _зо _це це_ ано ані ова _мо _ук '
+            'укр аїн їна ших лід _ти ити ові _ма ами'
+        ).split(),
+        RUSSIAN: (
+            '_пр _на _по ого ени ост ать ния ние ет_ _не то_ ста что _чт ова '
+            'ых_ ий_ ой_ ся_ ие_ ая_ ть_ _за _ка как _ме _от от_ _во тор ель '
+            'ере ным _и_ ии_ его _вы ами ое_ ые_ _эт это _бы был ает _ег тся '
+            'ите _вс все _мы _ты _он'
+        ).split(),
+    }
+    
+    LETTER = re.compile(r'[^\W\d_]')
+    CYRILLIC = re.compile(r'[А-ЯІЇЄҐЁа-яіїєґё]')
+    LATIN = re.compile(r'[A-Za-z]')
+    
+    MIN_LETTERS = 3
+    MIN_LETTER_RATIO = 0.5
+    UNIQUE_LETTER_WEIGHT = 100  # outweighs any trigram
+    
+    def __init__(self):
+        self.profiles = {
+            language: {trigram.replace('_', ' '): len(trigrams) - rank for rank, trigram in enumerate(trigrams)}
+            for language, trigrams in self.TRIGRAM_PROFILES.items()
+        }
+    
+    def detect(self, text: str) -> str:
+        """Detect the language of a text block."""
+        letters = self.LETTER.findall(text)
+        stripped = re.sub(r'\s+', '', text)
+        if len(letters) < self.MIN_LETTERS or len(letters) < len(stripped) * self.MIN_LETTER_RATIO:
+            return self.OTHER
+        
+        cyrillic = len(self.CYRILLIC.findall(text))
+        latin = len(self.LATIN.findall(text))
+        if latin > cyrillic:
+            return self.ENGLISH
+        if cyrillic == 0:
+            return self.OTHER
+        
+        lower = text.lower()
+        scores = {}
+        for language, profile in self.profiles.items():
+            unique = sum(lower.count(letter) for letter in self.UNIQUE_LETTERS[language])
+            scores[language] = unique * self.UNIQUE_LETTER_WEIGHT
+        
+        padded = ' ' + re.sub(r'[^\w]+', ' ', lower) + ' '
+        for i in range(len(padded) - 2):
+            trigram = padded[i:i + 3]
+            for language, profile in self.profiles.items():
+                scores[language] += profile.get(trigram, 0)
+        
+        # Ukrainian wins ties: it's the expected language of our sites
+        return self.RUSSIAN if scores[self.RUSSIAN] > scores[self.UKRAINIAN] else self.UKRAINIAN
+    
+    def group_blocks(self, texts: List[str]) -> Tuple[Dict[str, List[int]], Dict[str, int]]:
+        """
+        Group the text blocks of a page by language.
+        
+        Returns:
+            Indexes of the blocks in each language and size of the text in
+            each language in bytes
+        """
+        blocks: Dict[str, List[int]] = defaultdict(list)
+        byte_counts: Dict[str, int] = defaultdict(int)
+        
+        for index, text in enumerate(texts):
+            if not text.strip():
+                continue
+            language = self.detect(text)
+            blocks[language].append(index)
+            byte_counts[language] += len(text.encode('utf-8'))
+        
+        return dict(blocks), dict(byte_counts)
@@ -0,0 +1,104 @@
+import threading
+import time
+from typing import Dict, Optional
+
+import language_tool_python
+
+from app.core.config import settings
+
+
+class LanguageToolManager:
+    """
+    Process-wide LanguageTool instance.
+
+    Starting LanguageTool launches a Java server, which takes several seconds,
+    so each Celery worker process starts it once and shares it between all
+    scans it runs. The instance is health-checked periodically and restarted
+    if the Java server dies.
+    """
+
+    HEALTH_CHECK_TEXT = "Це перевірка."
+
+    def __init__(self, language: str = 'uk-UA'):
+        self.language = language
+        self.tool = None
+        self.last_health_check = 0.0
+        self._lock = threading.Lock()
+
+    def start(self) -> Optional[language_tool_python.LanguageTool]:
+        """Start LanguageTool if it is not running yet."""
+        if not settings.LANGUAGETOOL_ENABLED:
+            return None
+
+        with self._lock:
+            if self.tool is None:
+                try:
+                    self.tool = language_tool_python.LanguageTool(self.language)
+                    self.last_health_check = time.monotonic()
+                    print(f"✅ LanguageTool ({self.language}) initialized successfully")
+                except Exception as e:
+                    print(f"⚠️ LanguageTool initialization failed: {e}")
+                    self.tool = None
+            return self.tool
+
+    def is_healthy(self) -> bool:
+        """Check that the running LanguageTool server still answers."""
+        if self.tool is None:
+            return False
+        try:
+            self.tool.check(self.HEALTH_CHECK_TEXT)
+            return True
+        except Exception as e:
+            print(f"⚠️ LanguageTool health check failed: {e}")
+            return False
+
+    def get_tool(self) -> Optional[language_tool_python.LanguageTool]:
+        """
+        Get the shared LanguageTool instance.
+
+        Starts it lazily (e.g. when running without prefork workers) and
+        restarts it if the periodic health check fails.
+        """
+        if self.tool is None:
+            return self.start()
+
+        interval = settings.LANGUAGETOOL_HEALTH_CHECK_INTERVAL
+        if time.monotonic() - self.last_health_check >= interval:
+            if self.is_healthy():
+                self.last_health_check = time.monotonic()
+            else:
+                return self.restart()
+
+        return self.tool
+
+    def mark_unhealthy(self) -> None:
+        """Force a health check on the next get_tool() call."""
+        self.last_health_check = 0.0
+
+    def restart(self) -> Optional[language_tool_python.LanguageTool]:
+        """Restart the LanguageTool server."""
+        print("🔄 Restarting LanguageTool...")
+        self.close()
+        return self.start()
+
+    def close(self) -> None:
+        """Stop the LanguageTool server."""
+        with self._lock:
+            if self.tool is not None:
+                try:
+                    self.tool.close()
+                except Exception as e:
+                    print(f"⚠️ LanguageTool shutdown failed: {e}")
+                self.tool = None
+
+
+# One instance per worker process and language
+language_tool_manager = LanguageToolManager()
+language_tool_managers: Dict[str, LanguageToolManager] = {'uk-UA': language_tool_manager}
+
+
+def get_language_tool_manager(language: str = 'uk-UA') -> LanguageToolManager:
+    """Get the worker's LanguageTool manager for a language."""
+    if language not in language_tool_managers:
+        language_tool_managers[language] = LanguageToolManager(language)
+    return language_tool_managers[language]
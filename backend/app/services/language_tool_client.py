@@ -0,0 +1,92 @@
+import asyncio
+import httpx
+from typing import List, Dict, Optional
+from app.core.config import settings
+
+
+class LanguageToolClient:
+    """
+    Async client for a LanguageTool HTTP server (POST /v2/check).
+    
+    One pooled connection set is shared by all requests of a scan, the number
+    of requests in flight is bounded by a semaphore, and transient failures
+    (connection errors, 429, 5xx) are retried with exponential backoff.
+    """
+    
+    RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+    RETRY_BACKOFF = 0.5  # seconds, doubled on each attempt
+    
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        language: str = 'uk-UA',
+        max_concurrency: Optional[int] = None,
+        max_retries: Optional[int] = None,
+    ):
+        self.base_url = (base_url or settings.LANGUAGETOOL_URL).rstrip('/')
+        self.language = language
+        self.max_concurrency = max_concurrency or settings.LANGUAGETOOL_MAX_CONCURRENCY
+        self.max_retries = settings.LANGUAGETOOL_MAX_RETRIES if max_retries is None else max_retries
+        self.semaphore = asyncio.Semaphore(self.max_concurrency)
+        self.client = httpx.AsyncClient(
+            timeout=settings.LANGUAGETOOL_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency,
+            ),
+        )
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+    
+    async def close(self) -> None:
+        await self.client.aclose()
+    
+    @staticmethod
+    def normalize_match(match: Dict) -> Dict:
+        """Convert a /v2/check match to the format used by SpellCheckerService."""
+        rule = match.get('rule', {})
+        return {
+            'message': match.get('message'),
+            'offset': match.get('offset', 0),
+            'length': match.get('length', 0),
+            'replacements': [r['value'] for r in match.get('replacements', []) if 'value' in r],
+            'rule_id': rule.get('id'),
+            'category': rule.get('category', {}).get('id'),
+        }
+    
+    async def check(self, text: str) -> List[Dict]:
+        """
+        Check text on the LanguageTool server.
+        
+        Returns list of normalized matches with offsets relative to text.
+        """
+        async with self.semaphore:
+            attempt = 0
+            while True:
+                try:
+                    response = await self.client.post(
+                        f"{self.base_url}/v2/check",
+                        data={'text': text, 'language': self.language},
+                    )
+                    if response.status_code in self.RETRY_STATUS_CODES:
+                        raise httpx.HTTPStatusError(
+                            f"LanguageTool server returned {response.status_code}",
+                            request=response.request,
+                            response=response,
+                        )
+                    response.raise_for_status()
+                    matches = response.json().get('matches', [])
+                    return [self.normalize_match(m) for m in matches]
+                except (httpx.TransportError, httpx.HTTPStatusError) as e:
+                    retryable = (
+                        isinstance(e, httpx.TransportError)
+                        or e.response.status_code in self.RETRY_STATUS_CODES
+                    )
+                    if not retryable or attempt >= self.max_retries:
+                        raise
+                    await asyncio.sleep(self.RETRY_BACKOFF * 2 ** attempt)
+                    attempt += 1
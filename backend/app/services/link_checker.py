@@ -4,37 +4,59 @@ from bs4 import BeautifulSoup
 import re
 from urllib.parse import urljoin
 from app.core.config import settings
+from app.services.regex_engine import compile_pattern, normalize_spaces
 
 
 class LinkCheckerService:
     """Service for checking broken links and phone numbers."""
     
-    def __init__(self):
+    # Phone-like patterns in plain text (RE2-compatible, see regex_engine)
+    PHONE_PATTERNS = [
+        r'\+?\d{3}[\s\-]?\d{2}[\s\-]?\d{3}[\s\-]?\d{2}[\s\-]?\d{2}',
+        r'\+?\d{3}[\s\-]?\d{9}',
+        r'0\d{2}[\s\-]?\d{3}[\s\-]?\d{2}[\s\-]?\d{2}',
+    ]
+    
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
         self.timeout = settings.REQUEST_TIMEOUT
+        self.client = client  # Shared client of the scan (a client per request if None)
         self.checked_links = {}  # Cache for already checked links
+        self.phone_compiled = [compile_pattern(p) for p in self.PHONE_PATTERNS]
     
-    async def check_link(self, url: str) -> Dict:
+    async def check_link(self, url: str, client: Optional[httpx.AsyncClient] = None) -> Dict:
         """
         Check if a link is accessible.
         
-        Returns dict with status_code and error message if any.
+        Returns dict with status_code, content_type, size (Content-Length
+        in bytes, if known) and error message if any. Requests go through
+        the given client or the service's client, if any; servers that do
+        not allow HEAD are asked with GET (only the headers are read).
         """
         # Return cached result if available
         if url in self.checked_links:
             return self.checked_links[url]
         
+        client = client or self.client
+        
         try:
-            async with httpx.AsyncClient(
-                timeout=self.timeout,
-                follow_redirects=True
-            ) as client:
-                response = await client.head(url)
-                result = {
-                    'url': url,
-                    'status_code': response.status_code,
-                    'is_broken': response.status_code >= 400,
-                    'error': None,
-                }
+            if client is not None:
+                response = await self._probe(client, url)
+            else:
+                async with httpx.AsyncClient(
+                    timeout=self.timeout,
+                    follow_redirects=True
+                ) as client:
+                    response = await self._probe(client, url)
+            
+            size = response.headers.get('content-length')
+            result = {
+                'url': url,
+                'status_code': response.status_code,
+                'is_broken': response.status_code >= 400,
+                'error': None,
+                'content_type': response.headers.get('content-type', '').split(';')[0].strip().lower() or None,
+                'size': int(size) if size and size.isdigit() else None,
+            }
         except httpx.TimeoutException:
             result = {
                 'url': url,
@@ -61,6 +83,13 @@ class LinkCheckerService:
         self.checked_links[url] = result
         return result
     
+    async def _probe(self, client: httpx.AsyncClient, url: str) -> httpx.Response:
+        response = await client.head(url, follow_redirects=True)
+        if response.status_code in (405, 501):
+            async with client.stream('GET', url, follow_redirects=True) as response:
+                pass
+        return response
+    
     async def check_all_links(self, html_content: str, base_url: str) -> List[Dict]:
         """
         Extract and check all links from HTML content.
@@ -90,6 +119,7 @@ class LinkCheckerService:
                 link_text = link.get_text(strip=True)
                 
                 error = {
+                    'href': href,
                     'link_url': absolute_url,
                     'link_text': link_text,
                     'status_code': result['status_code'],
@@ -182,23 +212,18 @@ class LinkCheckerService:
         
         # Also check for phone numbers in plain text (not clickable)
         soup = BeautifulSoup(html_content, 'lxml')
-        text = soup.get_text()
+        text = normalize_spaces(soup.get_text())
+        link_texts = [normalize_spaces(p['link_text']) for p in phones]
         
         # Find phone-like patterns in text
-        phone_patterns = [
-            r'\+?\d{3}[\s\-]?\d{2}[\s\-]?\d{3}[\s\-]?\d{2}[\s\-]?\d{2}',
-            r'\+?\d{3}[\s\-]?\d{9}',
-            r'0\d{2}[\s\-]?\d{3}[\s\-]?\d{2}[\s\-]?\d{2}',
-        ]
-        
-        for pattern in phone_patterns:
-            matches = re.finditer(pattern, text)
+        for pattern in self.phone_compiled:
+            matches = pattern.finditer(text)
             for match in matches:
                 phone_text = match.group(0)
                 
                 # Check if this phone is already in a tel: link
-                is_clickable = any(p['link_text'] in phone_text or phone_text in p['link_text'] 
-                                  for p in phones)
+                is_clickable = any(link_text in phone_text or phone_text in link_text
+                                  for link_text in link_texts)
                 
                 if not is_clickable:
                     # Get context
@@ -0,0 +1,253 @@
+import asyncio
+from abc import ABC, abstractmethod
+
+import httpx
+from typing import Dict, List, Optional, Type
+
+from app.models.error import ErrorType, ErrorSeverity
+from app.services.address_validator import AddressValidatorService
+from app.services.link_checker import LinkCheckerService
+from app.services.seo_checker import SEOCheckerService
+from app.services.source_index import SourceIndex
+from app.services.text_extractor import TextExtractor
+
+
+SEVERITY_MAP = {
+    'info': ErrorSeverity.INFO,
+    'warning': ErrorSeverity.WARNING,
+    'error': ErrorSeverity.ERROR,
+    'critical': ErrorSeverity.CRITICAL,
+}
+
+
+def finding(error_type: ErrorType, severity: ErrorSeverity, err: Dict, **location) -> Dict:
+    """Error fields of a checker's finding."""
+    return {
+        'error_type': error_type,
+        'severity': severity,
+        'message': err['message'],
+        'context': err.get('context'),
+        'suggestion': err.get('suggestion'),
+        **location,
+    }
+
+
+def block_location(block: Optional[Dict], offset: int = 0) -> Dict:
+    """Error fields locating a finding at an offset in a text block."""
+    if not block:
+        return {}
+    line, column = TextExtractor.locate(block, offset)
+    return {'element_path': block.get('path'), 'line_number': line, 'column_number': column}
+
+
+def text_location(blocks: List[Dict], text: str) -> Dict:
+    """Error fields locating the first text block containing the text."""
+    for block in blocks:
+        position = block['text'].find(text)
+        if position >= 0:
+            return block_location(block, position)
+    return {}
+
+
+def element_location(page_data: Dict, key: Optional[str]) -> Dict:
+    """Error fields locating an element (see SourceIndex.element_key())."""
+    location = (page_data.get('element_locations') or {}).get(key) if key else None
+    if not location:
+        return {}
+    return {'line_number': location[0], 'column_number': location[1]}
+
+
+def phone_location(page_data: Dict, blocks: List[Dict], err: Dict) -> Dict:
+    """Error fields locating a phone finding: its tel: link or its text."""
+    if err.get('href'):
+        return element_location(page_data, SourceIndex.element_key('a', err['href']))
+    return text_location(blocks, err['phone_number'])
+
+
+class PageChecker(ABC):
+    """
+    A check run on every page of a scan.
+    
+    Subclasses set name, preference (the website preference turning the
+    check on, on by default), error_type and io_bound, implement check()
+    and are added to the registry with @register_checker. I/O-bound
+    checkers implement check() as a coroutine and run concurrently on the
+    scan's event loop; CPU-bound ones implement a plain method and run in
+    a worker thread. One instance is created per scan (or check_pages
+    task), so checkers may keep caches across pages.
+    
+    check() gets the page (dict with url, depth and html_content) and its
+    check data (see scan_website.page_check_data()) and returns findings
+    (Error fields).
+    """
+    
+    name: str = ''
+    preference: Optional[str] = None
+    error_type: ErrorType
+    io_bound: bool = False
+    
+    def __init__(self, runner: 'PageCheckRunner'):
+        self.runner = runner
+    
+    @abstractmethod
+    def check(self, page: Dict, check_data: Dict) -> List[Dict]:
+        ...
+
+
+# Registered checkers by name, in the order their findings are reported
+PAGE_CHECKERS: Dict[str, Type[PageChecker]] = {}
+
+
+def register_checker(checker: Type[PageChecker]) -> Type[PageChecker]:
+    """Class decorator adding a checker to the registry."""
+    PAGE_CHECKERS[checker.name] = checker
+    return checker
+
+
+@register_checker
+class AddressChecker(PageChecker):
+    """Addresses in the page's text blocks."""
+    
+    name = 'addresses'
+    preference = 'check_addresses'
+    error_type = ErrorType.ADDRESS
+    
+    def check(self, page: Dict, check_data: Dict) -> List[Dict]:
+        findings = []
+        for block in check_data['blocks']:
+            for err in self.runner.address_validator.validate_text(block['text']):
+                findings.append(finding(
+                    self.error_type, ErrorSeverity.ERROR, err,
+                    **block_location(block, err['position']),
+                ))
+        return findings
+
+
+@register_checker
+class PhoneChecker(PageChecker):
+    """Phone numbers in the page's text and tel: links."""
+    
+    name = 'phones'
+    preference = 'check_phones'
+    error_type = ErrorType.PHONE
+    
+    def check(self, page: Dict, check_data: Dict) -> List[Dict]:
+        if not check_data['html']:
+            return []
+        return [
+            finding(
+                self.error_type, ErrorSeverity.WARNING, err,
+                **phone_location(check_data, check_data['blocks'], err),
+            )
+            for err in self.runner.link_checker.check_phone_numbers(check_data['html'])
+        ]
+
+
+@register_checker
+class LinkChecker(PageChecker):
+    """Broken links of the page."""
+    
+    name = 'links'
+    preference = 'check_links'
+    error_type = ErrorType.BROKEN_LINK
+    io_bound = True
+    
+    async def check(self, page: Dict, check_data: Dict) -> List[Dict]:
+        if not page.get('html_content'):
+            return []
+        link_errors = await self.runner.link_checker.check_all_links(page['html_content'], page['url'])
+        return [
+            {
+                'error_type': self.error_type,
+                'severity': ErrorSeverity.ERROR,
+                'message': err['message'],
+                'link_url': err.get('link_url'),
+                'link_status_code': err.get('status_code'),
+                **element_location(check_data, SourceIndex.element_key('a', err.get('href'))),
+            }
+            for err in link_errors
+        ]
+
+
+@register_checker
+class SEOChecker(PageChecker):
+    """SEO of the page, and robots.txt on the homepage."""
+    
+    name = 'seo'
+    preference = 'check_seo'
+    error_type = ErrorType.SEO
+    io_bound = True
+    
+    def __init__(self, runner: 'PageCheckRunner'):
+        super().__init__(runner)
+        # robots.txt and /favicon.ico are probed once per host
+        self.seo_checker = SEOCheckerService(client=runner.client)
+    
+    async def check(self, page: Dict, check_data: Dict) -> List[Dict]:
+        if not page.get('html_content'):
+            return []
+        seo_errors = await self.seo_checker.check_page(page['html_content'], page['url'])
+        
+        # Check robots.txt (only once, for homepage)
+        if (page.get('depth') or 0) == 0:
+            robots_error = await self.seo_checker.check_robots_accessibility(self.runner.website_url)
+            if robots_error:
+                seo_errors.append(robots_error)
+        
+        return [
+            finding(
+                self.error_type,
+                SEVERITY_MAP.get(err.get('severity', 'warning'), ErrorSeverity.WARNING),
+                err,
+                **element_location(check_data, err.get('element')),
+            )
+            for err in seo_errors
+        ]
+
+
+class PageCheckRunner:
+    """
+    Runs the registered checkers enabled by a website's preferences on
+    the pages of a scan.
+    
+    A page's I/O-bound checkers run concurrently with each other and with
+    its CPU-bound checkers, which run one after another in a worker
+    thread. Checkers share the scan's HTTP client, link checker (whose
+    cache the asset checks use too) and address validator (which memoizes
+    results per address, for the template blocks too).
+    """
+    
+    def __init__(
+        self,
+        website_url: str,
+        preferences: Dict,
+        client: Optional[httpx.AsyncClient] = None,
+        link_checker: Optional[LinkCheckerService] = None,
+        address_validator: Optional[AddressValidatorService] = None,
+    ):
+        self.website_url = website_url
+        self.client = client
+        self.link_checker = link_checker or LinkCheckerService(client=client)
+        self.address_validator = address_validator or AddressValidatorService()
+        self.checkers = [
+            checker(self) for checker in PAGE_CHECKERS.values()
+            if preferences.get(checker.preference, True)
+        ]
+    
+    @staticmethod
+    def run_cpu_checkers(checkers: List[PageChecker], page: Dict, check_data: Dict) -> List[List[Dict]]:
+        return [checker.check(page, check_data) for checker in checkers]
+    
+    async def check(self, page: Dict, check_data: Dict) -> List[Dict]:
+        """Findings of all checkers for a page, in registry order."""
+        cpu_checkers = [checker for checker in self.checkers if not checker.io_bound]
+        io_checkers = [checker for checker in self.checkers if checker.io_bound]
+        
+        cpu_results, *io_results = await asyncio.gather(
+            asyncio.to_thread(self.run_cpu_checkers, cpu_checkers, page, check_data),
+            *(checker.check(page, check_data) for checker in io_checkers),
+        )
+        
+        results = dict(zip(cpu_checkers, cpu_results))
+        results.update(zip(io_checkers, io_results))
+        return [fields for checker in self.checkers for fields in results[checker]]
@@ -0,0 +1,95 @@
+import math
+from typing import Dict, List, Optional
+from app.core.config import settings
+
+
+class PerformanceCheckerService:
+    """
+    Service for checking page load performance.
+    
+    Uses the timing and size of the crawler's own fetch of each page
+    (time to first byte, download time, transferred and uncompressed size,
+    redirects, Content-Encoding), so no extra requests are sent.
+    """
+    
+    # Metrics summarized per scan with percentiles
+    SUMMARY_METRICS = ('ttfb_ms', 'download_ms', 'transfer_size', 'content_size')
+    PERCENTILES = (50, 95)
+    
+    def __init__(self):
+        self.slow_ttfb_ms = settings.PERF_SLOW_TTFB_MS
+        self.slow_download_ms = settings.PERF_SLOW_DOWNLOAD_MS
+        self.max_page_size = settings.PERF_MAX_PAGE_SIZE
+        self.min_compress_size = settings.PERF_MIN_COMPRESS_SIZE
+    
+    @staticmethod
+    def percentile(values: List[float], p: float) -> Optional[float]:
+        """Nearest-rank percentile of values (None for no values)."""
+        if not values:
+            return None
+        ordered = sorted(values)
+        rank = max(1, math.ceil(p / 100 * len(ordered)))
+        return ordered[rank - 1]
+    
+    def summarize(self, pages_metrics: List[Dict]) -> Dict:
+        """
+        Site-level percentiles of page metrics.
+        
+        Returns dict with the number of measured pages and
+        <metric>_p50 / <metric>_p95 for each summarized metric.
+        """
+        summary = {'pages': len(pages_metrics)}
+        for metric in self.SUMMARY_METRICS:
+            values = [m[metric] for m in pages_metrics if m.get(metric) is not None]
+            for p in self.PERCENTILES:
+                summary[f"{metric}_p{p}"] = self.percentile(values, p)
+        return summary
+    
+    @staticmethod
+    def format_size(size: int) -> str:
+        return f"{size // 1024} КБ" if size >= 1024 else f"{size} Б"
+    
+    def check_page(self, metrics: Optional[Dict]) -> List[Dict]:
+        """Issues of a page: slow response or download, heavy or uncompressed HTML, redirects."""
+        if not metrics:
+            return []
+        
+        issues = []
+        
+        if metrics['ttfb_ms'] > self.slow_ttfb_ms:
+            issues.append({
+                'message': f"Повільна відповідь сервера: {metrics['ttfb_ms']} мс до першого байта",
+                'suggestion': f"Рекомендовано до {self.slow_ttfb_ms} мс: перевірте кешування сторінок і швидкодію сервера",
+                'severity': 'warning',
+            })
+        
+        if metrics['download_ms'] > self.slow_download_ms:
+            issues.append({
+                'message': f"Сторінка завантажується повільно: {metrics['download_ms']} мс",
+                'suggestion': f"Рекомендовано до {self.slow_download_ms} мс",
+                'severity': 'warning',
+            })
+        
+        if metrics['content_size'] > self.max_page_size:
+            issues.append({
+                'message': f"Завеликий HTML сторінки: {self.format_size(metrics['content_size'])}",
+                'suggestion': f"Рекомендовано до {self.format_size(self.max_page_size)}: "
+                              "приберіть вбудовані скрипти, стилі та зображення (data:) з HTML",
+                'severity': 'warning',
+            })
+        
+        if not metrics.get('content_encoding') and metrics['content_size'] >= self.min_compress_size:
+            issues.append({
+                'message': f"HTML передається без стиснення ({self.format_size(metrics['content_size'])})",
+                'suggestion': 'Увімкніть gzip або brotli на сервері',
+                'severity': 'info',
+            })
+        
+        if metrics['redirect_count'] > 1:
+            issues.append({
+                'message': f"Ланцюжок переадресацій: {metrics['redirect_count']}",
+                'suggestion': 'Посилайтеся одразу на кінцеву адресу сторінки',
+                'severity': 'info',
+            })
+        
+        return issues
@@ -0,0 +1,50 @@
+import re
+from functools import lru_cache
+
+from app.core.config import settings
+
+try:
+    import re2
+except ImportError:  # pragma: no cover - the standard library engine still works
+    re2 = None
+
+
+# RE2's \s and \d are ASCII-only, while the standard re module matches
+# any Unicode whitespace and digit. Texts are scanned with Unicode spaces
+# (no-break spaces are common in Ukrainian copy, e.g. "м.\xa0Київ")
+# replaced by plain spaces, so both engines find the same matches.
+UNICODE_SPACES = str.maketrans({
+    chr(code): ' '
+    for code in range(0x3001)
+    if chr(code).isspace() and chr(code) not in ' \t\n\r\f'
+})
+
+
+def normalize_spaces(text: str) -> str:
+    """
+    Replace Unicode spaces in text with plain spaces, one character for
+    one, so offsets of matches in the result are valid in the original.
+    """
+    return text.translate(UNICODE_SPACES)
+
+
+@lru_cache(maxsize=None)
+def compile_pattern(pattern: str):
+    """
+    Compile a pattern with the configured regex engine.
+    
+    With REGEX_ENGINE = "re2" and google-re2 installed, patterns are compiled
+    with RE2, which matches in time linear in the length of the input, so a
+    huge or malformed page cannot make a scanner backtrack for minutes.
+    Patterns RE2 does not support (backreferences, lookaround) and setups
+    without google-re2 fall back to the standard re module. Scan texts
+    passed through normalize_spaces(), as RE2's \s is ASCII-only.
+    
+    Compiled patterns are cached per process.
+    """
+    if settings.REGEX_ENGINE == 're2' and re2 is not None:
+        try:
+            return re2.compile(pattern)
+        except re2.error as e:
+            print(f"⚠️ Pattern not supported by RE2, using re: {e}")
+    return re.compile(pattern)
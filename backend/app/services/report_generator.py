@@ -92,6 +92,8 @@ class ReportGenerator:
             .error-type.broken_link { background: #f8d7da; color: #721c24; }
             .error-type.phone { background: #fff3cd; color: #856404; }
             .error-type.seo { background: #d1ecf1; color: #0c5460; }
+            .error-type.asset { background: #f8d7da; color: #721c24; }
+            .error-type.performance { background: #fff3cd; color: #856404; }
             .severity {
                 display: inline-block;
                 padding: 5px 10px;
@@ -174,6 +176,30 @@ class ReportGenerator:
             </div>
         </div>
 
+        {% if scan.performance and scan.performance.pages %}
+        <div class="error-section">
+            <h2>Швидкодія сторінок</h2>
+            <div class="summary-grid">
+                <div class="summary-item">
+                    <h3>Час до першого байта (p50 / p95)</h3>
+                    <div class="value">{{ scan.performance.ttfb_ms_p50 }} / {{ scan.performance.ttfb_ms_p95 }} мс</div>
+                </div>
+                <div class="summary-item">
+                    <h3>Завантаження (p50 / p95)</h3>
+                    <div class="value">{{ scan.performance.download_ms_p50 }} / {{ scan.performance.download_ms_p95 }} мс</div>
+                </div>
+                <div class="summary-item">
+                    <h3>Розмір HTML (p50 / p95)</h3>
+                    <div class="value">{{ (scan.performance.content_size_p50 / 1024)|round|int }} / {{ (scan.performance.content_size_p95 / 1024)|round|int }} КБ</div>
+                </div>
+                <div class="summary-item">
+                    <h3>Передано (p50 / p95)</h3>
+                    <div class="value">{{ (scan.performance.transfer_size_p50 / 1024)|round|int }} / {{ (scan.performance.transfer_size_p95 / 1024)|round|int }} КБ</div>
+                </div>
+            </div>
+        </div>
+        {% endif %}
+
         {% if stats.by_type %}
         <div class="error-section">
             <h2>Помилки за типами</h2>
@@ -212,6 +238,18 @@ class ReportGenerator:
                     
                     <div class="error-message">{{ error.message }}</div>
                     
+                    {% if error.page_count %}
+                    <div class="page-info">
+                        Шаблонний блок (меню, футер): повторюється на {{ error.page_count }} сторінках
+                    </div>
+                    {% endif %}
+                    
+                    {% if error.element_path %}
+                    <div class="page-info">
+                        Елемент: {{ error.element_path }}{% if error.line_number %}, рядок {{ error.line_number }}{% endif %}
+                    </div>
+                    {% endif %}
+                    
                     {% if error.context %}
                     <div class="error-context">
                         <strong>Контекст:</strong><br>
@@ -246,6 +284,8 @@ class ReportGenerator:
         'broken_link': 'Битi посилання',
         'phone': 'Телефонні номери',
         'seo': 'SEO',
+        'asset': 'Зображення, CSS та JS',
+        'performance': 'Швидкодія',
     }
     
     SEVERITY_NAMES = {
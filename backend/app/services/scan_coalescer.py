@@ -0,0 +1,135 @@
+import hashlib
+import json
+from contextlib import asynccontextmanager, contextmanager
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Dict, Iterator, Optional
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.redis_client import OptionalRedis
+from app.models import ScanSession
+from app.models.scan_session import ScanStatus
+
+
+class ScanCoalescer:
+    """
+    Finds duplicate scans, so a website is not crawled twice at once.
+    
+    A new scan of a website duplicates its pending or running scan created
+    with the same preferences (double-clicks, retried requests, overlapping
+    schedules); the existing scan is returned instead of starting another.
+    Scans created or started more than SCAN_COALESCE_MAX_AGE seconds ago
+    are not: a scan whose worker died stays running in the database, and
+    must not block new scans of its website.
+    The check and the creation of the scan run under a Redis lock per
+    website, so concurrent requests cannot both miss the other's scan.
+    The API uses the asyncio methods, the scan scheduler (a Celery task)
+    the sync ones.
+    """
+    
+    LOCK_KEY = "scan:create:{}"
+    
+    def __init__(self):
+        # The scan scheduler locks with the sync client, the API with the asyncio one
+        self.redis = OptionalRedis("Scan creation lock")
+    
+    @staticmethod
+    def preferences_hash(preferences: Optional[Dict]) -> str:
+        """SHA-256 of preferences, independent of key order."""
+        data = json.dumps(preferences or {}, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(data.encode('utf-8')).hexdigest()
+    
+    @asynccontextmanager
+    async def lock(self, website_id: int) -> AsyncIterator[None]:
+        """
+        Hold the scan creation lock of a website.
+        
+        Waits up to SCAN_CREATE_LOCK_TIMEOUT seconds for it; if Redis is
+        unavailable or the lock is not acquired in time, continues without
+        it rather than failing the request.
+        """
+        lock = None
+        acquired = False
+        client = self.redis.async_client
+        if client is not None:
+            lock = client.lock(
+                self.LOCK_KEY.format(website_id),
+                timeout=settings.SCAN_CREATE_LOCK_TIMEOUT,
+                blocking_timeout=settings.SCAN_CREATE_LOCK_TIMEOUT,
+            )
+            try:
+                acquired = await lock.acquire()
+            except Exception as e:
+                print(f"⚠️ Scan creation lock failed: {e}")
+        
+        try:
+            yield
+        finally:
+            if acquired:
+                try:
+                    await lock.release()
+                except Exception as e:
+                    print(f"⚠️ Scan creation lock release failed: {e}")
+    
+    @contextmanager
+    def sync_lock(self, website_id: int) -> Iterator[None]:
+        """lock() for sync code."""
+        lock = None
+        acquired = False
+        client = self.redis.client
+        if client is not None:
+            lock = client.lock(
+                self.LOCK_KEY.format(website_id),
+                timeout=settings.SCAN_CREATE_LOCK_TIMEOUT,
+                blocking_timeout=settings.SCAN_CREATE_LOCK_TIMEOUT,
+            )
+            try:
+                acquired = lock.acquire()
+            except Exception as e:
+                print(f"⚠️ Scan creation lock failed: {e}")
+        
+        try:
+            yield
+        finally:
+            if acquired:
+                try:
+                    lock.release()
+                except Exception as e:
+                    print(f"⚠️ Scan creation lock release failed: {e}")
+    
+    @staticmethod
+    def duplicate_query(website_id: int, preferences_hash: str) -> Select:
+        """The website's latest recent pending or running scan with the same preferences."""
+        cutoff = datetime.utcnow() - timedelta(seconds=settings.SCAN_COALESCE_MAX_AGE)
+        return (
+            select(ScanSession)
+            .where(
+                ScanSession.website_id == website_id,
+                ScanSession.status.in_([ScanStatus.PENDING, ScanStatus.RUNNING]),
+                ScanSession.preferences_hash == preferences_hash,
+                func.coalesce(ScanSession.started_at, ScanSession.created_at) >= cutoff,
+            )
+            .order_by(ScanSession.created_at.desc())
+            .limit(1)
+        )
+    
+    async def find_duplicate(
+        self,
+        db: AsyncSession,
+        website_id: int,
+        preferences_hash: str,
+    ) -> Optional[ScanSession]:
+        """The website's latest pending or running scan with the same preferences, if any."""
+        result = await db.execute(self.duplicate_query(website_id, preferences_hash))
+        return result.scalar_one_or_none()
+    
+    def find_duplicate_sync(self, db: Session, website_id: int, preferences_hash: str) -> Optional[ScanSession]:
+        """find_duplicate() for sync code."""
+        return db.execute(self.duplicate_query(website_id, preferences_hash)).scalar_one_or_none()
+
+
+# Shared by all requests of a process
+scan_coalescer = ScanCoalescer()
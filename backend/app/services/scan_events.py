@@ -0,0 +1,210 @@
+import asyncio
+import json
+import time
+from typing import AsyncIterator, Dict, List, Optional
+
+from app.core.config import settings
+from app.core.redis_client import OptionalRedis
+
+
+class ScanEvents:
+    """
+    Live progress of scans over Redis pub/sub.
+    
+    Workers publish events to a channel per scan and keep the latest
+    progress in a key (with TTL), so a client that connects mid-scan, or
+    between the scan finishing and subscribing, still gets the current
+    state. The API streams the events to the UI as Server-Sent Events.
+    
+    Events are dicts with event ("progress" or "status") and data: the
+    scan's status, pages_found, pages_processed and errors_found, and for
+    progress events the pages checked since the previous event (url and
+    findings).
+    """
+    
+    CHANNEL = "scan:{}:events"
+    SNAPSHOT_KEY = "scan:{}:progress"
+    TERMINAL_STATUSES = ('completed', 'failed', 'cancelled')
+    # Seconds without publishing after a failed publish, so an unavailable
+    # Redis does not slow scans down
+    RETRY_AFTER = 60
+    
+    def __init__(self):
+        # Workers publish with the sync client, the API with the asyncio one
+        self.redis = OptionalRedis("Scan events", lambda: settings.SCAN_EVENTS_ENABLED)
+        self.retry_at = 0.0
+    
+    def queue_event(self, pipe, scan_session_id: int, event: str, data: Dict) -> None:
+        """Add publishing an event and storing its progress to a pipeline."""
+        snapshot = {key: value for key, value in data.items() if key != 'pages'}
+        pipe.setex(self.SNAPSHOT_KEY.format(scan_session_id), settings.SCAN_EVENTS_TTL, json.dumps(snapshot))
+        pipe.publish(self.CHANNEL.format(scan_session_id), json.dumps({'event': event, 'data': data}))
+    
+    def publish(self, scan_session_id: int, event: str, data: Dict) -> None:
+        """
+        Publish an event of a scan and store its progress as the latest.
+        
+        Blocks on Redis: asyncio code calls it from a worker thread.
+        """
+        client = self.redis.client
+        if client is None or time.monotonic() < self.retry_at:
+            return
+        try:
+            pipe = client.pipeline(transaction=False)
+            self.queue_event(pipe, scan_session_id, event, data)
+            pipe.execute()
+        except Exception as e:
+            print(f"⚠️ Scan event publish failed: {e}")
+            self.retry_at = time.monotonic() + self.RETRY_AFTER
+    
+    def publish_status(self, scan_session_id: int, status: str, progress: Optional[Dict] = None) -> None:
+        """Publish a change of a scan's status."""
+        self.publish(scan_session_id, 'status', {**(progress or {}), 'status': status})
+    
+    async def publish_status_async(self, scan_session_id: int, status: str, progress: Optional[Dict] = None) -> None:
+        """publish_status() from the API's event loop."""
+        client = self.redis.async_client
+        if client is None:
+            return
+        try:
+            pipe = client.pipeline(transaction=False)
+            self.queue_event(pipe, scan_session_id, 'status', {**(progress or {}), 'status': status})
+            await pipe.execute()
+        except Exception as e:
+            print(f"⚠️ Scan event publish failed: {e}")
+    
+    @staticmethod
+    def format_event(event: str, data: Dict) -> str:
+        return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+    
+    async def stream(self, scan_session_id: int, progress: Dict) -> AsyncIterator[str]:
+        """
+        Server-Sent Events of a scan, starting from its progress as read
+        from the database, until the scan completes, fails or is cancelled.
+        
+        A comment is sent every SCAN_EVENTS_KEEPALIVE seconds without
+        events, so proxies keep the connection open. With events disabled,
+        or if Redis fails, the stream ends after the database progress and
+        the UI falls back to polling.
+        """
+        yield self.format_event('progress', progress)
+        if progress['status'] in self.TERMINAL_STATUSES:
+            return
+        client = self.redis.async_client
+        if client is None:
+            return
+        
+        pubsub = client.pubsub()
+        try:
+            await pubsub.subscribe(self.CHANNEL.format(scan_session_id))
+            
+            # Progress published before subscribing
+            snapshot = await client.get(self.SNAPSHOT_KEY.format(scan_session_id))
+            if snapshot is not None:
+                snapshot = json.loads(snapshot)
+                yield self.format_event('progress', snapshot)
+                if snapshot['status'] in self.TERMINAL_STATUSES:
+                    return
+            
+            while True:
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True,
+                    timeout=settings.SCAN_EVENTS_KEEPALIVE,
+                )
+                if message is None:
+                    yield ": keep-alive\n\n"
+                    continue
+                
+                event = json.loads(message['data'])
+                yield self.format_event(event['event'], event['data'])
+                if event['data']['status'] in self.TERMINAL_STATUSES:
+                    return
+        except Exception as e:
+            print(f"⚠️ Scan events stream failed: {e}")
+        finally:
+            try:
+                await pubsub.aclose()
+            except Exception as e:
+                print(f"⚠️ Scan events unsubscribe failed: {e}")
+
+
+class ScanProgressPublisher:
+    """
+    Throttled progress events of one scan.
+    
+    update() is called after every checked page; the progress and the
+    findings of the pages checked since the last event are published at
+    most every SCAN_EVENTS_INTERVAL seconds, so large scans do not flood
+    Redis or the UI. On an event loop, update_async() publishes from a
+    worker thread, so a slow Redis does not stall the scan's requests.
+    """
+    
+    def __init__(self, scan_session_id: int, events: Optional[ScanEvents] = None):
+        self.scan_session_id = scan_session_id
+        self.events = events or scan_events
+        self.interval = settings.SCAN_EVENTS_INTERVAL
+        self.max_errors = settings.SCAN_EVENTS_MAX_ERRORS
+        self.last_published = 0.0
+        self.progress: Optional[Dict] = None
+        self.changed = False
+        # Pages checked since the last event: url and findings
+        self.pages: List[Dict] = []
+    
+    def page_findings(self, findings: List[Dict]) -> List[Dict]:
+        return [
+            {
+                'error_type': fields['error_type'].value,
+                'severity': fields['severity'].value,
+                'message': fields['message'],
+            }
+            for fields in findings[:self.max_errors]
+        ]
+    
+    def add_page(self, url: str, findings: List[Dict]) -> None:
+        """Record a checked page and its findings (Error fields)."""
+        self.pages.append({
+            'url': url,
+            'errors': len(findings),
+            'findings': self.page_findings(findings),
+        })
+    
+    def record(self, progress: Dict, url: Optional[str] = None, findings: Optional[List[Dict]] = None) -> None:
+        """Record the scan's progress (and a checked page)."""
+        self.progress = {'status': 'running', **progress}
+        self.changed = True
+        if url is not None:
+            self.add_page(url, findings or [])
+    
+    @property
+    def due(self) -> bool:
+        return time.monotonic() - self.last_published >= self.interval
+    
+    def update(self, progress: Dict, url: Optional[str] = None, findings: Optional[List[Dict]] = None) -> None:
+        """Record the scan's progress (and a checked page); publish if due."""
+        self.record(progress, url, findings)
+        if self.due:
+            self.flush()
+    
+    async def update_async(
+        self,
+        progress: Dict,
+        url: Optional[str] = None,
+        findings: Optional[List[Dict]] = None,
+    ) -> None:
+        """update() from an event loop."""
+        self.record(progress, url, findings)
+        if self.due:
+            await asyncio.to_thread(self.flush)
+    
+    def flush(self) -> None:
+        """Publish the recorded progress now, if it changed since the last event."""
+        if not self.changed:
+            return
+        self.events.publish(self.scan_session_id, 'progress', {**self.progress, 'pages': self.pages})
+        self.pages = []
+        self.changed = False
+        self.last_published = time.monotonic()
+
+
+# Shared by all scans of a process
+scan_events = ScanEvents()
@@ -0,0 +1,29 @@
+import hashlib
+from datetime import datetime, timedelta
+
+
+# Scheduled scan times are counted from this (naive UTC, like the rest of
+# the scan timestamps)
+EPOCH = datetime(1970, 1, 1)
+
+
+def schedule_offset(website_id: int, interval_hours: int) -> int:
+    """
+    Seconds from the start of each interval to the website's scan.
+    
+    A hash of the website's id, spread uniformly over the interval: daily
+    scans of many websites are spread across the day, weekly ones across
+    the week, instead of all starting at midnight. The offset is stable,
+    so a website is always scanned at the same time of its interval.
+    """
+    digest = hashlib.sha256(f"website:{website_id}".encode()).hexdigest()
+    return int(digest[:12], 16) % (interval_hours * 3600)
+
+
+def next_scan_time(website_id: int, interval_hours: int, after: datetime) -> datetime:
+    """The website's first scheduled scan time after a (naive UTC) time."""
+    interval = interval_hours * 3600
+    offset = schedule_offset(website_id, interval_hours)
+    elapsed = int((after - EPOCH).total_seconds())
+    intervals = (elapsed - offset) // interval + 1
+    return EPOCH + timedelta(seconds=offset + intervals * interval)
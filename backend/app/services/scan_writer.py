@@ -0,0 +1,139 @@
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from sqlalchemy import insert, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models import Error, Page, ScanSession
+
+
+class ScanWriter:
+    """
+    Writes the pages and findings of a scan to the database in batches.
+    
+    Pages are buffered until SCAN_WRITE_BATCH_PAGES of them are ready, then
+    inserted with one multi-row INSERT ... RETURNING id, their findings
+    (and findings for pages written earlier) with one multi-row INSERT into
+    the errors table, bypassing the per-object ORM unit of work, and the
+    scan's progress counters with one UPDATE, all in one transaction.
+    
+    Findings for pages not written yet are kept until the page is written.
+    Without count_pages, written pages do not count as processed; they
+    are counted when a later writer reports them checked (fan-out scans).
+    The writer is not thread-safe: a scan must not use it from two threads
+    at once.
+    """
+    
+    PAGE_COLUMNS = (
+        'url', 'title', 'status_code', 'html_content', 'text_content',
+        'meta_description', 'meta_keywords', 'has_favicon', 'depth', 'language_bytes',
+        'ttfb_ms', 'download_ms', 'transfer_size', 'content_size', 'redirect_count', 'content_encoding',
+        'check_data',
+    )
+    ERROR_COLUMNS = (
+        'error_type', 'severity', 'message', 'context', 'suggestion',
+        'line_number', 'column_number', 'element_path',
+        'link_url', 'link_status_code', 'page_count',
+    )
+    
+    def __init__(
+        self,
+        db: Session,
+        scan_session_id: int,
+        batch_pages: Optional[int] = None,
+        count_pages: bool = True,
+    ):
+        self.db = db
+        self.scan_session_id = scan_session_id
+        self.batch_pages = batch_pages or settings.SCAN_WRITE_BATCH_PAGES
+        self.count_pages = count_pages
+        # Ids of written pages: page index -> id
+        self.page_ids: Dict[int, int] = {}
+        # Pages waiting to be written: (page index, page columns)
+        self.pages: List[tuple] = []
+        # Findings of pages not written yet: page index -> Error fields
+        self.pending_findings: Dict[int, List[Dict]] = defaultdict(list)
+        # Findings of written pages, with page_id
+        self.findings: List[Dict] = []
+        # Pages written earlier and checked since the last flush
+        self.checked_pages = 0
+        # Findings added to the writer, written or not
+        self.findings_added = 0
+    
+    def add_page(self, index: int, page: Dict, findings: Optional[List[Dict]] = None) -> None:
+        """Buffer a page (Page column values) and its findings."""
+        self.pages.append((index, page))
+        self.pending_findings[index].extend(findings or [])
+        self.findings_added += len(findings or [])
+    
+    def add_finding(self, index: int, fields: Dict) -> None:
+        """Buffer a finding (Error column values) for a page."""
+        self.findings_added += 1
+        if index in self.page_ids:
+            self.findings.append({'page_id': self.page_ids[index], **fields})
+        else:
+            self.pending_findings[index].append(fields)
+    
+    def add_checked_page(self, index: int, page_id: int) -> None:
+        """Register a page written earlier, counted as processed at the next flush."""
+        self.page_ids[index] = page_id
+        self.checked_pages += 1
+    
+    @property
+    def batch_full(self) -> bool:
+        return len(self.pages) >= self.batch_pages
+    
+    def page_row(self, page: Dict) -> Dict:
+        row = {column: page.get(column) for column in self.PAGE_COLUMNS}
+        row['scan_session_id'] = self.scan_session_id
+        row['has_favicon'] = bool(row['has_favicon'])
+        row['depth'] = row['depth'] or 0
+        return row
+    
+    def error_row(self, fields: Dict) -> Dict:
+        row = {column: fields.get(column) for column in self.ERROR_COLUMNS}
+        row['page_id'] = fields['page_id']
+        return row
+    
+    def flush(self) -> Dict:
+        """
+        Write buffered pages and findings in one transaction.
+        
+        Returns the scan's progress counters after the write: dict with
+        pages_found, pages_processed and errors_found.
+        """
+        pages, self.pages = self.pages, []
+        processed = (len(pages) if self.count_pages else 0) + self.checked_pages
+        self.checked_pages = 0
+        
+        if pages:
+            page_ids = self.db.execute(
+                insert(Page).returning(Page.id, sort_by_parameter_order=True),
+                [self.page_row(page) for _, page in pages],
+            ).scalars().all()
+            
+            for (index, _), page_id in zip(pages, page_ids):
+                self.page_ids[index] = page_id
+                for fields in self.pending_findings.pop(index, []):
+                    self.findings.append({'page_id': page_id, **fields})
+        
+        findings, self.findings = self.findings, []
+        if findings:
+            self.db.execute(
+                insert(Error.__table__),
+                [self.error_row(fields) for fields in findings],
+            )
+        
+        progress = self.db.execute(
+            update(ScanSession)
+            .where(ScanSession.id == self.scan_session_id)
+            .values(
+                pages_processed=ScanSession.pages_processed + processed,
+                errors_found=ScanSession.errors_found + len(findings),
+            )
+            .returning(ScanSession.pages_found, ScanSession.pages_processed, ScanSession.errors_found)
+        ).one()
+        self.db.commit()
+        
+        return dict(progress._mapping)
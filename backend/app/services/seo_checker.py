@@ -1,15 +1,24 @@
+import asyncio
 import httpx
 from typing import Dict, List, Optional
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
 from app.core.config import settings
+from app.services.host_cache import host_info_cache
 
 
 class SEOCheckerService:
-    """Service for checking SEO-related issues."""
+    """
+    Service for checking SEO-related issues.
     
-    def __init__(self):
+    Host-level results (robots.txt, /favicon.ico) are cached per instance,
+    so one instance should be used for all pages of a scan.
+    """
+    
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
         self.timeout = settings.REQUEST_TIMEOUT
+        self.client = client
+        self.host_info: Dict[str, Dict] = {}  # origin -> get_host_info() result
     
     def check_favicon(self, html_content: str, base_url: str) -> Dict:
         """
@@ -39,55 +48,84 @@ class SEOCheckerService:
             'method': None,
         }
     
-    async def check_favicon_file(self, base_url: str) -> bool:
-        """Check if /favicon.ico exists."""
+    def origin(self, base_url: str) -> str:
         parsed = urlparse(base_url)
-        favicon_url = f"{parsed.scheme}://{parsed.netloc}/favicon.ico"
+        return f"{parsed.scheme}://{parsed.netloc}"
+    
+    async def get_host_info(self, base_url: str) -> Dict:
+        """
+        Host-level probes: robots.txt, /favicon.ico and sitemap presence.
         
+        The probes are sent once per host through one client (the shared
+        client, if the service has one) and cached for the scan and in Redis.
+        Redis is used from a worker thread, so a slow or unavailable Redis
+        does not block the scan's other requests.
+        """
+        origin = self.origin(base_url)
+        if origin in self.host_info:
+            return self.host_info[origin]
+        
+        info = await asyncio.to_thread(host_info_cache.get, origin)
+        if info is None:
+            if self.client is not None:
+                info = await self.probe_host(self.client, origin)
+            else:
+                async with httpx.AsyncClient(timeout=self.timeout) as client:
+                    info = await self.probe_host(client, origin)
+            
+            # Failed requests are retried by the next scan
+            if 'error' not in info['robots']:
+                await asyncio.to_thread(host_info_cache.set, origin, info)
+        
+        self.host_info[origin] = info
+        return info
+    
+    async def probe_host(self, client: httpx.AsyncClient, origin: str) -> Dict:
+        robots, has_favicon_file = await asyncio.gather(
+            self.fetch_robots_txt(client, origin),
+            self.fetch_favicon_file(client, origin),
+        )
+        return {
+            'robots': robots,
+            'has_favicon_file': has_favicon_file,
+            'has_sitemap': robots.get('has_sitemap', False),
+        }
+    
+    async def fetch_favicon_file(self, client: httpx.AsyncClient, origin: str) -> bool:
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.head(favicon_url)
-                return response.status_code == 200
+            response = await client.head(f"{origin}/favicon.ico")
+            return response.status_code == 200
         except Exception:
             return False
     
-    async def check_robots_txt(self, base_url: str) -> Dict:
-        """
-        Check robots.txt file.
-        
-        Checks:
-        - If file exists
-        - If site is open for robots (not completely disallowed)
-        """
-        parsed = urlparse(base_url)
-        robots_url = f"{parsed.scheme}://{parsed.netloc}/robots.txt"
+    async def fetch_robots_txt(self, client: httpx.AsyncClient, origin: str) -> Dict:
+        robots_url = f"{origin}/robots.txt"
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(robots_url)
+            response = await client.get(robots_url)
+            
+            if response.status_code == 200:
+                content = response.text
+                
+                # Check if all robots are disallowed
+                is_blocked = 'User-agent: *' in content and 'Disallow: /' in content
+                
+                # Check for sitemap
+                has_sitemap = 'Sitemap:' in content
                 
-                if response.status_code == 200:
-                    content = response.text
-                    
-                    # Check if all robots are disallowed
-                    is_blocked = 'User-agent: *' in content and 'Disallow: /' in content
-                    
-                    # Check for sitemap
-                    has_sitemap = 'Sitemap:' in content
-                    
-                    return {
-                        'exists': True,
-                        'url': robots_url,
-                        'is_blocked_for_robots': is_blocked,
-                        'has_sitemap': has_sitemap,
-                        'content': content[:500],  # First 500 chars
-                    }
-                else:
-                    return {
-                        'exists': False,
-                        'url': robots_url,
-                        'status_code': response.status_code,
-                    }
+                return {
+                    'exists': True,
+                    'url': robots_url,
+                    'is_blocked_for_robots': is_blocked,
+                    'has_sitemap': has_sitemap,
+                    'content': content[:500],  # First 500 chars
+                }
+            else:
+                return {
+                    'exists': False,
+                    'url': robots_url,
+                    'status_code': response.status_code,
+                }
         except Exception as e:
             return {
                 'exists': False,
@@ -95,6 +133,20 @@ class SEOCheckerService:
                 'error': str(e),
             }
     
+    async def check_favicon_file(self, base_url: str) -> bool:
+        """Check if /favicon.ico exists."""
+        return (await self.get_host_info(base_url))['has_favicon_file']
+    
+    async def check_robots_txt(self, base_url: str) -> Dict:
+        """
+        Check robots.txt file.
+        
+        Checks:
+        - If file exists
+        - If site is open for robots (not completely disallowed)
+        """
+        return (await self.get_host_info(base_url))['robots']
+    
     def check_meta_tags(self, html_content: str) -> Dict:
         """
         Check important meta tags.
@@ -172,12 +224,14 @@ class SEOCheckerService:
             errors.append({
                 'message': f'Занадто короткий title ({meta["title_length"]} символів)',
                 'suggestion': 'Рекомендована довжина: 30-60 символів',
+                'element': 'title|',
                 'severity': 'warning',
             })
         elif meta['title_length'] > 60:
             errors.append({
                 'message': f'Занадто довгий title ({meta["title_length"]} символів)',
                 'suggestion': 'Рекомендована довжина: 30-60 символів',
+                'element': 'title|',
                 'severity': 'warning',
             })
         
@@ -191,12 +245,14 @@ class SEOCheckerService:
             errors.append({
                 'message': f'Занадто короткий meta description ({meta["description_length"]} символів)',
                 'suggestion': 'Рекомендована довжина: 120-160 символів',
+                'element': 'meta|description',
                 'severity': 'info',
             })
         elif meta['description_length'] > 160:
             errors.append({
                 'message': f'Занадто довгий meta description ({meta["description_length"]} символів)',
                 'suggestion': 'Рекомендована довжина: 120-160 символів',
+                'element': 'meta|description',
                 'severity': 'info',
             })
         
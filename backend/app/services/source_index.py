@@ -0,0 +1,75 @@
+import re
+from bisect import bisect_right
+from typing import Dict, List, Optional, Tuple
+
+from bs4 import BeautifulSoup
+
+
+class SourceIndex:
+    """
+    Maps positions in a page's source to line and column numbers.
+    
+    The start offset of every line is computed once per page, so each
+    lookup is a binary search. The index also records where the elements
+    checkers report on (links, images, scripts, meta tags) start, so
+    findings can point to the exact place in the page source.
+    """
+    
+    # Elements located in the source, and the attribute identifying each
+    ELEMENT_KEYS = {
+        'a': 'href',
+        'img': 'src',
+        'script': 'src',
+        'link': 'href',
+        'meta': 'name',
+        'title': None,
+        'h1': None,
+    }
+    
+    def __init__(self, source: str):
+        self.source = source
+        self.line_starts = [0] + [m.end() for m in re.finditer('\n', source)]
+        self._tag_patterns = {
+            tag: re.compile(rf'<{tag}\b', re.IGNORECASE) for tag in self.ELEMENT_KEYS
+        }
+    
+    def location(self, offset: int) -> Tuple[int, int]:
+        """Line and column (both 1-based) of an offset in the source."""
+        line = bisect_right(self.line_starts, offset)
+        return line, offset - self.line_starts[line - 1] + 1
+    
+    def find(self, text: str, start: int = 0) -> int:
+        """Offset of text in the source at or after start, or -1."""
+        return self.source.find(text, start)
+    
+    @classmethod
+    def element_key(cls, tag: str, value: Optional[str] = None) -> str:
+        """Key of an element in element_locations()."""
+        return f"{tag}|{value or ''}"
+    
+    def element_locations(self, soup: BeautifulSoup) -> Dict[str, List[int]]:
+        """
+        Locate elements of the page in the source.
+        
+        Elements are matched with the source in document order. Returns dict
+        element key (tag and identifying attribute, see element_key()) ->
+        [line, column] of the first element with that key.
+        """
+        locations = {}
+        cursor = 0
+        
+        for element in soup.find_all(list(self.ELEMENT_KEYS)):
+            match = self._tag_patterns[element.name].search(self.source, cursor)
+            if not match:
+                continue
+            cursor = match.end()
+            
+            attribute = self.ELEMENT_KEYS[element.name]
+            value = element.get(attribute) if attribute else None
+            if element.name == 'meta' and not value:
+                value = element.get('property') or ('charset' if element.get('charset') else None)
+            key = self.element_key(element.name, value)
+            if key not in locations:
+                locations[key] = list(self.location(match.start()))
+        
+        return locations
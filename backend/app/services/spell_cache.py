@@ -0,0 +1,99 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional
+
+from app.core.config import settings
+from app.core.redis_client import OptionalRedis
+
+
+class SpellCheckCache:
+    """
+    Cache of LanguageTool results per sentence.
+    
+    Results are kept in an in-process LRU and in Redis (with TTL), keyed by a
+    hash of the sentence, the language and the LanguageTool version, so text
+    repeated across pages and rescans (menus, footers, legal text) is sent to
+    LanguageTool only once. Cached matches have offsets relative to the
+    sentence.
+    """
+    
+    KEY_PREFIX = "spellcheck:"
+    
+    def __init__(self, language: str = 'uk-UA', max_size: Optional[int] = None):
+        self.language = language
+        self.max_size = max_size or settings.SPELL_CACHE_SIZE
+        self.local: "OrderedDict[str, List[Dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.redis = OptionalRedis("Spell-check cache", lambda: settings.SPELL_CACHE_REDIS_ENABLED)
+    
+    def key(self, sentence: str, language: Optional[str] = None) -> str:
+        """Cache key for a sentence."""
+        raw = f"{language or self.language}|{settings.LANGUAGETOOL_VERSION}|{sentence}"
+        return self.KEY_PREFIX + hashlib.sha1(raw.encode('utf-8')).hexdigest()
+    
+    def _remember(self, key: str, matches: List[Dict]) -> None:
+        with self._lock:
+            self.local[key] = matches
+            self.local.move_to_end(key)
+            while len(self.local) > self.max_size:
+                self.local.popitem(last=False)
+    
+    def get_many(self, sentences: Iterable[str], language: Optional[str] = None) -> Dict[str, List[Dict]]:
+        """
+        Look up cached results.
+        
+        Returns dict sentence -> matches for the sentences found in the cache.
+        """
+        found = {}
+        missing = {}
+        
+        with self._lock:
+            for sentence in sentences:
+                key = self.key(sentence, language)
+                if key in self.local:
+                    self.local.move_to_end(key)
+                    found[sentence] = self.local[key]
+                else:
+                    missing[key] = sentence
+        
+        client = self.redis.client if missing else None
+        if client is not None:
+            keys = list(missing)
+            try:
+                values = client.mget(keys)
+            except Exception as e:
+                print(f"⚠️ Spell-check cache read failed: {e}")
+                values = []
+            
+            for key, value in zip(keys, values):
+                if value is not None:
+                    matches = json.loads(value)
+                    found[missing[key]] = matches
+                    self._remember(key, matches)
+        
+        return found
+    
+    def set_many(self, results: Dict[str, List[Dict]], language: Optional[str] = None) -> None:
+        """Store matches for each sentence."""
+        if not results:
+            return
+        
+        keyed = {self.key(sentence, language): matches for sentence, matches in results.items()}
+        for key, matches in keyed.items():
+            self._remember(key, matches)
+        
+        client = self.redis.client
+        if client is not None:
+            try:
+                pipe = client.pipeline(transaction=False)
+                for key, matches in keyed.items():
+                    pipe.setex(key, settings.SPELL_CACHE_TTL, json.dumps(matches, ensure_ascii=False))
+                pipe.execute()
+            except Exception as e:
+                print(f"⚠️ Spell-check cache write failed: {e}")
+
+
+# Shared by all scans of a worker process
+spell_check_cache = SpellCheckCache()
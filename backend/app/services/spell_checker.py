@@ -1,106 +1,280 @@
-import language_tool_python
-from typing import List, Dict, Optional
+from bisect import bisect_right
+from typing import List, Dict, Optional, Tuple
 from app.core.config import settings
+from app.services.language_tool import get_language_tool_manager
+from app.services.language_tool_client import LanguageToolClient
+from app.services.spell_cache import spell_check_cache
+from app.services.spell_prefilter import spell_prefilter
+from app.services.text_chunker import TextChunker
+import asyncio
 import re
 
 
 class SpellCheckerService:
     """Service for checking spelling and grammar in Ukrainian text."""
     
-    def __init__(self):
+    def __init__(self, language: str = 'uk-UA'):
+        self.language = language
         self.tool = None
+        self.manager = get_language_tool_manager(language)
         self.enabled = settings.LANGUAGETOOL_ENABLED
-        
+        # Talk to a LanguageTool HTTP server instead of the in-process one
+        self.remote = bool(settings.LANGUAGETOOL_URL)
+        self.cache = spell_check_cache if settings.SPELL_CACHE_ENABLED else None
+        self.chunker = TextChunker()
+    
     def __enter__(self):
-        if self.enabled:
-            try:
-                # Initialize LanguageTool for Ukrainian
-                self.tool = language_tool_python.LanguageTool('uk-UA')
-                print("✅ LanguageTool initialized successfully")
-            except Exception as e:
-                print(f"⚠️ LanguageTool initialization failed: {e}")
+        if self.enabled and not self.remote:
+            # Reuse the worker-wide LanguageTool instead of starting a JVM
+            self.tool = self.manager.get_tool()
+            if self.tool is None:
                 print("   Continuing without spell checking...")
                 self.enabled = False
-                self.tool = None
         return self
-        
+    
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if self.tool:
-            self.tool.close()
+        # The shared instance is closed on worker shutdown, not here
+        self.tool = None
     
     def clean_text(self, text: str) -> str:
         """Clean text from HTML entities and extra whitespace."""
         # Remove multiple spaces
-        text = re.sub(r'\s+', ' ', text)
+        text = re.sub(r'[^\S\n]+', ' ', text)
+        # Keep single newlines as paragraph (block) boundaries
+        text = re.sub(r' ?\n\s*', '\n', text)
         # Remove leading/trailing whitespace
         text = text.strip()
         return text
     
-    def check_text(self, text: str, whitelist_words: Optional[List[str]] = None) -> List[Dict]:
+    def check_chunk(self, chunk: str) -> List[Dict]:
+        """Check a chunk with the in-process LanguageTool."""
+        matches = self.tool.check(chunk)
+        return [
+            {
+                'message': match.message,
+                'offset': match.offset,
+                'length': match.errorLength,
+                'replacements': match.replacements,
+                'rule_id': match.ruleId,
+                'category': match.category,
+            }
+            for match in matches
+        ]
+    
+    def prepare_pages(
+        self,
+        texts: List[Optional[str]],
+        whitelist_words: Optional[List[str]] = None,
+        full_check: bool = False,
+    ) -> Tuple[List[str], List[List[Tuple[int, str]]], Dict[str, List[Dict]], List[str]]:
+        """
+        Split pages into sentences and look them up in the cache.
+        
+        Unless full_check is set, sentences the dictionary pre-filter
+        considers clean are not sent to LanguageTool.
+        
+        Returns cleaned texts, sentences of each page, known results and
+        the unique sentences that still have to be checked.
+        """
+        cleaned = [self.clean_text(text or '') for text in texts]
+        page_sentences = [
+            self.chunker.split_sentences(text) if len(text) >= 3 else []
+            for text in cleaned
+        ]
+        
+        unique = list(dict.fromkeys(
+            sentence for sentences in page_sentences for _, sentence in sentences
+        ))
+        results = self.cache.get_many(unique, self.language) if self.cache else {}
+        missing = [sentence for sentence in unique if sentence not in results]
+        
+        # The dictionary pre-filter only knows Ukrainian
+        if not full_check and self.language == 'uk-UA':
+            suspicious = spell_prefilter.filter(missing, whitelist_words)
+            if len(suspicious) < len(missing):
+                suspicious_set = set(suspicious)
+                # Clean sentences have no errors; they are not cached so
+                # that a later full check still sends them to LanguageTool
+                for sentence in missing:
+                    if sentence not in suspicious_set:
+                        results[sentence] = []
+                missing = suspicious
+        
+        return cleaned, page_sentences, results, missing
+    
+    def build_errors(
+        self,
+        text: str,
+        sentences: List[Tuple[int, str]],
+        results: Dict[str, List[Dict]],
+        whitelist_lower: List[str],
+    ) -> List[Dict]:
+        """
+        Convert per-sentence matches into error dictionaries for a page.
+        
+        Lines of the text are text blocks; each error records the index of
+        the block it was found in.
+        """
+        errors = []
+        block_starts = [0] + [m.end() for m in re.finditer('\n', text)]
+        
+        for sentence_offset, sentence in sentences:
+            for match in results.get(sentence, []):
+                offset = sentence_offset + match['offset']
+                
+                # Skip if word is in whitelist
+                word = text[offset:offset + match['length']]
+                if word.lower() in whitelist_lower:
+                    continue
+                
+                block_index = bisect_right(block_starts, offset) - 1
+                block_start = block_starts[block_index]
+                block_end = text.find('\n', offset)
+                if block_end < 0:
+                    block_end = len(text)
+                
+                # Get context (50 chars before and after, within the block)
+                start = max(block_start, offset - 50)
+                end = min(block_end, offset + match['length'] + 50)
+                context = text[start:end]
+                
+                replacements = match['replacements']
+                error = {
+                    'message': match['message'],
+                    'context': context,
+                    'suggestion': ', '.join(replacements[:3]) if replacements else None,
+                    'offset': offset,
+                    'length': match['length'],
+                    'rule_id': match['rule_id'],
+                    'category': match['category'],
+                    'block_index': block_index,
+                    'block_offset': offset - block_start,
+                }
+                errors.append(error)
+        
+        return errors
+    
+    def finish_pages(
+        self,
+        cleaned: List[str],
+        page_sentences: List[List[Tuple[int, str]]],
+        results: Dict[str, List[Dict]],
+        new_results: Dict[str, List[Dict]],
+        whitelist_words: Optional[List[str]],
+    ) -> List[List[Dict]]:
+        """Cache newly checked sentences and build per-page errors."""
+        if self.cache:
+            self.cache.set_many(new_results, self.language)
+        results.update(new_results)
+        
+        whitelist_lower = [w.lower() for w in (whitelist_words or [])]
+        return [
+            self.build_errors(text, sentences, results, whitelist_lower)
+            for text, sentences in zip(cleaned, page_sentences)
+        ]
+    
+    def check_text(
+        self,
+        text: str,
+        whitelist_words: Optional[List[str]] = None,
+        full_check: bool = False,
+    ) -> List[Dict]:
         """
         Check text for spelling and grammar errors.
         
         Args:
             text: Text to check
             whitelist_words: List of words to ignore
-            
+            full_check: Send every sentence to LanguageTool (no pre-filter)
+        
         Returns:
             List of error dictionaries
         """
-        if not self.enabled or not self.tool:
-            return []
+        return self.check_pages([text], whitelist_words, full_check)[0]
+    
+    async def check_pages_async(
+        self,
+        texts: List[Optional[str]],
+        whitelist_words: Optional[List[str]] = None,
+        full_check: bool = False,
+    ) -> List[List[Dict]]:
+        """
+        Check several pages on a LanguageTool server.
         
-        # Clean text
-        text = self.clean_text(text)
+        Only sentences missing from the cache are sent; requests share one
+        connection pool and run concurrently up to the client's in-flight limit.
+        """
+        if not self.enabled:
+            return [[] for _ in texts]
         
-        if not text or len(text) < 3:
-            return []
+        cleaned, page_sentences, results, missing = self.prepare_pages(
+            texts, whitelist_words, full_check
+        )
+        chunks = self.chunker.pack(missing)
         
-        # Split into chunks if text is too long (LanguageTool has limits)
-        max_length = 20000
-        if len(text) > max_length:
-            chunks = [text[i:i+max_length] for i in range(0, len(text), max_length)]
-        else:
-            chunks = [text]
+        new_results = {}
+        if chunks:
+            async with LanguageToolClient(language=self.language) as client:
+                responses = await asyncio.gather(
+                    *(client.check(chunk) for chunk, _ in chunks),
+                    return_exceptions=True,
+                )
+            
+            position = 0
+            for (chunk, offsets), matches in zip(chunks, responses):
+                sentences = missing[position:position + len(offsets)]
+                position += len(offsets)
+                if isinstance(matches, Exception):
+                    print(f"Error checking chunk: {matches}")
+                    continue
+                new_results.update(self.chunker.unpack(sentences, offsets, matches))
         
-        errors = []
-        offset = 0
+        return self.finish_pages(cleaned, page_sentences, results, new_results, whitelist_words)
+    
+    def check_pages(
+        self,
+        texts: List[Optional[str]],
+        whitelist_words: Optional[List[str]] = None,
+        full_check: bool = False,
+    ) -> List[List[Dict]]:
+        """
+        Check several pages' text content.
         
-        whitelist_words = whitelist_words or []
-        whitelist_lower = [w.lower() for w in whitelist_words]
+        Text is checked sentence by sentence and results are cached, so text
+        repeated across pages (menus, footers) is sent to LanguageTool once.
         
-        for chunk in chunks:
+        Args:
+            texts: Extracted text of each page
+            whitelist_words: Words to ignore (e.g., brand names, technical terms)
+            full_check: Send every sentence to LanguageTool (no pre-filter)
+        
+        Returns:
+            List of spelling/grammar errors for each page, in the same order
+        """
+        if self.remote:
+            return asyncio.run(self.check_pages_async(texts, whitelist_words, full_check))
+        
+        if not self.enabled or not self.tool:
+            return [[] for _ in texts]
+        
+        cleaned, page_sentences, results, missing = self.prepare_pages(
+            texts, whitelist_words, full_check
+        )
+        
+        new_results = {}
+        position = 0
+        for chunk, offsets in self.chunker.pack(missing):
+            sentences = missing[position:position + len(offsets)]
+            position += len(offsets)
             try:
-                matches = self.tool.check(chunk)
-                
-                for match in matches:
-                    # Skip if word is in whitelist
-                    if match.context.lower() in whitelist_lower:
-                        continue
-                    
-                    # Get context (50 chars before and after)
-                    start = max(0, match.offset - 50)
-                    end = min(len(chunk), match.offset + match.errorLength + 50)
-                    context = chunk[start:end]
-                    
-                    error = {
-                        'message': match.message,
-                        'context': context,
-                        'suggestion': ', '.join(match.replacements[:3]) if match.replacements else None,
-                        'offset': offset + match.offset,
-                        'length': match.errorLength,
-                        'rule_id': match.ruleId,
-                        'category': match.category,
-                    }
-                    errors.append(error)
-                    
+                matches = self.check_chunk(chunk)
             except Exception as e:
                 print(f"Error checking chunk: {e}")
+                self.manager.mark_unhealthy()
                 continue
-            
-            offset += len(chunk)
+            new_results.update(self.chunker.unpack(sentences, offsets, matches))
         
-        return errors
+        return self.finish_pages(cleaned, page_sentences, results, new_results, whitelist_words)
     
     def check_page(self, text_content: str, whitelist_words: Optional[List[str]] = None) -> List[Dict]:
         """
@@ -109,9 +283,8 @@ class SpellCheckerService:
         Args:
             text_content: Extracted text from HTML page
             whitelist_words: Words to ignore (e.g., brand names, technical terms)
-            
+        
         Returns:
             List of spelling/grammar errors
         """
         return self.check_text(text_content, whitelist_words)
-
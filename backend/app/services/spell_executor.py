@@ -0,0 +1,134 @@
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable, Iterator, List, Optional, Tuple
+
+from app.core.config import settings
+from app.services.spell_checker import SpellCheckerService
+
+
+class SpellCheckExecutor:
+    """
+    Runs spell checks for a scan outside of the scan loop.
+    
+    Batches of page texts are sent to the "spellcheck" Celery queue, where
+    several worker processes check them in parallel; results are collected
+    as they complete. At most SPELL_MAX_IN_FLIGHT batches are in flight:
+    when the spell-check workers are saturated, submit() waits for a
+    batch to finish (backpressure) instead of flooding the queue.
+    
+    With SPELL_CHECK_QUEUE_ENABLED off, batches are checked inline. A batch
+    that fails or times out on the queue is revoked and checked inline
+    instead; such fallbacks, and batches that could not be checked at all,
+    are reported by failure_message() so the scan can record them.
+    """
+    
+    POLL_INTERVAL = 0.05  # seconds
+    
+    def __init__(
+        self,
+        whitelist_words: Optional[List[str]] = None,
+        full_check: bool = False,
+        max_in_flight: Optional[int] = None,
+    ):
+        self.whitelist_words = whitelist_words or []
+        self.full_check = full_check
+        self.max_in_flight = max_in_flight or settings.SPELL_MAX_IN_FLIGHT
+        self.use_queue = settings.SPELL_CHECK_QUEUE_ENABLED
+        # key -> (async result, submit time, texts, language)
+        self.in_flight: "OrderedDict[Hashable, Tuple[object, float, List[Optional[str]], str]]" = OrderedDict()
+        self.completed: List[Tuple[Hashable, List[List[Dict]]]] = []
+        # Batches checked inline after failing on the queue, and batches
+        # that could not be checked at all
+        self.fallback_batches = 0
+        self.failed_batches = 0
+        self.errors: List[str] = []
+    
+    def check_inline(self, texts: List[Optional[str]], language: str) -> List[List[Dict]]:
+        with SpellCheckerService(language) as spell_checker:
+            return spell_checker.check_pages(texts, self.whitelist_words, self.full_check)
+    
+    def submit(self, key: Hashable, texts: List[Optional[str]], language: str = 'uk-UA') -> None:
+        """Submit a batch of texts; results are returned under the given key."""
+        if not self.use_queue:
+            self.completed.append((key, self.check_inline(texts, language)))
+            return
+        
+        # Backpressure: wait for a slot
+        while len(self.in_flight) >= self.max_in_flight:
+            self._collect()
+            if len(self.in_flight) >= self.max_in_flight:
+                time.sleep(self.POLL_INTERVAL)
+        
+        # Imported here: the Celery app imports the tasks, which import this module
+        from app.core.celery_app import celery_app
+        
+        result = celery_app.send_task(
+            "check_spelling_batch",
+            args=[texts, self.whitelist_words, self.full_check, language],
+            queue="spellcheck",
+        )
+        self.in_flight[key] = (result, time.monotonic(), texts, language)
+    
+    def _collect(self) -> None:
+        """Move finished batches from in_flight to completed."""
+        for key, (result, submitted_at, texts, language) in list(self.in_flight.items()):
+            timed_out = time.monotonic() - submitted_at > settings.SPELL_CHECK_TIMEOUT
+            if not result.ready() and not timed_out:
+                continue
+            
+            del self.in_flight[key]
+            try:
+                if timed_out and not result.ready():
+                    # Stop the batch on the queue; it is checked here instead
+                    result.revoke(terminate=True)
+                    raise TimeoutError(f"timed out after {settings.SPELL_CHECK_TIMEOUT} s")
+                results = result.get(disable_sync_subtasks=False)
+            except Exception as e:
+                print(f"⚠️ Spell check batch {key} failed on the queue, checking inline: {e}")
+                results = self._fallback(texts, language, e)
+                if results is None:
+                    continue
+            finally:
+                result.forget()
+            self.completed.append((key, results))
+    
+    def _fallback(self, texts: List[Optional[str]], language: str, error: Exception) -> Optional[List[List[Dict]]]:
+        """Check a batch that failed on the queue inline; None if that fails too."""
+        self.errors.append(str(error))
+        try:
+            results = self.check_inline(texts, language)
+        except Exception as e:
+            print(f"⚠️ Inline spell check failed: {e}")
+            self.failed_batches += 1
+            self.errors.append(str(e))
+            return None
+        self.fallback_batches += 1
+        return results
+    
+    def failure_message(self) -> Optional[str]:
+        """Summary of the batches that failed on the queue, or None."""
+        if not self.fallback_batches and not self.failed_batches:
+            return None
+        message = (
+            f"Spell check: {self.fallback_batches + self.failed_batches} batch(es) failed on the "
+            f"spellcheck queue ({self.errors[-1]})"
+        )
+        if self.failed_batches:
+            message += f"; {self.failed_batches} could not be checked inline, their pages have no spelling results"
+        else:
+            message += "; checked inline instead"
+        return message
+    
+    def ready(self) -> List[Tuple[Hashable, List[List[Dict]]]]:
+        """Return batches finished since the last call, without waiting."""
+        self._collect()
+        completed, self.completed = self.completed, []
+        return completed
+    
+    def wait_all(self) -> Iterator[Tuple[Hashable, List[List[Dict]]]]:
+        """Yield the remaining batches as they finish."""
+        while self.in_flight or self.completed:
+            completed = self.ready()
+            if not completed:
+                time.sleep(self.POLL_INTERVAL)
+            yield from completed
@@ -0,0 +1,120 @@
+import os
+import re
+import threading
+from typing import Iterable, List, Optional
+
+from app.core.config import settings
+
+try:
+    import marisa_trie
+except ImportError:  # pragma: no cover - plain text word lists still work
+    marisa_trie = None
+
+
+class SpellPreFilter:
+    """
+    Fast in-process filter deciding which sentences need LanguageTool.
+    
+    A sentence is sent to LanguageTool only if it contains a word missing
+    from the Ukrainian word list (and the site's whitelist) or a pattern
+    that typically triggers grammar/punctuation rules. Most sentences on a
+    commercial site have no errors, so this removes most of the text sent
+    to the JVM.
+    
+    The word list is a marisa-trie file built by scripts/build_wordlist.py
+    and memory-mapped, so all worker processes share one copy; a plain text
+    list (one word per line) is also accepted. Without a word list the
+    filter is disabled and every sentence is checked.
+    """
+    
+    WORD = re.compile(r"[A-Za-zА-ЯІЇЄҐа-яіїєґ'’ʼ]+(?:-[A-Za-zА-ЯІЇЄҐа-яіїєґ'’ʼ]+)*")
+    CYRILLIC = re.compile(r'[А-ЯІЇЄҐа-яіїєґ]')
+    APOSTROPHES = str.maketrans({'’': "'", 'ʼ': "'"})
+    
+    # Patterns that trigger LanguageTool grammar, punctuation or typography
+    # rules even when every word is spelled correctly
+    SUSPICIOUS_PATTERNS = [
+        r'[ыэъёЫЭЪЁ]',  # Russian letters
+        r'[а-яіїєґ][a-z]|[a-z][а-яіїєґ]',  # Latin homoglyphs inside words
+        r'\b(\w+)\s+\1\b',  # repeated word
+        r'\s[,.;:!?]',  # space before punctuation
+        r'[,;:][^\s\d»")\]]',  # missing space after punctuation
+        r'[,;:!?]{2,}|(?<!\.)\.\.(?!\.)',  # doubled punctuation
+        r'\s-\s',  # hyphen instead of dash
+        r'"',  # straight quotes instead of «»
+        r'^[а-яіїєґ]',  # sentence starts with a lowercase letter
+    ]
+    
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or settings.SPELL_WORDLIST_PATH
+        self.words = None
+        self.loaded = False
+        self.suspicious = re.compile('|'.join(self.SUSPICIOUS_PATTERNS))
+        self._lock = threading.Lock()
+    
+    def load(self) -> None:
+        """Load (memory-map) the word list once per process."""
+        with self._lock:
+            if self.loaded:
+                return
+            self.loaded = True
+            
+            if not self.path or not os.path.exists(self.path):
+                print(f"⚠️ Word list {self.path} not found, spell pre-filter disabled")
+                return
+            
+            try:
+                if self.path.endswith('.marisa') and marisa_trie is not None:
+                    trie = marisa_trie.Trie()
+                    trie.mmap(self.path)
+                    self.words = trie
+                else:
+                    with open(self.path, encoding='utf-8') as f:
+                        self.words = {line.strip().lower() for line in f if line.strip()}
+                print(f"✅ Spell pre-filter word list loaded: {self.path}")
+            except Exception as e:
+                print(f"⚠️ Word list loading failed: {e}")
+                self.words = None
+    
+    @property
+    def enabled(self) -> bool:
+        if not settings.SPELL_PREFILTER_ENABLED:
+            return False
+        if not self.loaded:
+            self.load()
+        return self.words is not None
+    
+    def is_known(self, word: str, whitelist_lower: Iterable[str]) -> bool:
+        """Check a word against the word list and whitelist."""
+        word = word.translate(self.APOSTROPHES).lower()
+        if word in self.words or word in whitelist_lower:
+            return True
+        # Compound words: accept if every part is known
+        if '-' in word:
+            return all(part in self.words or part in whitelist_lower for part in word.split('-'))
+        return False
+    
+    def needs_check(self, sentence: str, whitelist_lower: Iterable[str] = ()) -> bool:
+        """Check if a sentence should be sent to LanguageTool."""
+        if self.suspicious.search(sentence):
+            return True
+        
+        for word in self.WORD.findall(sentence):
+            # Only Ukrainian words are checked against the dictionary
+            if not self.CYRILLIC.search(word):
+                continue
+            if not self.is_known(word, whitelist_lower):
+                return True
+        
+        return False
+    
+    def filter(self, sentences: List[str], whitelist_words: Optional[List[str]] = None) -> List[str]:
+        """Return the sentences that need a LanguageTool check."""
+        if not self.enabled:
+            return sentences
+        whitelist_lower = {w.lower() for w in (whitelist_words or [])}
+        return [s for s in sentences if self.needs_check(s, whitelist_lower)]
+
+
+# Shared by all scans of a worker process
+spell_prefilter = SpellPreFilter()
@@ -0,0 +1,139 @@
+import re
+from bisect import bisect_right
+from typing import Dict, List, Optional, Tuple
+
+from app.core.config import settings
+
+
+class TextChunker:
+    """
+    Splits text into sentences and packs them into LanguageTool requests.
+    
+    Text is split on paragraph and sentence boundaries (never inside a word),
+    and segments from any number of pages are packed into requests close to
+    a target size, joined with a separator. The offset of every segment in
+    its request is kept, so matches can be mapped back to the segment and
+    from there to the page.
+    """
+    
+    # Separator between segments packed into one request
+    SEPARATOR = '\n\n'
+    
+    # Whitespace after sentence-ending punctuation followed by a capital letter,
+    # digit or opening quote/bracket
+    SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?…])\s+(?=[«"„(\[]?[A-ZА-ЯІЇЄҐ0-9])')
+    
+    # Short lowercase abbreviation before a period (м., вул., буд., р.)
+    ABBREVIATION = re.compile(r'(?:^|[\s(])[a-zа-яіїєґ]{1,4}\.$')
+    
+    PARAGRAPH_BOUNDARY = re.compile(r'\n+')
+    
+    def __init__(self, target_size: Optional[int] = None, max_size: Optional[int] = None):
+        self.target_size = target_size or settings.LANGUAGETOOL_CHUNK_SIZE
+        self.max_size = max_size or settings.LANGUAGETOOL_MAX_CHUNK_LENGTH
+    
+    def split_long(self, text: str, offset: int) -> List[Tuple[int, str]]:
+        """Split a segment longer than max_size at word boundaries."""
+        segments = []
+        start = 0
+        
+        while len(text) - start > self.max_size:
+            end = text.rfind(' ', start, start + self.max_size)
+            if end <= start:
+                end = start + self.max_size  # no space at all: hard cut
+            segments.append((offset + start, text[start:end]))
+            start = end
+            while start < len(text) and text[start] == ' ':
+                start += 1
+        
+        if start < len(text):
+            segments.append((offset + start, text[start:]))
+        
+        return segments
+    
+    def split_paragraph(self, text: str, offset: int) -> List[Tuple[int, str]]:
+        """Split a paragraph into sentences."""
+        sentences = []
+        start = 0
+        
+        for boundary in self.SENTENCE_BOUNDARY.finditer(text):
+            # Don't split after abbreviations like "м." or "вул."
+            if self.ABBREVIATION.search(text[max(start, boundary.start() - 6):boundary.start()]):
+                continue
+            sentences.extend(self.split_long(text[start:boundary.start()], offset + start))
+            start = boundary.end()
+        
+        if start < len(text):
+            sentences.extend(self.split_long(text[start:], offset + start))
+        
+        return sentences
+    
+    def split_sentences(self, text: str) -> List[Tuple[int, str]]:
+        """
+        Split text into sentences.
+        
+        Newlines are treated as paragraph (block) boundaries.
+        
+        Returns list of (offset in text, sentence) tuples.
+        """
+        sentences = []
+        start = 0
+        
+        for boundary in self.PARAGRAPH_BOUNDARY.finditer(text):
+            if boundary.start() > start:
+                sentences.extend(self.split_paragraph(text[start:boundary.start()], start))
+            start = boundary.end()
+        
+        if start < len(text):
+            sentences.extend(self.split_paragraph(text[start:], start))
+        
+        return sentences
+    
+    def pack(self, segments: List[str]) -> List[Tuple[str, List[int]]]:
+        """
+        Pack segments (from any number of pages) into requests near target_size.
+        
+        Returns list of (request text, offset of each segment in the request).
+        """
+        chunks = []
+        parts: List[str] = []
+        offsets: List[int] = []
+        length = 0
+        
+        for segment in segments:
+            if parts and length + len(self.SEPARATOR) + len(segment) > self.target_size:
+                chunks.append((self.SEPARATOR.join(parts), offsets))
+                parts, offsets, length = [], [], 0
+            
+            if parts:
+                length += len(self.SEPARATOR)
+            offsets.append(length)
+            parts.append(segment)
+            length += len(segment)
+        
+        if parts:
+            chunks.append((self.SEPARATOR.join(parts), offsets))
+        
+        return chunks
+    
+    def unpack(
+        self,
+        segments: List[str],
+        offsets: List[int],
+        matches: List[Dict],
+    ) -> Dict[str, List[Dict]]:
+        """Split matches of a packed request back into per-segment matches."""
+        results = {segment: [] for segment in segments}
+        
+        for match in matches:
+            index = bisect_right(offsets, match['offset']) - 1
+            if index < 0:
+                continue
+            segment = segments[index]
+            relative = match['offset'] - offsets[index]
+            # Drop matches that span the separator
+            if relative + match['length'] > len(segment):
+                continue
+            results[segment].append({**match, 'offset': relative})
+        
+        return results
@@ -0,0 +1,168 @@
+import re
+from bisect import bisect_right
+from typing import Dict, List, Optional, Tuple
+
+from bs4 import BeautifulSoup, NavigableString, Comment
+
+from app.services.source_index import SourceIndex
+
+
+class TextExtractor:
+    """
+    Splits a parsed page into typed text blocks.
+    
+    Text nodes are grouped by their nearest block-level element (paragraph,
+    heading, list item, table cell...), so headings, menu items and cells
+    are never glued into one sentence. Each block records its tag, a DOM
+    path and where its text is in the page source. Extraction runs once
+    per page in the crawler; all text checks consume the blocks.
+    """
+    
+    # Elements that start a new text block
+    BLOCK_TAGS = {
+        'address', 'article', 'aside', 'blockquote', 'body', 'dd', 'div', 'dl', 'dt',
+        'fieldset', 'figcaption', 'figure', 'footer', 'form', 'h1', 'h2', 'h3', 'h4',
+        'h5', 'h6', 'header', 'li', 'main', 'nav', 'ol', 'p', 'pre', 'section',
+        'table', 'td', 'th', 'tr', 'ul',
+    }
+    
+    SKIP_TAGS = {'script', 'style', 'noscript', 'template', 'head', 'title'}
+    
+    # Leading part of a text node that appears verbatim in the source
+    # (stops at characters that may be written as entities)
+    SOURCE_PREFIX = re.compile(r'[^&<>"\'\s][^&<>"\']{0,39}')
+    
+    def iter_blocks(self, soup: BeautifulSoup) -> List[Tuple[object, List[NavigableString]]]:
+        """
+        Group text nodes by their nearest block-level ancestor.
+        
+        Returns list of (block element, text nodes) in document order.
+        """
+        blocks: Dict[int, Tuple[object, List[NavigableString]]] = {}
+        
+        for string in soup.find_all(string=True):
+            if isinstance(string, Comment) or not string.strip():
+                continue
+            
+            block = None
+            skip = False
+            for parent in string.parents:
+                if parent.name in self.SKIP_TAGS:
+                    skip = True
+                    break
+                if block is None and parent.name in self.BLOCK_TAGS:
+                    block = parent
+            if skip or block is None:
+                continue
+            
+            blocks.setdefault(id(block), (block, []))[1].append(string)
+        
+        return list(blocks.values())
+    
+    @staticmethod
+    def block_text(strings: List[NavigableString]) -> str:
+        """Text of a block with whitespace collapsed."""
+        return re.sub(r'\s+', ' ', ' '.join(s.strip() for s in strings)).strip()
+    
+    @staticmethod
+    def dom_path(element, positions: Optional[Dict] = None) -> str:
+        """
+        CSS-like path of an element, e.g. "body > div:nth-of-type(2) > p".
+        
+        positions caches the nth-of-type positions of the children of each
+        parent (one pass over its children per tag name); pass the same dict
+        for all elements of a page so long sibling lists are not rescanned.
+        """
+        positions = {} if positions is None else positions
+        parts = []
+        while element is not None and element.name not in (None, '[document]', 'html'):
+            part = element.name
+            if element.get('id'):
+                part += f"#{element['id']}"
+                parts.append(part)
+                break
+            
+            parent = element.parent
+            key = (id(parent), element.name)
+            if key not in positions:
+                # Keyed by id(): tags compare equal by content
+                siblings = parent.find_all(element.name, recursive=False)
+                positions[key] = ({id(sibling): n for n, sibling in enumerate(siblings, 1)}, len(siblings))
+            siblings, count = positions[key]
+            if count > 1:
+                part += f":nth-of-type({siblings[id(element)]})"
+            parts.append(part)
+            element = parent
+        return ' > '.join(reversed(parts))
+    
+    def extract(self, soup: BeautifulSoup, index: Optional[SourceIndex] = None) -> List[Dict]:
+        """
+        Extract the text blocks of a page.
+        
+        Args:
+            soup: Parsed page
+            index: Index of the page source, used to locate the blocks
+        
+        Returns:
+            List of blocks (tag, path, text, line, column, spans) in document
+            order; spans map offsets in the text to source positions (see
+            locate())
+        """
+        # Text nodes appear in the source in document order, so the search
+        # for each node continues from the previous one
+        cursor = 0
+        blocks = []
+        positions: Dict = {}
+        
+        for element, strings in self.iter_blocks(soup):
+            parts = []
+            spans = []
+            length = 0
+            
+            for string in strings:
+                raw = string.strip()
+                position = -1
+                if index is not None:
+                    prefix = self.SOURCE_PREFIX.search(raw)
+                    position = index.find(prefix.group(0), cursor) - prefix.start() if prefix else -1
+                    if position >= cursor:
+                        cursor = position
+                    else:
+                        position = -1
+                
+                # One span per source line of the node
+                line_offset = 0
+                for line in raw.split('\n'):
+                    piece = re.sub(r'\s+', ' ', line).strip()
+                    if piece:
+                        if position >= 0:
+                            source_offset = position + raw.find(piece[:1], line_offset)
+                            spans.append([length, *index.location(source_offset)])
+                        parts.append(piece)
+                        length += len(piece) + 1
+                    line_offset += len(line) + 1
+            
+            if not parts:
+                continue
+            
+            blocks.append({
+                'tag': element.name,
+                'path': self.dom_path(element, positions),
+                'text': ' '.join(parts),
+                'line': spans[0][1] if spans else None,
+                'column': spans[0][2] if spans else None,
+                'spans': spans,
+            })
+        
+        return blocks
+    
+    @staticmethod
+    def locate(block: Dict, offset: int) -> Tuple[Optional[int], Optional[int]]:
+        """Source line and column of an offset in a block's text."""
+        spans = block.get('spans')
+        if not spans:
+            return block.get('line'), block.get('column')
+        
+        position = bisect_right([span[0] for span in spans], offset) - 1
+        text_offset, line, column = spans[max(position, 0)]
+        return line, column + max(offset - text_offset, 0)
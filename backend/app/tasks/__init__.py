@@ -1,4 +1,13 @@
 from app.tasks.scan_website import scan_website_task
+from app.tasks.check_pages import check_pages_task, finish_scan_task, fail_scan_task
+from app.tasks.schedule_scans import schedule_scans_task
+from app.tasks.spell_check import check_spelling_batch_task
 
-__all__ = ["scan_website_task"]
-
+__all__ = [
+    "scan_website_task",
+    "check_pages_task",
+    "finish_scan_task",
+    "fail_scan_task",
+    "schedule_scans_task",
+    "check_spelling_batch_task",
+]
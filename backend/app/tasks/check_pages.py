@@ -0,0 +1,181 @@
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+import asyncio
+import httpx
+
+from sqlalchemy import func, update
+
+from app.core.celery_app import celery_app
+from app.core.config import settings
+from app.core.database import get_sync_db
+from app.models import Error, Page, ScanSession
+from app.models.scan_session import ScanStatus
+from app.services.page_checkers import PageCheckRunner
+from app.services.scan_writer import ScanWriter
+from app.services.scan_events import ScanProgressPublisher, scan_events
+from app.services.spell_executor import SpellCheckExecutor
+from app.tasks.scan_website import (
+    language_texts,
+    mark_scan_failed,
+    record_scan_warning,
+    scan_progress,
+    spelling_findings,
+    submit_spell_check,
+)
+
+
+@celery_app.task(name="check_pages")
+def check_pages_task(scan_session_id: int, page_ids: List[int]) -> Dict:
+    """
+    Run the per-page checks on a batch of pages of a fan-out scan.
+    
+    Pages are written by the scan task with their check_data; spelling,
+    addresses, phones, links and SEO are checked here, and the findings,
+    the progress counters and the cleared check_data are written in one
+    transaction. Pages already checked (by an earlier attempt) are skipped.
+    """
+    db = next(get_sync_db())
+    try:
+        scan_session = db.query(ScanSession).get(scan_session_id)
+        if not scan_session or scan_session.status != ScanStatus.RUNNING:
+            return {'pages': 0, 'errors': 0}
+        website = scan_session.website
+        
+        pages = (
+            db.query(Page.id, Page.url, Page.depth, Page.html_content, Page.check_data)
+            .filter(Page.id.in_(page_ids), Page.check_data.isnot(None))
+            .order_by(Page.id)
+            .all()
+        )
+        if not pages:
+            return {'pages': 0, 'errors': 0}
+        
+        findings, spell_check_failure = asyncio.run(check_pages(pages, website.url, website.preferences or {}))
+        
+        record_scan_warning(db, scan_session_id, spell_check_failure)
+        writer = ScanWriter(db, scan_session_id)
+        for page in pages:
+            writer.add_checked_page(page.id, page.id)
+            for fields in findings[page.id]:
+                writer.add_finding(page.id, fields)
+        db.execute(
+            update(Page)
+            .where(Page.id.in_([page.id for page in pages]))
+            .values(check_data=None)
+        )
+        progress = writer.flush()
+        
+        progress_events = ScanProgressPublisher(scan_session_id)
+        for page in pages:
+            progress_events.add_page(page.url, findings[page.id])
+        progress_events.update(progress)
+        
+        return {'pages': len(pages), 'errors': sum(len(f) for f in findings.values())}
+    finally:
+        db.close()
+
+
+async def check_pages(
+    pages: List,
+    website_url: str,
+    preferences: Dict,
+) -> Tuple[Dict[int, List[Dict]], Optional[str]]:
+    """
+    Check pages (rows with id, url, depth, html_content, check_data).
+    
+    Spelling is checked in a worker thread while the registered checkers
+    run, pages one after another, on one HTTP client. Returns dict
+    page id -> findings (Error fields), and the spell check failures to
+    record on the scan (see SpellCheckExecutor.failure_message()).
+    """
+    findings = {}
+    spell_check_failure = None
+    
+    async with httpx.AsyncClient(timeout=settings.REQUEST_TIMEOUT, follow_redirects=True) as client:
+        page_checkers = PageCheckRunner(website_url, preferences, client=client)
+        
+        spelling = None
+        if preferences.get('check_spelling', True):
+            spelling = asyncio.create_task(asyncio.to_thread(check_spelling, pages, preferences))
+        
+        for page in pages:
+            findings[page.id] = await page_checkers.check(page._asdict(), page.check_data)
+        
+        if spelling is not None:
+            spelling_results, spell_check_failure = await spelling
+            for page_id, page_findings in spelling_results.items():
+                findings[page_id] += page_findings
+    
+    return findings, spell_check_failure
+
+
+def check_spelling(pages: List, preferences: Dict) -> Tuple[Dict[int, List[Dict]], Optional[str]]:
+    """
+    Spell check pages, one batch per language. Returns dict page id ->
+    findings, and the failures to record on the scan.
+    """
+    spell_executor = SpellCheckExecutor(
+        whitelist_words=preferences.get('whitelist_words', []),
+        full_check=preferences.get('spell_full_check', False),
+    )
+    submit_spell_check(spell_executor, 'pages', [language_texts(page.check_data) for page in pages])
+    
+    findings = {page.id: [] for page in pages}
+    for (code, _), results in spell_executor.wait_all():
+        for page, errors in zip(pages, results):
+            findings[page.id] += spelling_findings(page.check_data, code, errors)
+    return findings, spell_executor.failure_message()
+
+
+@celery_app.task(name="finish_scan")
+def finish_scan_task(results: List[Dict], scan_session_id: int) -> Dict:
+    """
+    Complete a fan-out scan once all its check_pages tasks are done.
+    
+    Chord callback of dispatch_page_checks(): results are the batches'
+    page and finding counts. The scan's counters are recounted from the
+    database, so they include the findings of the scan task too. A scan
+    cancelled meanwhile stays cancelled.
+    """
+    db = next(get_sync_db())
+    try:
+        scan_session = db.query(ScanSession).get(scan_session_id)
+        if not scan_session:
+            raise ValueError(f"ScanSession {scan_session_id} not found")
+        
+        scan_session.pages_processed = (
+            db.query(func.count(Page.id))
+            .filter(Page.scan_session_id == scan_session_id, Page.check_data.is_(None))
+            .scalar()
+        )
+        scan_session.errors_found = (
+            db.query(func.count(Error.id))
+            .join(Page)
+            .filter(Page.scan_session_id == scan_session_id)
+            .scalar()
+        )
+        # Unless it was cancelled meanwhile
+        db.execute(
+            update(ScanSession)
+            .where(ScanSession.id == scan_session_id, ScanSession.status == ScanStatus.RUNNING)
+            .values(status=ScanStatus.COMPLETED, completed_at=datetime.utcnow())
+        )
+        db.commit()
+        scan_events.publish_status(scan_session_id, scan_session.status.value, scan_progress(scan_session))
+        
+        return {
+            'status': scan_session.status.value,
+            'batches': len(results),
+            'pages_checked': sum(result['pages'] for result in results),
+            'pages_found': scan_session.pages_found,
+            'pages_processed': scan_session.pages_processed,
+            'errors_found': scan_session.errors_found,
+        }
+    finally:
+        db.close()
+
+
+@celery_app.task(name="fail_scan")
+def fail_scan_task(request, exc, traceback, scan_session_id: int) -> None:
+    """Error callback of a fan-out scan: a check_pages task or finish_scan failed."""
+    mark_scan_failed(scan_session_id, exc)
@@ -1,18 +1,37 @@
-from celery import Task
+from celery import Task, chord, group
+from sqlalchemy import case, update
 from sqlalchemy.orm import Session
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 import asyncio
+import httpx
 
 from app.core.celery_app import celery_app
+from app.core.config import settings
 from app.core.database import get_sync_db
-from app.models import ScanSession, Page, Error, Website
-from app.models.scan_session import ScanStatus
+from app.models import ScanSession, Website
+from app.models.scan_session import ScanPriority, ScanStatus
 from app.models.error import ErrorType, ErrorSeverity
+from app.services.boilerplate import BoilerplateDetector
+from app.services.language_detector import LanguageDetector
+from app.services.source_index import SourceIndex
 from app.services.crawler import CrawlerService
-from app.services.spell_checker import SpellCheckerService
-from app.services.address_validator import AddressValidatorService
+from app.services.duplicate_detector import DuplicateDetector
+from app.services.spell_executor import SpellCheckExecutor
+from app.services.asset_checker import AssetCheckerService
 from app.services.link_checker import LinkCheckerService
-from app.services.seo_checker import SEOCheckerService
+from app.services.performance_checker import PerformanceCheckerService
+from app.services.page_checkers import (
+    SEVERITY_MAP,
+    PageCheckRunner,
+    block_location,
+    element_location,
+    finding,
+    phone_location,
+)
+from app.services.scan_writer import ScanWriter
+from app.services.scan_events import ScanProgressPublisher, scan_events
 
 
 class ScanWebsiteTask(Task):
@@ -22,16 +41,285 @@ class ScanWebsiteTask(Task):
         """Handle task failure."""
         scan_session_id = kwargs.get('scan_session_id')
         if scan_session_id:
-            db = next(get_sync_db())
-            try:
-                scan_session = db.query(ScanSession).get(scan_session_id)
-                if scan_session:
-                    scan_session.status = ScanStatus.FAILED
-                    scan_session.error_message = str(exc)
-                    scan_session.completed_at = datetime.utcnow()
-                    db.commit()
-            finally:
-                db.close()
+            mark_scan_failed(scan_session_id, exc)
+
+
+def mark_scan_failed(scan_session_id: int, exc: BaseException) -> None:
+    """Mark a scan failed with the error that stopped it."""
+    db = next(get_sync_db())
+    try:
+        scan_session = db.query(ScanSession).get(scan_session_id)
+        if scan_session and scan_session.status != ScanStatus.CANCELLED:
+            scan_session.status = ScanStatus.FAILED
+            scan_session.error_message = str(exc)
+            scan_session.completed_at = datetime.utcnow()
+            db.commit()
+            scan_events.publish_status(scan_session_id, 'failed', scan_progress(scan_session))
+    finally:
+        db.close()
+
+
+def record_scan_warning(db: Session, scan_session_id: int, message: Optional[str]) -> None:
+    """
+    Append a problem that did not stop the scan (e.g. spell check batches
+    that failed) to its error_message, in the current transaction.
+    """
+    if not message:
+        return
+    db.execute(
+        update(ScanSession)
+        .where(ScanSession.id == scan_session_id)
+        .values(error_message=case(
+            (ScanSession.error_message.is_(None), message),
+            else_=ScanSession.error_message + '\n' + message,
+        ))
+    )
+
+
+def scan_progress(scan_session: ScanSession) -> Dict:
+    """Progress counters of a scan, as published in scan events."""
+    return {
+        'pages_found': scan_session.pages_found,
+        'pages_processed': scan_session.pages_processed,
+        'errors_found': scan_session.errors_found,
+        'error_message': scan_session.error_message,
+    }
+
+
+def split_template_blocks(pages_data: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
+    """
+    Separate template blocks repeated across pages from unique page content.
+    
+    Returns:
+        Per-page parts (text blocks, text and html without template blocks)
+        and the unique template blocks, each with the index of the first
+        page containing it and the number of pages it appears on
+    """
+    if not settings.BOILERPLATE_ENABLED:
+        page_parts = [
+            {
+                'text': p.get('text_content'),
+                'blocks': p.get('text_blocks') or [],
+                'html': p.get('html_content'),
+            }
+            for p in pages_data
+        ]
+        return page_parts, []
+    
+    detector = BoilerplateDetector()
+    for index, page_data in enumerate(pages_data):
+        detector.add_page(index, page_data.get('text_blocks'))
+    
+    page_parts = []
+    template_blocks = {}
+    
+    for page_data in pages_data:
+        parts = detector.split_page(page_data.get('html_content'), page_data.get('text_blocks'))
+        page_parts.append(parts)
+        for block in parts['shared_blocks']:
+            if block['fingerprint'] not in template_blocks:
+                block['page_index'] = detector.first_page[block['fingerprint']]
+                template_blocks[block['fingerprint']] = block
+    
+    return page_parts, list(template_blocks.values())
+
+
+def split_languages(
+    page_parts: List[Dict],
+    template_blocks: List[Dict],
+) -> Tuple[List[Dict[str, List[int]]], List[str], List[Optional[Dict[str, int]]]]:
+    """
+    Detect the language of every text block of the pages and template blocks.
+    
+    Returns:
+        Indexes of each page's blocks per language, the language of each
+        template block, and the size of each page's text (including its
+        template blocks) per language in bytes
+    """
+    if not settings.LANGUAGE_DETECTION_ENABLED:
+        return (
+            [{LanguageDetector.UKRAINIAN: list(range(len(parts['blocks'])))} for parts in page_parts],
+            [LanguageDetector.UKRAINIAN for _ in template_blocks],
+            [None for _ in page_parts],
+        )
+    
+    detector = LanguageDetector()
+    page_languages, page_bytes = [], []
+    template_languages, block_bytes = [], {}
+    
+    for block in template_blocks:
+        language = detector.detect(block['text'])
+        template_languages.append(language)
+        block_bytes[block['fingerprint']] = (language, len(block['text'].encode('utf-8')))
+    
+    for parts in page_parts:
+        languages, byte_counts = detector.group_blocks([block['text'] for block in parts['blocks']])
+        page_languages.append(languages)
+        for block in parts.get('shared_blocks', []):
+            if block['fingerprint'] in block_bytes:
+                language, count = block_bytes[block['fingerprint']]
+                byte_counts[language] = byte_counts.get(language, 0) + count
+        page_bytes.append(byte_counts)
+    
+    return page_languages, template_languages, page_bytes
+
+
+# Duplicate findings per field: message, suggestion, severity, element key
+DUPLICATE_FINDINGS = {
+    'title': (
+        'Однаковий title на {count} сторінках',
+        'Зробіть title унікальним для кожної сторінки',
+        ErrorSeverity.WARNING,
+        'title|',
+    ),
+    'description': (
+        'Однаковий meta description на {count} сторінках',
+        'Зробіть meta description унікальним для кожної сторінки',
+        ErrorSeverity.WARNING,
+        'meta|description',
+    ),
+    'h1': (
+        'Однаковий заголовок H1 на {count} сторінках',
+        'Зробіть заголовок H1 унікальним для кожної сторінки',
+        ErrorSeverity.INFO,
+        'h1|',
+    ),
+}
+
+
+def other_pages(urls: List[str], position: int, limit: int = 5) -> str:
+    """
+    List of the URLs of a group but the one at position, shortened to limit.
+    
+    Only the first limit + 1 URLs are looked at, so listing the others for
+    every page of a large group stays linear in its size.
+    """
+    listed = [url for i, url in enumerate(urls[:limit + 1]) if i != position][:limit]
+    remaining = len(urls) - 1 - len(listed)
+    text = ', '.join(listed)
+    if remaining > 0:
+        text += f" та ще {remaining}"
+    return text
+
+
+def page_check_data(page_data: Dict, parts: Dict, languages: Dict[str, List[int]]) -> Dict:
+    """
+    Inputs of the per-page checks besides the page's own columns.
+    
+    Returns dict with the page's text blocks and html without template
+    blocks, the indexes of its blocks per language and the source
+    locations of its elements. In fan-out mode it is stored with the page
+    for the check_pages tasks.
+    """
+    return {
+        'blocks': parts['blocks'],
+        'html': parts['html'],
+        'languages': languages,
+        'element_locations': page_data.get('element_locations') or {},
+    }
+
+
+def spell_languages() -> Dict[str, str]:
+    """Spell-checker language of each detected language that is spell checked."""
+    languages = {LanguageDetector.UKRAINIAN: 'uk-UA'}
+    if settings.SPELL_CHECK_ENGLISH:
+        languages[LanguageDetector.ENGLISH] = settings.SPELL_ENGLISH_LANGUAGE
+    return languages
+
+
+def submit_spell_check(spell_executor: SpellCheckExecutor, target, texts_by_language: List[Dict[str, str]]) -> None:
+    """Submit texts (language -> text, one dict per page or block) under key (language, target)."""
+    for code, language in spell_languages().items():
+        texts = [texts.get(code, '') for texts in texts_by_language]
+        if any(texts):
+            spell_executor.submit((code, target), texts, language)
+
+
+def language_texts(check_data: Dict) -> Dict[str, str]:
+    """Text of a page per language: its blocks of that language joined by newlines."""
+    blocks = check_data['blocks']
+    return {
+        code: '\n'.join(blocks[i]['text'] for i in indexes)
+        for code, indexes in check_data['languages'].items()
+    }
+
+
+def spelling_findings(check_data: Dict, code: str, errors: List[Dict]) -> List[Dict]:
+    """
+    Findings of a page's spell check in one language.
+    
+    block_index of an error is the line in the page's text in that
+    language (see language_texts()).
+    """
+    blocks = check_data['blocks']
+    indexes = check_data['languages'].get(code, [])
+    return [
+        finding(
+            ErrorType.SPELLING, ErrorSeverity.WARNING, err,
+            **block_location(blocks[indexes[err['block_index']]], err['block_offset']),
+        )
+        for err in errors
+    ]
+
+
+def task_priority(priority: ScanPriority, pages_before: int = 0, weight: float = 1) -> int:
+    """
+    Celery priority (0 runs first, 9 last) of a task of a scan.
+    
+    Scheduled scans start SCAN_SCHEDULED_PRIORITY_OFFSET levels below
+    interactive ones. A task checking pages drops one more level for every
+    SCAN_FAIR_SHARE_PAGES pages of the scan before it, times the website's
+    scan_weight: the first pages of every scan are checked before the
+    tail of large scans, so large and small scans share the workers.
+    """
+    level = settings.SCAN_SCHEDULED_PRIORITY_OFFSET if priority == ScanPriority.SCHEDULED else 0
+    share = settings.SCAN_FAIR_SHARE_PAGES * (weight if weight and weight > 0 else 1)
+    return min(level + int(pages_before // share), 9)
+
+
+def scan_task_priority(priority: ScanPriority, preferences: Optional[Dict]) -> int:
+    """
+    Celery priority of the scan_website task of a scan.
+    
+    In fan-out mode the task only crawls, and the pages are checked by
+    check_pages tasks with fair priorities (see dispatch_page_checks()).
+    Otherwise the task checks every page itself, holding a worker for the
+    whole scan, so it is queued as if its max_pages pages came before it:
+    small scans start ahead of large ones. A started scan is not
+    interleaved with others.
+    """
+    if settings.SCAN_FANOUT_ENABLED:
+        return task_priority(priority)
+    preferences = preferences or {}
+    return task_priority(priority, preferences.get('max_pages', 100), preferences.get('scan_weight', 1))
+
+
+def dispatch_page_checks(
+    scan_session_id: int,
+    page_ids: List[int],
+    priority: ScanPriority = ScanPriority.INTERACTIVE,
+    weight: float = 1,
+):
+    """
+    Check the written pages of a scan in parallel across the workers.
+    
+    Pages are split into batches of SCAN_FANOUT_BATCH_PAGES, each checked
+    by a check_pages task queued with its fair priority (see
+    task_priority()); when all of them are done, finish_scan marks the
+    scan completed, or fail_scan marks it failed if any of them fails.
+    """
+    size = settings.SCAN_FANOUT_BATCH_PAGES
+    checks = group(
+        celery_app.signature(
+            "check_pages",
+            args=[scan_session_id, page_ids[i:i + size]],
+            priority=task_priority(priority, i, weight),
+        )
+        for i in range(0, len(page_ids), size)
+    )
+    callback = celery_app.signature("finish_scan", args=[scan_session_id], priority=task_priority(priority))
+    callback.on_error(celery_app.signature("fail_scan", args=[scan_session_id]))
+    return chord(checks)(callback)
 
 
 @celery_app.task(base=ScanWebsiteTask, bind=True, name="scan_website")
@@ -44,211 +332,461 @@ def scan_website_task(self, scan_session_id: int):
     2. Runs all checks on each page
     3. Saves results to database
     """
-    db = next(get_sync_db())
+    return asyncio.run(run_scan(self, scan_session_id))
+
+
+async def run_scan(task: Task, scan_session_id: int) -> Dict:
+    """
+    Scan a website on one event loop.
     
-    try:
-        # Get scan session
+    The HTTP client, caches and semaphores of the checkers live for the
+    whole scan. Database work runs on a single dedicated thread (the
+    session is never used concurrently) and CPU-bound checks run in
+    worker threads, so they do not block network I/O on the loop.
+    """
+    loop = asyncio.get_running_loop()
+    # The task's request is thread-local: progress is reported by task id
+    task_id = task.request.id
+    db_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scan-db")
+    
+    def in_db(func, *args):
+        return loop.run_in_executor(db_executor, func, *args)
+    
+    db = await in_db(lambda: next(get_sync_db()))
+    scan_session = None
+    cancelled = False
+    
+    def start_scan():
+        nonlocal scan_session
         scan_session = db.query(ScanSession).get(scan_session_id)
         if not scan_session:
             raise ValueError(f"ScanSession {scan_session_id} not found")
+        if scan_session.status == ScanStatus.CANCELLED:
+            # Cancelled while queued
+            return None
         
         # Update status
         scan_session.status = ScanStatus.RUNNING
         scan_session.started_at = datetime.utcnow()
         db.commit()
+        scan_events.publish_status(scan_session_id, 'running', scan_progress(scan_session))
         
-        # Get website
         website = scan_session.website
-        preferences = website.preferences or {}
-        
-        # Initialize crawler
-        crawler = CrawlerService(
-            base_url=website.url,
-            max_pages=preferences.get('max_pages', 100),
-            max_depth=preferences.get('max_depth', 5),
-        )
-        
-        # Crawl website (run async function in sync context)
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        pages_data = loop.run_until_complete(crawler.crawl())
-        loop.close()
-        
-        # Update statistics
-        scan_session.pages_found = len(pages_data)
+        return website.url, website.preferences or {}, scan_session.priority
+    
+    def fail_scan(e):
+        if scan_session is None:
+            return
+        scan_session.status = ScanStatus.FAILED
+        scan_session.error_message = str(e)
+        scan_session.completed_at = datetime.utcnow()
         db.commit()
+        scan_events.publish_status(scan_session_id, 'failed', scan_progress(scan_session))
+    
+    def scan_status():
+        return db.query(ScanSession.status).filter(ScanSession.id == scan_session_id).scalar()
+    
+    def cancel_scan():
+        scan_session = db.query(ScanSession).get(scan_session_id)
+        db.refresh(scan_session)
+        scan_events.publish_status(scan_session_id, 'cancelled', scan_progress(scan_session))
+        return {
+            'status': 'cancelled',
+            'pages_found': scan_session.pages_found,
+            'pages_processed': scan_session.pages_processed,
+            'errors_found': scan_session.errors_found,
+        }
+    
+    async def watch_cancellation(scan: asyncio.Task):
+        """Stop the scan once it is cancelled (see POST /scans/{id}/cancel)."""
+        nonlocal cancelled
+        while not scan.done():
+            await asyncio.sleep(settings.SCAN_CANCEL_CHECK_INTERVAL)
+            if await in_db(scan_status) == ScanStatus.CANCELLED:
+                cancelled = True
+                scan.cancel()
+    
+    try:
+        started = await in_db(start_scan)
+        if started is None:
+            return {'status': 'cancelled'}
+        website_url, preferences, priority = started
         
-        # Process each page
-        total_errors = 0
-        
-        for page_data in pages_data:
-            # Create page record
-            page = Page(
-                scan_session_id=scan_session.id,
-                url=page_data['url'],
-                title=page_data.get('title'),
-                status_code=page_data.get('status_code'),
-                html_content=page_data.get('html_content'),
-                text_content=page_data.get('text_content'),
-                meta_description=page_data.get('meta', {}).get('description'),
-                meta_keywords=page_data.get('meta', {}).get('keywords'),
-                has_favicon=page_data.get('meta', {}).get('has_favicon', False),
-                depth=page_data.get('depth', 0),
-            )
-            db.add(page)
-            db.flush()  # Get page.id
-            
-            # Run checks
-            page_errors = []
-            
-            # 1. Spell checking
-            if preferences.get('check_spelling', True) and page_data.get('text_content'):
-                with SpellCheckerService() as spell_checker:
-                    whitelist = preferences.get('whitelist_words', [])
-                    spell_errors = spell_checker.check_page(
-                        page_data['text_content'],
-                        whitelist_words=whitelist
-                    )
-                    
-                    for err in spell_errors:
-                        error = Error(
-                            page_id=page.id,
-                            error_type=ErrorType.SPELLING,
-                            severity=ErrorSeverity.WARNING,
-                            message=err['message'],
-                            context=err.get('context'),
-                            suggestion=err.get('suggestion'),
-                        )
-                        page_errors.append(error)
-            
-            # 2. Address validation
-            if preferences.get('check_addresses', True) and page_data.get('text_content'):
-                address_validator = AddressValidatorService()
-                address_errors = address_validator.validate_text(page_data['text_content'])
-                
+        async with httpx.AsyncClient(timeout=settings.REQUEST_TIMEOUT, follow_redirects=True) as client:
+            # The scan is stopped at its next await once cancelled; pages
+            # and findings written so far are kept
+            scan = asyncio.create_task(scan_pages(
+                task, task_id, scan_session_id, website_url, preferences, priority, client, in_db, db
+            ))
+            watcher = asyncio.create_task(watch_cancellation(scan))
+            try:
+                return await scan
+            except asyncio.CancelledError:
+                if not cancelled:
+                    raise
+                return await in_db(cancel_scan)
+            finally:
+                watcher.cancel()
+    
+    except Exception as e:
+        await in_db(fail_scan, e)
+        raise
+    finally:
+        await in_db(db.close)
+        db_executor.shutdown(wait=False)
+
+
+async def scan_pages(
+    task: Task,
+    task_id: str,
+    scan_session_id: int,
+    website_url: str,
+    preferences: Dict,
+    priority: ScanPriority,
+    client: httpx.AsyncClient,
+    in_db,
+    db: Session,
+) -> Dict:
+    """Crawl the website, check its pages and save the results (see run_scan())."""
+    # Initialize crawler
+    crawler = CrawlerService(
+        base_url=website_url,
+        max_pages=preferences.get('max_pages', 100),
+        max_depth=preferences.get('max_depth', 5),
+        client=client,
+    )
+    pages_data = await crawler.crawl()
+    
+    def get_scan_session():
+        return db.query(ScanSession).get(scan_session_id)
+    
+    def set_pages_found():
+        get_scan_session().pages_found = len(pages_data)
+        db.commit()
+    
+    # Update statistics
+    await in_db(set_pages_found)
+    
+    # Live progress for the UI, throttled; the database is only updated
+    # with each batch of pages written
+    progress_events = ScanProgressPublisher(scan_session_id)
+    
+    # Split pages into unique content and template blocks (menus,
+    # footers) repeated across the site, which are checked only once
+    page_parts, template_blocks = await asyncio.to_thread(split_template_blocks, pages_data)
+    
+    # Group text blocks by language: only Ukrainian text goes to the
+    # uk-UA spell checker
+    page_languages, template_languages, page_language_bytes = await asyncio.to_thread(
+        split_languages, page_parts, template_blocks
+    )
+    
+    # Inputs of the per-page checks
+    page_checks = [
+        page_check_data(page_data, parts, languages)
+        for page_data, parts, languages in zip(pages_data, page_parts, page_languages)
+    ]
+    
+    # In fan-out mode pages are only written here, then checked by
+    # check_pages tasks across the workers (see dispatch_page_checks()),
+    # and pages count as processed once checked
+    fanout = settings.SCAN_FANOUT_ENABLED
+    
+    # Pages and findings are written in batches; findings may come in
+    # before or after their page is written
+    writer = ScanWriter(db, scan_session_id, count_pages=not fanout)
+    
+    def add_finding(index, fields):
+        writer.add_finding(index, fields)
+    
+    def add_findings(index, error_type, severity, errors, page_count=None):
+        for err in errors:
+            add_finding(index, {
+                **finding(error_type, severity, err, **err.get('location', {})),
+                'page_count': page_count,
+            })
+    
+    # Findings in template blocks are attached to the first page
+    # containing the block
+    def add_template_findings(block, error_type, severity, errors):
+        add_findings(block['page_index'], error_type, severity, errors, block['page_count'])
+    
+    def add_spell_results(key, results):
+        code, target = key
+        if target == 'templates':
+            for block, errors in zip(template_blocks, results):
+                for err in errors:
+                    err['location'] = block_location(block, err['block_offset'])
+                add_template_findings(block, ErrorType.SPELLING, ErrorSeverity.WARNING, errors)
+        else:
+            for index, errors in zip(target, results):
+                for fields in spelling_findings(page_checks[index], code, errors):
+                    add_finding(index, fields)
+    
+    # Spell checking runs outside the page loop (on the spellcheck queue),
+    # in batches of pages; results are saved as they come back. Submitting
+    # and collecting batches block, so they run in worker threads.
+    check_spelling = preferences.get('check_spelling', True)
+    spell_executor = SpellCheckExecutor(
+        whitelist_words=preferences.get('whitelist_words', []),
+        full_check=preferences.get('spell_full_check', False),
+    )
+    
+    batch_size = settings.SPELL_BATCH_PAGES
+    if check_spelling and template_blocks:
+        await asyncio.to_thread(submit_spell_check, spell_executor, 'templates', [
+            {language: block['text']}
+            for block, language in zip(template_blocks, template_languages)
+        ])
+    
+    # One link checker per scan: links and assets are checked once
+    link_checker = LinkCheckerService(client=client)
+    # Per-page checkers (see PAGE_CHECKERS), one set per scan; the template
+    # blocks are checked with the runner's address validator and link
+    # checker, so their caches are shared with the page checks
+    page_checkers = PageCheckRunner(website_url, preferences, client=client, link_checker=link_checker)
+    
+    def check_templates():
+        if preferences.get('check_addresses', True):
+            for block in template_blocks:
+                address_errors = page_checkers.address_validator.validate_text(block['text'])
                 for err in address_errors:
-                    error = Error(
-                        page_id=page.id,
-                        error_type=ErrorType.ADDRESS,
-                        severity=ErrorSeverity.ERROR,
-                        message=err['message'],
-                        context=err.get('context'),
-                        suggestion=err.get('suggestion'),
-                    )
-                    page_errors.append(error)
-            
-            # 3. Link checking (async)
-            if preferences.get('check_links', True) and page_data.get('html_content'):
-                link_checker = LinkCheckerService()
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                link_errors = loop.run_until_complete(
-                    link_checker.check_all_links(page_data['html_content'], page_data['url'])
-                )
-                loop.close()
-                
-                for err in link_errors:
-                    error = Error(
-                        page_id=page.id,
-                        error_type=ErrorType.BROKEN_LINK,
-                        severity=ErrorSeverity.ERROR,
-                        message=err['message'],
-                        link_url=err.get('link_url'),
-                        link_status_code=err.get('status_code'),
-                    )
-                    page_errors.append(error)
-            
-            # 4. Phone number checking
-            if preferences.get('check_phones', True) and page_data.get('html_content'):
-                link_checker = LinkCheckerService()
-                phone_errors = link_checker.check_phone_numbers(page_data['html_content'])
-                
+                    err['location'] = block_location(block, err['position'])
+                add_template_findings(block, ErrorType.ADDRESS, ErrorSeverity.ERROR, address_errors)
+        
+        if preferences.get('check_phones', True):
+            for block in template_blocks:
+                phone_errors = link_checker.check_phone_numbers(block['html'])
                 for err in phone_errors:
-                    error = Error(
-                        page_id=page.id,
-                        error_type=ErrorType.PHONE,
-                        severity=ErrorSeverity.WARNING,
-                        message=err['message'],
-                        context=err.get('context'),
-                        suggestion=err.get('suggestion'),
-                    )
-                    page_errors.append(error)
-            
-            # 5. SEO checking (async, only for first page / home page)
-            if preferences.get('check_seo', True) and page_data.get('html_content'):
-                seo_checker = SEOCheckerService()
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                
-                seo_errors = loop.run_until_complete(
-                    seo_checker.check_page(page_data['html_content'], page_data['url'])
+                    err['location'] = phone_location(pages_data[block['page_index']], [block], err)
+                add_template_findings(block, ErrorType.PHONE, ErrorSeverity.WARNING, phone_errors)
+    
+    await asyncio.to_thread(check_templates)
+    
+    # Titles, descriptions, H1s and text hashes of all pages, to report
+    # duplicates across the site at the end of the scan
+    duplicate_detector = DuplicateDetector()
+    # Images, scripts and stylesheets of all pages, checked once per
+    # scan at the end: url -> asset with the index of the first page
+    # using it and the number of pages using it
+    check_assets = preferences.get('check_assets', True)
+    scan_assets = {}
+    
+    def add_duplicate_page(index, page_data):
+        if preferences.get('check_seo', True) and page_data.get('html_content'):
+            meta = page_data.get('meta', {})
+            duplicate_detector.add_page(
+                index,
+                title=meta.get('title'),
+                description=meta.get('description'),
+                h1=meta.get('h1'),
+                text=page_parts[index]['text'],
+            )
+    
+    def page_columns(index, page_data):
+        meta = page_data.get('meta', {})
+        return {
+            'url': page_data['url'],
+            'title': page_data.get('title'),
+            'status_code': page_data.get('status_code'),
+            'html_content': page_data.get('html_content'),
+            'text_content': page_data.get('text_content'),
+            'meta_description': meta.get('description'),
+            'meta_keywords': meta.get('keywords'),
+            'has_favicon': meta.get('has_favicon', False),
+            'depth': page_data.get('depth', 0),
+            'language_bytes': page_language_bytes[index],
+            'check_data': page_checks[index] if fanout else None,
+            **(page_data.get('metrics') or {}),
+        }
+    
+    def write_batch():
+        """Write buffered pages and findings and report the progress."""
+        progress = writer.flush()
+        task.update_state(
+            task_id=task_id,
+            state='PROGRESS',
+            meta={
+                'current': progress['pages_processed'],
+                'total': progress['pages_found'],
+                'errors': progress['errors_found'],
+            }
+        )
+    
+    # Process each page
+    for index, page_data in enumerate(pages_data):
+        if fanout:
+            # Checked by a check_pages task once written
+            page_findings = []
+            await asyncio.to_thread(add_duplicate_page, index, page_data)
+        else:
+            if check_spelling and index % batch_size == 0:
+                batch = range(index, min(index + batch_size, len(pages_data)))
+                await asyncio.to_thread(
+                    submit_spell_check, spell_executor, tuple(batch),
+                    [language_texts(page_checks[i]) for i in batch],
                 )
-                
-                # Check robots.txt (only once, for homepage)
-                if page_data.get('depth', 0) == 0:
-                    robots_error = loop.run_until_complete(
-                        seo_checker.check_robots_accessibility(website.url)
-                    )
-                    if robots_error:
-                        seo_errors.append(robots_error)
-                
-                loop.close()
-                
-                for err in seo_errors:
-                    severity_map = {
-                        'info': ErrorSeverity.INFO,
-                        'warning': ErrorSeverity.WARNING,
-                        'error': ErrorSeverity.ERROR,
-                        'critical': ErrorSeverity.CRITICAL,
-                    }
-                    error = Error(
-                        page_id=page.id,
-                        error_type=ErrorType.SEO,
-                        severity=severity_map.get(err.get('severity', 'warning'), ErrorSeverity.WARNING),
-                        message=err['message'],
-                        suggestion=err.get('suggestion'),
-                    )
-                    page_errors.append(error)
             
-            # Save all errors
-            for error in page_errors:
-                db.add(error)
+            # 1. Spell checking (results of finished batches)
+            for key, results in await asyncio.to_thread(spell_executor.ready):
+                add_spell_results(key, results)
             
-            total_errors += len(page_errors)
-            
-            # Update progress
-            scan_session.pages_processed += 1
-            scan_session.errors_found = total_errors
-            db.commit()
-            
-            # Update task progress
-            self.update_state(
-                state='PROGRESS',
-                meta={
-                    'current': scan_session.pages_processed,
-                    'total': scan_session.pages_found,
-                    'errors': total_errors,
-                }
+            # 2. Registered checkers (addresses, phones, links, SEO),
+            # alongside the page's duplicate hashes
+            page_findings, _ = await asyncio.gather(
+                page_checkers.check(page_data, page_checks[index]),
+                asyncio.to_thread(add_duplicate_page, index, page_data),
             )
         
-        # Complete scan
-        scan_session.status = ScanStatus.COMPLETED
-        scan_session.completed_at = datetime.utcnow()
+        if check_assets:
+            for asset in page_data.get('assets') or []:
+                if asset['url'] in scan_assets:
+                    scan_assets[asset['url']]['page_count'] += 1
+                else:
+                    scan_assets[asset['url']] = {**asset, 'page_index': index, 'page_count': 1}
+        
+        # Save the page and its findings with the next batch
+        writer.add_page(index, page_columns(index, page_data), page_findings)
+        if writer.batch_full:
+            await in_db(write_batch)
+        
+        await progress_events.update_async(
+            {
+                'pages_found': len(pages_data),
+                'pages_processed': 0 if fanout else index + 1,
+                'errors_found': writer.findings_added,
+            },
+            url=None if fanout else page_data['url'],
+            findings=page_findings,
+        )
+    
+    # Save the remaining spell-check results
+    while spell_executor.in_flight or spell_executor.completed:
+        completed = await asyncio.to_thread(spell_executor.ready)
+        if not completed:
+            await asyncio.sleep(spell_executor.POLL_INTERVAL)
+        for key, results in completed:
+            add_spell_results(key, results)
+    
+    # Assets, reported on the first page using them
+    if scan_assets:
+        asset_checker = AssetCheckerService(link_checker)
+        asset_issues = await asset_checker.check_assets(list(scan_assets.values()))
+        
+        for url, issues in asset_issues.items():
+            asset = scan_assets[url]
+            for issue in issues:
+                details = [f"HTTP {issue['status_code']}"]
+                if issue['content_type']:
+                    details.append(f"Content-Type: {issue['content_type']}")
+                if issue['size'] is not None:
+                    details.append(AssetCheckerService.format_size(issue['size']))
+                add_finding(asset['page_index'], {
+                    'error_type': ErrorType.ASSET,
+                    'severity': SEVERITY_MAP.get(issue['severity'], ErrorSeverity.WARNING),
+                    'message': issue['message'],
+                    'context': f"{url} ({', '.join(details)})",
+                    'suggestion': issue['suggestion'],
+                    'link_url': url[:1000],
+                    'link_status_code': issue['status_code'],
+                    'page_count': asset['page_count'],
+                    **element_location(
+                        pages_data[asset['page_index']],
+                        SourceIndex.element_key(asset['tag'], asset['href']),
+                    ),
+                })
+    
+    # Page load performance: site percentiles on the scan, slow and
+    # heavy pages reported with the site's typical values
+    performance = None
+    measured = [
+        index for index, page_data in enumerate(pages_data)
+        if page_data.get('metrics') and page_data.get('html_content')
+    ]
+    if measured:
+        performance_checker = PerformanceCheckerService()
+        performance = performance_checker.summarize([pages_data[i]['metrics'] for i in measured])
+        
+        if preferences.get('check_performance', True):
+            site_context = (
+                f"Сайт: TTFB p50 {performance['ttfb_ms_p50']} мс, p95 {performance['ttfb_ms_p95']} мс; "
+                f"завантаження p50 {performance['download_ms_p50']} мс, p95 {performance['download_ms_p95']} мс; "
+                f"HTML p50 {performance_checker.format_size(performance['content_size_p50'])}, "
+                f"p95 {performance_checker.format_size(performance['content_size_p95'])}"
+            )
+            for index in measured:
+                for issue in performance_checker.check_page(pages_data[index]['metrics']):
+                    add_finding(index, {
+                        'error_type': ErrorType.PERFORMANCE,
+                        'severity': SEVERITY_MAP.get(issue['severity'], ErrorSeverity.WARNING),
+                        'message': issue['message'],
+                        'context': site_context,
+                        'suggestion': issue['suggestion'],
+                    })
+    
+    # Site-wide duplicates, reported on every page of a group
+    for group in duplicate_detector.duplicate_groups():
+        message, suggestion, severity, element = DUPLICATE_FINDINGS[group['field']]
+        urls = [pages_data[i]['url'] for i in group['pages']]
+        for position, index in enumerate(group['pages']):
+            add_finding(index, {
+                'error_type': ErrorType.SEO,
+                'severity': severity,
+                'message': message.format(count=len(group['pages'])),
+                'context': group['value'],
+                'suggestion': f"{suggestion}. Також на: {other_pages(urls, position)}",
+                'page_count': len(group['pages']),
+                **element_location(pages_data[index], element),
+            })
+    
+    for pages in duplicate_detector.near_duplicate_groups():
+        urls = [pages_data[i]['url'] for i in pages]
+        for position, index in enumerate(pages):
+            add_finding(index, {
+                'error_type': ErrorType.SEO,
+                'severity': ErrorSeverity.INFO,
+                'message': f'Майже однаковий вміст на {len(pages)} сторінках',
+                'suggestion': f"Схожі сторінки: {other_pages(urls, position)}. "
+                              "Об'єднайте їх або вкажіть канонічну сторінку (rel=\"canonical\")",
+                'page_count': len(pages),
+            })
+    
+    def complete_scan(completed=True):
+        record_scan_warning(db, scan_session_id, spell_executor.failure_message())
+        writer.flush()
+        
+        scan_session = get_scan_session()
+        if performance:
+            scan_session.performance = performance
+        
+        # Complete scan, unless it was cancelled meanwhile
+        if completed:
+            db.execute(
+                update(ScanSession)
+                .where(ScanSession.id == scan_session_id, ScanSession.status == ScanStatus.RUNNING)
+                .values(status=ScanStatus.COMPLETED, completed_at=datetime.utcnow())
+            )
         db.commit()
         
+        status = scan_session.status.value
+        progress_events.flush()
+        scan_events.publish_status(scan_session_id, status, scan_progress(scan_session))
+        
         return {
-            'status': 'completed',
+            'status': status,
             'pages_found': scan_session.pages_found,
             'pages_processed': scan_session.pages_processed,
             'errors_found': scan_session.errors_found,
         }
-        
-    except Exception as e:
-        scan_session.status = ScanStatus.FAILED
-        scan_session.error_message = str(e)
-        scan_session.completed_at = datetime.utcnow()
-        db.commit()
-        raise
-    finally:
-        db.close()
-
+    
+    if fanout and pages_data:
+        # The check_pages tasks complete the scan
+        result = await in_db(complete_scan, False)
+        if result['status'] == ScanStatus.RUNNING.value:
+            page_ids = [writer.page_ids[index] for index in range(len(pages_data))]
+            await asyncio.to_thread(
+                dispatch_page_checks, scan_session_id, page_ids, priority, preferences.get('scan_weight', 1)
+            )
+        return result
+    
+    return await in_db(complete_scan)
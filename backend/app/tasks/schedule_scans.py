@@ -0,0 +1,81 @@
+from datetime import datetime
+from typing import Dict
+
+from sqlalchemy import func
+
+from app.core.celery_app import celery_app
+from app.core.config import settings
+from app.core.database import get_sync_db
+from app.models import ScanSession, Website
+from app.models.scan_session import ScanPriority, ScanStatus
+from app.services.scan_coalescer import scan_coalescer
+from app.services.scan_scheduler import next_scan_time
+from app.tasks.scan_website import scan_task_priority, scan_website_task
+
+
+@celery_app.task(name="schedule_scans")
+def schedule_scans_task() -> Dict:
+    """
+    Start the recurring scans that are due.
+    
+    Run by Celery beat every SCAN_SCHEDULER_INTERVAL seconds. Scans are
+    started, most overdue first, while fewer than SCAN_SCHEDULER_MAX_ACTIVE
+    scans are pending (queued) or running; websites over the budget stay
+    due and are started by a later run, once the workers catch up. A
+    website whose previous scan (with the same preferences) is still in
+    progress is not scanned again. Each started website's next scan is
+    set to the next slot of its schedule (see next_scan_time()).
+    """
+    db = next(get_sync_db())
+    try:
+        now = datetime.utcnow()
+        active = (
+            db.query(func.count(ScanSession.id))
+            .filter(ScanSession.status.in_([ScanStatus.PENDING, ScanStatus.RUNNING]))
+            .scalar()
+        )
+        budget = settings.SCAN_SCHEDULER_MAX_ACTIVE - active
+        if budget <= 0:
+            return {'started': 0, 'skipped': 0, 'active': active}
+        
+        websites = (
+            db.query(Website)
+            .filter(Website.scan_interval_hours.isnot(None), Website.next_scan_at <= now)
+            .order_by(Website.next_scan_at)
+            .limit(budget)
+            .all()
+        )
+        
+        started = []
+        skipped = 0
+        for website in websites:
+            preferences_hash = scan_coalescer.preferences_hash(website.preferences)
+            with scan_coalescer.sync_lock(website.id):
+                if scan_coalescer.find_duplicate_sync(db, website.id, preferences_hash):
+                    skipped += 1
+                else:
+                    scan_session = ScanSession(
+                        website_id=website.id,
+                        status=ScanStatus.PENDING,
+                        priority=ScanPriority.SCHEDULED,
+                        preferences_hash=preferences_hash,
+                    )
+                    db.add(scan_session)
+                    db.flush()
+                    started.append((scan_session.id, scan_task_priority(ScanPriority.SCHEDULED, website.preferences)))
+                
+                website.next_scan_at = next_scan_time(website.id, website.scan_interval_hours, now)
+                db.commit()
+        
+        for scan_session_id, priority in started:
+            scan_website_task.apply_async(
+                kwargs={"scan_session_id": scan_session_id},
+                priority=priority,
+            )
+        
+        if started or skipped:
+            print(f"✅ Scheduled scans: {len(started)} started, {skipped} still in progress ({active} active)")
+        
+        return {'started': len(started), 'skipped': skipped, 'active': active}
+    finally:
+        db.close()
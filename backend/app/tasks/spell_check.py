@@ -0,0 +1,22 @@
+from typing import Dict, List, Optional
+
+from app.core.celery_app import celery_app
+from app.services.spell_checker import SpellCheckerService
+
+
+@celery_app.task(name="check_spelling_batch")
+def check_spelling_batch_task(
+    texts: List[Optional[str]],
+    whitelist_words: Optional[List[str]] = None,
+    full_check: bool = False,
+    language: str = 'uk-UA',
+) -> List[List[Dict]]:
+    """
+    Spell check a batch of page texts in the given language.
+    
+    Runs on the dedicated "spellcheck" queue, so spelling for many pages
+    is checked in parallel by the spell-check workers while the scan task
+    keeps crawling and running the other checks.
+    """
+    with SpellCheckerService(language) as spell_checker:
+        return spell_checker.check_pages(texts, whitelist_words, full_check)
@@ -0,0 +1,80 @@
+"""
+Benchmark the address and phone scanners on pathological input.
+
+Generates inputs that make backtracking regex engines work hard (long runs
+of lowercase Cyrillic text after an address prefix with no house number,
+long digit runs that almost look like phone numbers) at growing sizes, and
+times the scanners with each available engine (REGEX_ENGINE). With RE2 the
+time grows linearly with the input size; the run fails if any scan takes
+longer than --limit seconds.
+
+Usage:
+    python scripts/benchmark_regex.py [--sizes 10000 100000 1000000] [--limit 10]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.config import settings  # noqa: E402
+from app.services import regex_engine  # noqa: E402
+from app.services.address_validator import AddressValidatorService  # noqa: E402
+from app.services.link_checker import LinkCheckerService  # noqa: E402
+
+
+def address_inputs(size):
+    """Address prefixes followed by street-like text that never ends with a number."""
+    yield 'street prefixes', ('вул. Довга ' + 'вулиця ' * 3) * (size // 40)
+    yield 'one long street', 'м. Київ, вул. Хрещатик ' + 'дуже довга назва ' * (size // 17)
+    yield 'city prefixes', 'м. Київ місто Львів ' * (size // 20)
+
+
+def phone_inputs(size):
+    """Digit runs and separators that almost match the phone patterns."""
+    yield 'digit run', '0' * size
+    yield 'separated digits', '044 12 ' * (size // 7)
+
+
+def run_scan(name, scan, text, limit):
+    start = time.perf_counter()
+    scan(text)
+    elapsed = time.perf_counter() - start
+    status = 'ok' if elapsed <= limit else 'TOO SLOW'
+    print(f"    {name:<20} {len(text):>10} chars  {elapsed:8.3f} s  {status}")
+    return elapsed <= limit
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark address/phone scanners on pathological input")
+    parser.add_argument('--sizes', nargs='+', type=int, default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--limit', type=float, default=10.0, help="Maximum seconds per scan")
+    args = parser.parse_args()
+
+    engines = ['re']
+    if regex_engine.re2 is not None:
+        engines.insert(0, 're2')
+    else:
+        print("⚠️ google-re2 is not installed, benchmarking re only")
+
+    passed = True
+    for engine in engines:
+        settings.REGEX_ENGINE = engine
+        regex_engine.compile_pattern.cache_clear()
+        address_validator = AddressValidatorService()
+        link_checker = LinkCheckerService()
+        print(f"Engine: {engine}")
+
+        for size in args.sizes:
+            print(f"  size {size}")
+            for name, text in address_inputs(size):
+                passed &= run_scan(name, address_validator.validate_text, text, args.limit)
+            for name, text in phone_inputs(size):
+                passed &= run_scan(name, link_checker.check_phone_numbers, f"<p>{text}</p>", args.limit)
+
+    return 0 if passed else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,74 @@
+"""
+Build the Ukrainian gazetteer used by address validation.
+
+Inputs are plain text or CSV files with one name per line (for CSV, the
+first row is a header and the name is taken from --column), e.g.
+settlement names exported from the KATOTTH codifier and street names from
+a city's open street registry.
+Street type words ("вулиця", "вул.", "проспект"...) at the start of street
+names are dropped. The result is saved as a marisa-trie file that workers
+memory-map (GAZETTEER_PATH).
+
+Usage:
+    python scripts/build_gazetteer.py --settlements settlements.txt [--streets streets.csv --column 1] -o data/uk_gazetteer.marisa
+"""
+import argparse
+import csv
+import os
+import re
+import sys
+
+import marisa_trie
+
+APOSTROPHES = str.maketrans({'’': "'", 'ʼ': "'"})
+
+STREET_TYPE = re.compile(
+    r"^(?:вулиця|вул\.|провулок|пров\.|проспект|просп\.|бульвар|бульв\.|б-р|"
+    r"площа|пл\.|узвіз|шосе|набережна|наб\.|тупик|проїзд|алея|майдан)\s+",
+    re.IGNORECASE,
+)
+
+
+def read_names(paths, column):
+    for path in paths:
+        with open(path, encoding='utf-8', newline='') as f:
+            if path.endswith('.csv'):
+                reader = csv.reader(f)
+                next(reader, None)  # header
+                rows = (row[column] for row in reader if len(row) > column)
+            else:
+                rows = f
+            for row in rows:
+                name = re.sub(r'\s+', ' ', row.translate(APOSTROPHES)).strip()
+                if name and not name.isdigit():
+                    yield name
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the address validation gazetteer")
+    parser.add_argument('--settlements', nargs='+', required=True, help="Settlement name lists")
+    parser.add_argument('--streets', nargs='*', default=[], help="Street name lists")
+    parser.add_argument('--column', type=int, default=0, help="Name column in CSV inputs")
+    parser.add_argument('-o', '--output', default='data/uk_gazetteer.marisa', help="Output trie file")
+    args = parser.parse_args()
+
+    entries = {}
+    for name in read_names(args.settlements, args.column):
+        entries.setdefault(f"c:{name.lower()}", name)
+    settlements = len(entries)
+    for name in read_names(args.streets, args.column):
+        name = STREET_TYPE.sub('', name)
+        entries.setdefault(f"s:{name.lower()}", name)
+
+    if not entries:
+        print("No names found", file=sys.stderr)
+        return 1
+
+    os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+    marisa_trie.BytesTrie((key, name.encode('utf-8')) for key, name in entries.items()).save(args.output)
+    print(f"✅ Saved {settlements} settlements and {len(entries) - settlements} streets to {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
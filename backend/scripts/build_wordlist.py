@@ -0,0 +1,50 @@
+"""
+Build the Ukrainian word list used by the spell-check pre-filter.
+
+Input is one or more plain text files with one word (word form) per line,
+e.g. the full list of word forms from the dict_uk project or a Hunspell
+dictionary expanded with `unmunch`. Words are lowercased, apostrophes are
+normalized and the result is saved as a marisa-trie file that workers
+memory-map (SPELL_WORDLIST_PATH).
+
+Usage:
+    python scripts/build_wordlist.py words.txt [more.txt ...] -o data/uk_words.marisa
+"""
+import argparse
+import os
+import sys
+
+import marisa_trie
+
+APOSTROPHES = str.maketrans({'’': "'", 'ʼ': "'"})
+
+
+def read_words(paths):
+    for path in paths:
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                # Hunspell .dic lines look like "слово/ABC"
+                word = line.split('/', 1)[0].strip()
+                if word and not word.isdigit():
+                    yield word.translate(APOSTROPHES).lower()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the spell-check pre-filter word list")
+    parser.add_argument('inputs', nargs='+', help="Plain text word lists, one word per line")
+    parser.add_argument('-o', '--output', default='data/uk_words.marisa', help="Output trie file")
+    args = parser.parse_args()
+
+    words = set(read_words(args.inputs))
+    if not words:
+        print("No words found", file=sys.stderr)
+        return 1
+
+    os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+    marisa_trie.Trie(words).save(args.output)
+    print(f"✅ Saved {len(words)} words to {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
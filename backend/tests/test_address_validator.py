@@ -0,0 +1,72 @@
+import marisa_trie
+import pytest
+
+from app.services import address_validator
+from app.services.address_validator import AddressValidatorService
+from app.services.gazetteer import Gazetteer
+
+
+NAMES = {
+    'c:київ': "Київ",
+    'c:львів': "Львів",
+    's:хрещатик': "Хрещатик",
+    's:тараса шевченка': "Тараса Шевченка",
+    's:лесі українки': "Лесі Українки",
+}
+
+
+@pytest.fixture
+def gazetteer(tmp_path, monkeypatch):
+    path = tmp_path / "gazetteer.marisa"
+    marisa_trie.BytesTrie((key, name.encode('utf-8')) for key, name in NAMES.items()).save(str(path))
+    gazetteer = Gazetteer(str(path))
+    monkeypatch.setattr(address_validator, 'gazetteer', gazetteer)
+    return gazetteer
+
+
+@pytest.fixture
+def validator():
+    return AddressValidatorService()
+
+
+@pytest.mark.parametrize("address", [
+    "м. Київ, вул. Хрещатик, 1",
+    "м. Київ, вул. Тараса Шевченка, 12",
+    "м. Львів, бульвар Лесі Українки, 5",
+    "м. Київ, вул. Тараса Шевченка, 12, кв. 3",
+])
+def test_correct_addresses(validator, gazetteer, address):
+    assert validator.is_correct_format(address)
+    assert validator.validate_text(f"Наша адреса: {address}.") == []
+
+
+def test_multi_word_street_name_is_found_whole(validator):
+    text = "Приходьте: вулиця Тараса Шевченка 12"
+    
+    addresses = validator.find_addresses(text)
+    
+    assert [a['address'] for a in addresses] == ["вулиця Тараса Шевченка 12"]
+
+
+def test_multi_word_street_name_is_checked_whole(validator, gazetteer):
+    errors = validator.validate_text("м. Київ, вул. Тараса Шевченко, 12")
+    
+    assert len(errors) == 1
+    assert errors[0]['issues'] == ['Невідома назва вулиці "Тараса Шевченко", можливо, "Тараса Шевченка"']
+    assert errors[0]['suggestion'] == "м. Київ, вул. Тараса Шевченка, 12"
+
+
+def test_misspelled_city_name(validator, gazetteer):
+    errors = validator.validate_text("м. Кииїв, вул. Хрещатик, 1")
+    
+    assert len(errors) == 1
+    assert errors[0]['suggestion'] == "м. Київ, вул. Хрещатик, 1"
+
+
+def test_incorrect_format(validator, gazetteer):
+    errors = validator.validate_text("місто Київ вулиця Тараса Шевченка 12")
+    
+    assert len(errors) == 1
+    assert errors[0]['address'] == "місто Київ вулиця Тараса Шевченка 12"
+    assert 'Відсутнє скорочення "м." перед назвою міста' in errors[0]['issues']
+    assert errors[0]['suggestion'] == "м. Київ, вул. Тараса Шевченка, 12"
@@ -0,0 +1,67 @@
+from bs4 import BeautifulSoup
+
+from app.services.boilerplate import BoilerplateDetector
+from app.services.text_extractor import TextExtractor
+
+
+PAGE = """<html><body>
+<nav><ul><li>Головна</li><li>Контакти</li></ul></nav>
+<main><p>{body}</p></main>
+<footer><p>м. Київ, вул. Хрещатик, 1</p></footer>
+</body></html>"""
+
+
+def page(body):
+    html = PAGE.format(body=body)
+    return html, TextExtractor().extract(BeautifulSoup(html, 'lxml'))
+
+
+def detector_with_pages(count, **kwargs):
+    detector = BoilerplateDetector(**kwargs)
+    pages = [page(f"Унікальний текст сторінки {i}") for i in range(count)]
+    for key, (_, blocks) in enumerate(pages):
+        detector.add_page(key, blocks)
+    return detector, pages
+
+
+def test_fingerprint_ignores_whitespace():
+    assert BoilerplateDetector.fingerprint(" Головна\n  сторінка ") == BoilerplateDetector.fingerprint("Головна сторінка")
+    assert BoilerplateDetector.fingerprint("Головна") != BoilerplateDetector.fingerprint("Контакти")
+
+
+def test_threshold_uses_min_pages_and_ratio():
+    detector, _ = detector_with_pages(20, min_pages=3, min_ratio=0.3)
+    assert detector.threshold == 6
+    
+    detector, _ = detector_with_pages(4, min_pages=3, min_ratio=0.3)
+    assert detector.threshold == 3
+
+
+def test_split_page_separates_template_blocks():
+    detector, pages = detector_with_pages(5, min_pages=3, min_ratio=0.3)
+    html, blocks = pages[0]
+    
+    result = detector.split_page(html, blocks)
+    
+    assert [block['text'] for block in result['blocks']] == ["Унікальний текст сторінки 0"]
+    assert result['text'] == "Унікальний текст сторінки 0"
+    shared = {block['text']: block for block in result['shared_blocks']}
+    assert set(shared) == {"Головна", "Контакти", "м. Київ, вул. Хрещатик, 1"}
+    assert all(block['page_count'] == 5 for block in shared.values())
+    assert "Хрещатик" in shared["м. Київ, вул. Хрещатик, 1"]['html']
+    
+    # Template blocks are removed from the HTML used by the HTML-based checks
+    assert "Хрещатик" not in result['html']
+    assert "Головна" not in result['html']
+    assert "Унікальний текст сторінки 0" in result['html']
+
+
+def test_split_page_keeps_blocks_below_threshold():
+    detector, pages = detector_with_pages(2, min_pages=3, min_ratio=0.3)
+    html, blocks = pages[0]
+    
+    result = detector.split_page(html, blocks)
+    
+    assert result['shared_blocks'] == []
+    assert result['blocks'] == blocks
+    assert result['html'] == html
@@ -0,0 +1,30 @@
+from app.core.celery_app import check_data_files
+from app.core.config import settings
+
+
+def test_missing_data_files_are_reported(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(settings, 'SPELL_PREFILTER_ENABLED', True)
+    monkeypatch.setattr(settings, 'SPELL_WORDLIST_PATH', str(tmp_path / "uk_words.marisa"))
+    monkeypatch.setattr(settings, 'GAZETTEER_ENABLED', True)
+    monkeypatch.setattr(settings, 'GAZETTEER_PATH', str(tmp_path / "uk_gazetteer.marisa"))
+    
+    check_data_files()
+    
+    out = capsys.readouterr().out
+    assert "uk_words.marisa not found: spell pre-filter disabled" in out
+    assert "uk_gazetteer.marisa not found: address place name checks disabled" in out
+
+
+def test_present_or_disabled_data_files_are_not_reported(tmp_path, monkeypatch, capsys):
+    wordlist = tmp_path / "uk_words.marisa"
+    wordlist.write_bytes(b"")
+    monkeypatch.setattr(settings, 'SPELL_WORDLIST_PATH', str(wordlist))
+    monkeypatch.setattr(settings, 'GAZETTEER_ENABLED', False)
+    monkeypatch.setattr(settings, 'GAZETTEER_PATH', str(tmp_path / "missing.marisa"))
+    check_data_files()
+    
+    monkeypatch.setattr(settings, 'SPELL_PREFILTER_ENABLED', False)
+    monkeypatch.setattr(settings, 'SPELL_WORDLIST_PATH', str(tmp_path / "missing.marisa"))
+    check_data_files()
+    
+    assert "not found" not in capsys.readouterr().out
@@ -0,0 +1,83 @@
+import random
+
+import pytest
+
+from app.services.duplicate_detector import DuplicateDetector
+from app.tasks.scan_website import other_pages
+
+
+def words(count, seed):
+    rng = random.Random(seed)
+    return ' '.join(f"слово{rng.randrange(10000)}" for _ in range(count))
+
+
+def test_exact_duplicates_are_grouped():
+    detector = DuplicateDetector()
+    detector.add_page(0, title="Головна", description="Опис")
+    detector.add_page(1, title=" головна ", description="Інший опис")
+    detector.add_page(2, title="Контакти", description="Опис", h1="Контакти")
+    
+    groups = {group['field']: group for group in detector.duplicate_groups()}
+    
+    assert set(groups) == {'title', 'description'}
+    assert groups['title'] == {'field': 'title', 'value': "Головна", 'pages': [0, 1]}
+    assert groups['description']['pages'] == [0, 2]
+
+
+def test_near_duplicates_are_grouped():
+    # hash() is randomized per process, so the distance of the near
+    # duplicate varies (a few bits); unrelated texts differ in about 32
+    detector = DuplicateDetector(max_distance=10, min_words=50)
+    text = words(1000, seed=1)
+    detector.add_page(0, text=text)
+    detector.add_page(1, text=text + " ще")
+    detector.add_page(2, text=words(1000, seed=2))
+    detector.add_page(3, text=words(20, seed=3))
+    
+    assert detector.near_duplicate_groups() == [[0, 1]]
+    # Short pages are skipped
+    assert 3 not in detector.simhashes
+
+
+@pytest.mark.parametrize("max_distance", [0, 3, 7, 12])
+def test_bands_find_every_pair_within_max_distance(max_distance, monkeypatch):
+    detector = DuplicateDetector(max_distance=max_distance, min_words=1)
+    rng = random.Random(max_distance)
+    base = rng.getrandbits(64)
+    simhashes = [base]
+    for _ in range(20):
+        flipped = sum(1 << bit for bit in rng.sample(range(64), max_distance))
+        simhashes.append(base ^ flipped)
+    
+    monkeypatch.setattr(detector, 'simhash', lambda words: simhashes[len(words) - 1])
+    for index in range(len(simhashes)):
+        detector.add_page(index, text=' '.join(['слово'] * (index + 1)))
+    
+    assert len(detector.band_bits) == max_distance + 1
+    assert detector.near_duplicate_groups() == [list(range(len(simhashes)))]
+
+
+def test_chained_near_duplicates_are_one_group(monkeypatch):
+    detector = DuplicateDetector(max_distance=3, min_words=1)
+    # Page 2 is near both 0 and 1, which are 4 bits apart
+    simhashes = [0, 0b1111, 0b0011]
+    monkeypatch.setattr(detector, 'simhash', lambda words: simhashes[len(words) - 1])
+    for index in range(len(simhashes)):
+        detector.add_page(index, text=' '.join(['слово'] * (index + 1)))
+    
+    assert [sorted(group) for group in detector.near_duplicate_groups()] == [[0, 1, 2]]
+
+
+@pytest.mark.parametrize("max_distance", [-1, 64])
+def test_max_distance_is_validated(max_distance):
+    with pytest.raises(ValueError):
+        DuplicateDetector(max_distance=max_distance)
+
+
+def test_other_pages_excludes_own_page():
+    urls = [f"https://example.com/{i}" for i in range(8)]
+    
+    assert other_pages(urls[:3], 1) == "https://example.com/0, https://example.com/2"
+    assert other_pages(urls, 0, limit=2) == "https://example.com/1, https://example.com/2 та ще 5"
+    assert other_pages(urls, 1, limit=2) == "https://example.com/0, https://example.com/2 та ще 5"
+    assert other_pages(urls, 7, limit=2) == "https://example.com/0, https://example.com/1 та ще 5"
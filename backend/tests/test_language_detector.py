@@ -0,0 +1,43 @@
+import pytest
+
+from app.services.language_detector import LanguageDetector
+
+
+@pytest.fixture(scope='module')
+def detector():
+    return LanguageDetector()
+
+
+@pytest.mark.parametrize("language, size", [(LanguageDetector.UKRAINIAN, 58), (LanguageDetector.RUSSIAN, 54)])
+def test_trigram_profiles(detector, language, size):
+    trigrams = LanguageDetector.TRIGRAM_PROFILES[language]
+    
+    assert len(trigrams) == size
+    assert all(len(trigram) == 3 for trigram in trigrams)
+    # No duplicates: every trigram keeps the weight of its rank
+    assert len(detector.profiles[language]) == size
+    assert detector.profiles[language][trigrams[0].replace('_', ' ')] == size
+    assert detector.profiles[language][trigrams[-1].replace('_', ' ')] == 1
+
+
+@pytest.mark.parametrize("text, language", [
+    ("Ми працюємо для вас щодня, з понеділка по п'ятницю.", LanguageDetector.UKRAINIAN),
+    ("Доставка по всій Україні протягом двох днів", LanguageDetector.UKRAINIAN),
+    ("Мы работаем для вас каждый день, это удобно.", LanguageDetector.RUSSIAN),
+    ("Доставка по всей стране в течение двух дней", LanguageDetector.RUSSIAN),
+    ("Free shipping on all orders", LanguageDetector.ENGLISH),
+    ("SKU-12345-XL", LanguageDetector.OTHER),
+    ("+380 44 123 45 67", LanguageDetector.OTHER),
+])
+def test_detect(detector, text, language):
+    assert detector.detect(text) == language
+
+
+def test_group_blocks(detector):
+    texts = ["Ми працюємо щодня.", "Free shipping", "", "Мы работаем каждый день."]
+    
+    blocks, byte_counts = detector.group_blocks(texts)
+    
+    assert blocks == {'uk': [0], 'en': [1], 'ru': [3]}
+    assert byte_counts['uk'] == len(texts[0].encode('utf-8'))
+    assert byte_counts['en'] == len(texts[1])
@@ -0,0 +1,39 @@
+import asyncio
+
+import pytest
+
+from app.models.error import ErrorType
+from app.services.page_checkers import AddressChecker, PageChecker, PageCheckRunner
+
+
+PREFERENCES = {'check_links': False, 'check_seo': False, 'check_phones': False}
+
+
+def test_checker_must_implement_check():
+    class Incomplete(PageChecker):
+        name = 'incomplete'
+    
+    runner = PageCheckRunner("https://example.com", PREFERENCES)
+    with pytest.raises(TypeError):
+        Incomplete(runner)
+
+
+def test_checkers_enabled_by_preferences():
+    runner = PageCheckRunner("https://example.com", PREFERENCES)
+    
+    assert [checker.name for checker in runner.checkers] == ['addresses']
+
+
+def test_address_checker_uses_the_runner_validator():
+    runner = PageCheckRunner("https://example.com", PREFERENCES)
+    checker = next(checker for checker in runner.checkers if isinstance(checker, AddressChecker))
+    block = {'text': "Адреса: місто Київ вулиця Хрещатик 1", 'path': 'footer > p', 'offsets': [], 'line': 10, 'column': 5}
+    page = {'url': "https://example.com", 'depth': 0, 'html_content': ""}
+    
+    findings = asyncio.run(runner.check(page, {'blocks': [block], 'html': ""}))
+    
+    assert [f['error_type'] for f in findings] == [ErrorType.ADDRESS]
+    assert findings[0]['element_path'] == 'footer > p'
+    # Template blocks of the scan are checked with the same memoized validator
+    assert checker.runner.address_validator is runner.address_validator
+    assert runner.address_validator.check_address.cache_info().currsize == 1
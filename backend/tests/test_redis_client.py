@@ -0,0 +1,36 @@
+import redis
+import redis.asyncio as aioredis
+
+from app.core.config import settings
+from app.core.redis_client import OptionalRedis
+
+
+def test_clients_are_created_once():
+    clients = OptionalRedis("Test")
+    
+    assert isinstance(clients.client, redis.Redis)
+    assert clients.client is clients.client
+    assert isinstance(clients.async_client, aioredis.Redis)
+    assert clients.async_client is clients.async_client
+    kwargs = clients.client.connection_pool.connection_kwargs
+    assert kwargs['socket_timeout'] == kwargs['socket_connect_timeout'] == OptionalRedis.TIMEOUT
+
+
+def test_disabled_feature_has_no_clients():
+    enabled = False
+    clients = OptionalRedis("Test", lambda: enabled)
+    
+    assert clients.client is None
+    assert clients.async_client is None
+    
+    enabled = True
+    assert clients.client is not None
+
+
+def test_invalid_url_has_no_clients(monkeypatch, capsys):
+    monkeypatch.setattr(settings, 'REDIS_URL', "invalid://localhost")
+    clients = OptionalRedis("Test")
+    
+    assert clients.client is None
+    assert clients.async_client is None
+    assert "Test Redis connection failed" in capsys.readouterr().out
@@ -0,0 +1,76 @@
+import re
+
+import pytest
+
+from app.core.config import settings
+from app.services import regex_engine
+from app.services.address_validator import AddressValidatorService
+from app.services.link_checker import LinkCheckerService
+from app.services.regex_engine import compile_pattern, normalize_spaces
+
+
+ENGINES = ['re', pytest.param('re2', marks=pytest.mark.skipif(regex_engine.re2 is None, reason="google-re2 not installed"))]
+
+
+@pytest.fixture(params=ENGINES)
+def engine(request, monkeypatch):
+    monkeypatch.setattr(settings, 'REGEX_ENGINE', request.param)
+    compile_pattern.cache_clear()
+    yield request.param
+    compile_pattern.cache_clear()
+
+
+def test_compile_pattern_uses_configured_engine(engine):
+    pattern = compile_pattern(r'\d+')
+    
+    assert pattern.search("вул. Хрещатик, 22").group(0) == "22"
+    if engine == 're':
+        assert isinstance(pattern, re.Pattern)
+    else:
+        assert not isinstance(pattern, re.Pattern)
+
+
+@pytest.mark.skipif(regex_engine.re2 is None, reason="google-re2 not installed")
+def test_unsupported_pattern_falls_back_to_re(monkeypatch):
+    monkeypatch.setattr(settings, 'REGEX_ENGINE', 're2')
+    compile_pattern.cache_clear()
+    
+    # Backreferences are not supported by RE2
+    assert isinstance(compile_pattern(r'(\w+) \1'), re.Pattern)
+    compile_pattern.cache_clear()
+
+
+def test_normalize_spaces_keeps_offsets():
+    text = "м.\xa0Київ, вул. Хрещатик,　1\nтел."
+    normalized = normalize_spaces(text)
+    
+    assert normalized == "м. Київ, вул. Хрещатик, 1\nтел."
+    assert len(normalized) == len(text)
+
+
+@pytest.mark.parametrize("text", [
+    "Наша адреса: м. Київ, вулиця Хрещатик 1",
+    "Наша адреса: м.\xa0Київ, вулиця\xa0Хрещатик\xa01",
+])
+def test_addresses_found_with_unicode_spaces(engine, text):
+    errors = AddressValidatorService().validate_text(text)
+    
+    assert len(errors) == 1
+    assert errors[0]['position'] == text.index("м.")
+
+
+@pytest.mark.parametrize("html", [
+    "<p>Телефон: 044 123 45 67</p>",
+    "<p>Телефон: 044\xa0123\xa045\xa067</p>",
+    "<p>Телефон: 044&nbsp;123&nbsp;45&nbsp;67</p>",
+])
+def test_phones_found_with_unicode_spaces(engine, html):
+    errors = LinkCheckerService().check_phone_numbers(html)
+    
+    assert [err['phone_number'] for err in errors] == ["044 123 45 67"]
+
+
+def test_clickable_phone_with_unicode_spaces(engine):
+    html = '<p>Телефон: <a href="tel:+380441234567">044&nbsp;123&nbsp;45&nbsp;67</a></p>'
+    
+    assert LinkCheckerService().check_phone_numbers(html) == []
@@ -0,0 +1,97 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.core.database import Base
+from app.models import ScanSession, Website
+from app.models.scan_session import ScanStatus
+from app.services.scan_coalescer import ScanCoalescer
+
+
+PREFERENCES_HASH = ScanCoalescer.preferences_hash({'check_seo': True, 'max_pages': 100})
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def website(db):
+    website = Website(url="https://example.com", domain="example.com")
+    db.add(website)
+    db.commit()
+    return website
+
+
+def add_scan(db, website, status=ScanStatus.RUNNING, age=60, started_age=None, preferences_hash=PREFERENCES_HASH):
+    now = datetime.utcnow()
+    scan = ScanSession(
+        website_id=website.id,
+        status=status,
+        preferences_hash=preferences_hash,
+        created_at=now - timedelta(seconds=age),
+        started_at=now - timedelta(seconds=started_age) if started_age is not None else None,
+    )
+    db.add(scan)
+    db.commit()
+    return scan
+
+
+def find(db, website):
+    return ScanCoalescer().find_duplicate_sync(db, website.id, PREFERENCES_HASH)
+
+
+def test_preferences_hash_ignores_key_order():
+    assert ScanCoalescer.preferences_hash({'a': 1, 'b': 2}) == ScanCoalescer.preferences_hash({'b': 2, 'a': 1})
+    assert ScanCoalescer.preferences_hash(None) == ScanCoalescer.preferences_hash({})
+
+
+def test_pending_or_running_scan_is_a_duplicate(db, website):
+    add_scan(db, website, ScanStatus.COMPLETED)
+    add_scan(db, website, preferences_hash=ScanCoalescer.preferences_hash({}))
+    assert find(db, website) is None
+    
+    pending = add_scan(db, website, ScanStatus.PENDING, age=30)
+    
+    assert find(db, website).id == pending.id
+
+
+def test_stuck_scan_is_not_a_duplicate(db, website, monkeypatch):
+    monkeypatch.setattr(settings, 'SCAN_COALESCE_MAX_AGE', 1800)
+    add_scan(db, website, ScanStatus.RUNNING, age=7200, started_age=7000)
+    add_scan(db, website, ScanStatus.PENDING, age=3600)
+    
+    assert find(db, website) is None
+
+
+def test_scan_started_recently_is_a_duplicate(db, website, monkeypatch):
+    monkeypatch.setattr(settings, 'SCAN_COALESCE_MAX_AGE', 1800)
+    # Queued for long, but started within the limit
+    scan = add_scan(db, website, ScanStatus.RUNNING, age=3600, started_age=600)
+    
+    assert find(db, website).id == scan.id
+
+
+def test_locks_continue_without_redis(monkeypatch, capsys):
+    monkeypatch.setattr(settings, 'REDIS_URL', "redis://localhost:1/0")
+    coalescer = ScanCoalescer()
+    
+    async def create_scan():
+        async with coalescer.lock(1):
+            return True
+    
+    assert asyncio.run(create_scan())
+    with coalescer.sync_lock(1):
+        pass
+    
+    assert capsys.readouterr().out.count("Scan creation lock failed") == 2
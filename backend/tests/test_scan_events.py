@@ -0,0 +1,130 @@
+import asyncio
+import json
+import threading
+
+import pytest
+from redis.exceptions import ConnectionError
+
+from app.core.config import settings
+from app.services.scan_events import ScanEvents, ScanProgressPublisher
+
+
+PROGRESS = {'status': 'running', 'pages_found': 10, 'pages_processed': 2, 'errors_found': 1}
+
+
+class FakePubSub:
+    def __init__(self, messages, fail=False):
+        self.messages = list(messages)
+        self.fail = fail
+        self.closed = False
+    
+    async def subscribe(self, channel):
+        if self.fail:
+            raise ConnectionError("Connection refused")
+    
+    async def get_message(self, ignore_subscribe_messages, timeout):
+        if not self.messages:
+            raise AssertionError("stream did not end")
+        return self.messages.pop(0)
+    
+    async def aclose(self):
+        self.closed = True
+
+
+class FakeRedis:
+    def __init__(self, pubsub, snapshot=None):
+        self._pubsub = pubsub
+        self.snapshot = snapshot
+    
+    def pubsub(self):
+        return self._pubsub
+    
+    async def get(self, key):
+        return self.snapshot
+
+
+def collect(events, progress=PROGRESS):
+    async def run():
+        return [chunk async for chunk in events.stream(1, progress)]
+    return asyncio.run(run())
+
+
+def event_data(chunk):
+    return json.loads(chunk.split('data: ', 1)[1])
+
+
+@pytest.fixture
+def enabled(monkeypatch):
+    monkeypatch.setattr(settings, 'SCAN_EVENTS_ENABLED', True)
+
+
+def test_disabled_events_send_the_database_progress_and_end(monkeypatch):
+    monkeypatch.setattr(settings, 'SCAN_EVENTS_ENABLED', False)
+    events = ScanEvents()
+    
+    chunks = collect(events)
+    
+    assert [event_data(chunk) for chunk in chunks] == [PROGRESS]
+    assert events.redis._async_client is None
+
+
+def test_finished_scan_ends_without_subscribing(enabled):
+    events = ScanEvents()
+    
+    chunks = collect(events, {**PROGRESS, 'status': 'completed'})
+    
+    assert len(chunks) == 1
+    assert events.redis._async_client is None
+
+
+def test_events_until_the_scan_completes(enabled):
+    pubsub = FakePubSub([
+        None,
+        {'data': json.dumps({'event': 'progress', 'data': {**PROGRESS, 'pages_processed': 5}})},
+        {'data': json.dumps({'event': 'status', 'data': {**PROGRESS, 'status': 'completed'}})},
+    ])
+    events = ScanEvents()
+    events.redis._async_client = FakeRedis(pubsub, snapshot=json.dumps({**PROGRESS, 'pages_processed': 3}))
+    
+    chunks = collect(events)
+    
+    assert chunks[2] == ": keep-alive\n\n"
+    assert [event_data(chunk)['pages_processed'] for chunk in chunks if chunk.startswith('event:')] == [2, 3, 5, 2]
+    assert chunks[-1].startswith('event: status')
+    assert pubsub.closed
+
+
+def test_redis_failure_ends_the_stream(enabled):
+    pubsub = FakePubSub([], fail=True)
+    events = ScanEvents()
+    events.redis._async_client = FakeRedis(pubsub)
+    
+    chunks = collect(events)
+    
+    assert [event_data(chunk) for chunk in chunks] == [PROGRESS]
+    assert pubsub.closed
+
+
+class RecordingEvents:
+    def __init__(self):
+        self.published = []
+    
+    def publish(self, scan_session_id, event, data):
+        self.published.append((threading.current_thread(), data))
+
+
+def test_progress_is_published_off_the_event_loop():
+    events = RecordingEvents()
+    publisher = ScanProgressPublisher(1, events)
+    
+    async def check_pages():
+        await publisher.update_async(PROGRESS, url="https://example.com/", findings=[])
+        # Throttled: recorded, published with the next event
+        await publisher.update_async({**PROGRESS, 'pages_processed': 3}, url="https://example.com/a")
+    
+    asyncio.run(check_pages())
+    publisher.flush()
+    
+    assert [data['pages_processed'] for _, data in events.published] == [2, 3]
+    assert events.published[0][0] is not threading.main_thread()
+    assert [page['url'] for page in events.published[1][1]['pages']] == ["https://example.com/a"]
@@ -0,0 +1,41 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.services.scan_scheduler import EPOCH, next_scan_time, schedule_offset
+
+
+@pytest.mark.parametrize("interval_hours", [1, 24, 168])
+def test_offset_is_stable_and_within_the_interval(interval_hours):
+    offsets = [schedule_offset(website_id, interval_hours) for website_id in range(200)]
+    
+    assert offsets == [schedule_offset(website_id, interval_hours) for website_id in range(200)]
+    assert all(0 <= offset < interval_hours * 3600 for offset in offsets)
+
+
+def test_offsets_are_spread_over_the_interval():
+    hours = {schedule_offset(website_id, 24) // 3600 for website_id in range(500)}
+    
+    # Daily scans of many websites start in every hour of the day
+    assert hours == set(range(24))
+
+
+@pytest.mark.parametrize("interval_hours", [1, 24, 168])
+def test_next_scan_time_is_the_next_slot(interval_hours):
+    after = datetime(2026, 3, 15, 13, 37, 12)
+    interval = timedelta(hours=interval_hours)
+    
+    for website_id in range(50):
+        scan_time = next_scan_time(website_id, interval_hours, after)
+        
+        assert after < scan_time <= after + interval
+        elapsed = (scan_time - EPOCH).total_seconds()
+        assert elapsed % (interval_hours * 3600) == schedule_offset(website_id, interval_hours)
+
+
+def test_next_scan_time_after_a_slot_is_the_following_one():
+    after = datetime(2026, 3, 15)
+    scan_time = next_scan_time(7, 24, after)
+    
+    assert next_scan_time(7, 24, scan_time) == scan_time + timedelta(hours=24)
+    assert next_scan_time(7, 24, scan_time - timedelta(seconds=1)) == scan_time
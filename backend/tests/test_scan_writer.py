@@ -0,0 +1,114 @@
+import pytest
+from bs4 import BeautifulSoup
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base
+from app.models import Error, Page, ScanSession, Website
+from app.models.error import ErrorSeverity, ErrorType
+from app.services.page_checkers import block_location
+from app.services.scan_writer import ScanWriter
+from app.services.source_index import SourceIndex
+from app.services.text_extractor import TextExtractor
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def scan_session(db):
+    website = Website(url="https://example.com", domain="example.com")
+    db.add(website)
+    db.flush()
+    scan_session = ScanSession(website_id=website.id, pages_found=3, pages_processed=0, errors_found=0)
+    db.add(scan_session)
+    db.commit()
+    return scan_session
+
+
+def page(index):
+    return {'url': f"https://example.com/{index}", 'title': f"Сторінка {index}", 'status_code': 200}
+
+
+def finding(message):
+    return {'error_type': ErrorType.SEO, 'severity': ErrorSeverity.WARNING, 'message': message}
+
+
+def test_flush_writes_pages_findings_and_progress(db, scan_session):
+    writer = ScanWriter(db, scan_session.id, batch_pages=2)
+    writer.add_page(0, page(0), [finding("Немає опису")])
+    assert not writer.batch_full
+    writer.add_page(1, page(1))
+    writer.add_finding(1, finding("Немає H1"))
+    assert writer.batch_full
+    
+    progress = writer.flush()
+    
+    assert progress == {'pages_found': 3, 'pages_processed': 2, 'errors_found': 2}
+    pages = db.execute(select(Page).order_by(Page.id)).scalars().all()
+    assert [p.url for p in pages] == ["https://example.com/0", "https://example.com/1"]
+    assert writer.page_ids == {0: pages[0].id, 1: pages[1].id}
+    messages = {e.message: e.page_id for e in db.execute(select(Error)).scalars()}
+    assert messages == {"Немає опису": pages[0].id, "Немає H1": pages[1].id}
+    assert writer.findings_added == 2
+
+
+def test_findings_of_unwritten_pages_wait_for_the_page(db, scan_session):
+    writer = ScanWriter(db, scan_session.id, batch_pages=10)
+    writer.add_page(0, page(0))
+    writer.flush()
+    
+    # A site-wide finding for a written page and one for a page still buffered
+    writer.add_finding(0, finding("Дублікат заголовка"))
+    writer.add_finding(1, finding("Дублікат опису"))
+    progress = writer.flush()
+    
+    assert progress['errors_found'] == 1
+    assert db.execute(select(func.count(Error.id))).scalar() == 1
+    
+    writer.add_page(1, page(1))
+    progress = writer.flush()
+    
+    assert progress == {'pages_found': 3, 'pages_processed': 2, 'errors_found': 2}
+    error = db.execute(select(Error).where(Error.message == "Дублікат опису")).scalar_one()
+    assert error.page_id == writer.page_ids[1]
+
+
+def test_pages_counted_when_checked(db, scan_session):
+    crawl_writer = ScanWriter(db, scan_session.id, count_pages=False)
+    crawl_writer.add_page(0, page(0))
+    crawl_writer.add_page(1, page(1))
+    
+    assert crawl_writer.flush()['pages_processed'] == 0
+    
+    check_writer = ScanWriter(db, scan_session.id)
+    for index, page_id in crawl_writer.page_ids.items():
+        check_writer.add_checked_page(index, page_id)
+    check_writer.add_finding(1, finding("Помилка правопису"))
+    progress = check_writer.flush()
+    
+    assert progress == {'pages_found': 3, 'pages_processed': 2, 'errors_found': 1}
+    error = db.execute(select(Error)).scalar_one()
+    assert error.page_id == crawl_writer.page_ids[1]
+
+
+def test_deeply_nested_element_path(db, scan_session):
+    html = "<html><body>" + "<div>" * 100 + "<p>Текст</p>" + "</div>" * 100 + "</body></html>"
+    block = TextExtractor().extract(BeautifulSoup(html, 'lxml'), SourceIndex(html))[0]
+    location = block_location(block)
+    assert len(location['element_path']) > 500
+    
+    writer = ScanWriter(db, scan_session.id)
+    writer.add_page(0, page(0), [{**finding("Помилка"), **location}])
+    writer.flush()
+    
+    # The column is unbounded: PostgreSQL would reject the batch otherwise
+    assert Error.__table__.c.element_path.type.length is None
+    assert db.execute(select(Error.element_path)).scalar_one() == location['element_path']
@@ -0,0 +1,71 @@
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from app.services import seo_checker
+from app.services.seo_checker import SEOCheckerService
+
+
+class FakeHostInfoCache:
+    """Records the threads the cache is used from."""
+    
+    def __init__(self, info=None):
+        self.info = info
+        self.stored = {}
+        self.threads = []
+    
+    def get(self, origin):
+        self.threads.append(threading.current_thread())
+        return self.info
+    
+    def set(self, origin, info):
+        self.threads.append(threading.current_thread())
+        self.stored[origin] = info
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = FakeHostInfoCache()
+    monkeypatch.setattr(seo_checker, 'host_info_cache', cache)
+    return cache
+
+
+def handler(request):
+    if request.url.path == '/robots.txt':
+        return httpx.Response(200, text="User-agent: *\nAllow: /\nSitemap: https://example.com/sitemap.xml")
+    return httpx.Response(404)
+
+
+async def host_info(checker, *urls):
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        checker.client = client
+        return [await checker.get_host_info(url) for url in urls]
+
+
+def test_host_is_probed_once_and_cached(cache):
+    checker = SEOCheckerService()
+    
+    first, second = asyncio.run(host_info(checker, "https://example.com/a", "https://example.com/b"))
+    
+    assert first is second
+    assert first['robots']['exists'] and first['has_sitemap']
+    assert not first['has_favicon_file']
+    assert cache.stored == {"https://example.com": first}
+
+
+def test_cached_host_info_is_not_probed(cache):
+    cache.info = {'robots': {'exists': False}, 'has_favicon_file': True, 'has_sitemap': False}
+    
+    [info] = asyncio.run(host_info(SEOCheckerService(), "https://example.com/"))
+    
+    assert info == cache.info
+    assert cache.stored == {}
+
+
+def test_redis_is_not_used_on_the_event_loop(cache):
+    asyncio.run(host_info(SEOCheckerService(), "https://example.com/"))
+    
+    assert len(cache.threads) == 2
+    assert threading.main_thread() not in cache.threads
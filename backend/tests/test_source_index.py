@@ -0,0 +1,45 @@
+from bs4 import BeautifulSoup
+
+from app.services.source_index import SourceIndex
+
+
+def test_location_is_one_based():
+    index = SourceIndex("ab\ncd\n\nef")
+    
+    assert index.location(0) == (1, 1)
+    assert index.location(1) == (1, 2)
+    assert index.location(2) == (1, 3)  # the newline ends line 1
+    assert index.location(3) == (2, 1)
+    assert index.location(6) == (3, 1)
+    assert index.location(8) == (4, 2)
+
+
+def test_find_from_offset():
+    index = SourceIndex("текст, ще текст")
+    
+    assert index.find("текст") == 0
+    assert index.find("текст", 1) == 10
+    assert index.find("немає") == -1
+
+
+def test_element_locations():
+    source = (
+        "<html><head>\n"
+        "<title>Назва</title>\n"
+        "  <meta name=\"description\" content=\"Опис\">\n"
+        "<meta charset=\"utf-8\">\n"
+        "</head><body>\n"
+        "<a href=\"/about\">Про нас</a> <A HREF=\"/contacts\">Контакти</A>\n"
+        "<a href=\"/about\">Ще раз</a>\n"
+        "<img src=\"/logo.png\">\n"
+        "</body></html>"
+    )
+    locations = SourceIndex(source).element_locations(BeautifulSoup(source, 'lxml'))
+    
+    assert locations[SourceIndex.element_key('title')] == [2, 1]
+    assert locations[SourceIndex.element_key('meta', 'description')] == [3, 3]
+    assert locations[SourceIndex.element_key('meta', 'charset')] == [4, 1]
+    assert locations[SourceIndex.element_key('a', '/contacts')] == [6, 30]
+    # The first element with a key is reported
+    assert locations[SourceIndex.element_key('a', '/about')] == [6, 1]
+    assert locations[SourceIndex.element_key('img', '/logo.png')] == [8, 1]
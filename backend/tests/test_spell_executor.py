@@ -0,0 +1,51 @@
+import pytest
+
+from app.core.celery_app import celery_app
+from app.core.config import settings
+from app.services.spell_executor import SpellCheckExecutor
+
+
+class FailedResult:
+    """Async result of a batch that failed on the spellcheck queue."""
+    
+    def ready(self):
+        return True
+    
+    def get(self, **kwargs):
+        raise RuntimeError("worker lost")
+    
+    def forget(self):
+        pass
+
+
+@pytest.fixture
+def executor(monkeypatch):
+    monkeypatch.setattr(settings, 'SPELL_CHECK_QUEUE_ENABLED', True)
+    monkeypatch.setattr(celery_app, 'send_task', lambda *args, **kwargs: FailedResult())
+    return SpellCheckExecutor()
+
+
+def test_failed_batch_is_checked_inline(executor, monkeypatch):
+    monkeypatch.setattr(executor, 'check_inline', lambda texts, language: [[{'offset': 0}] for _ in texts])
+    executor.submit('batch', ["Текст.", "Ще текст."])
+    
+    assert list(executor.wait_all()) == [('batch', [[{'offset': 0}], [{'offset': 0}]])]
+    assert executor.fallback_batches == 1
+    assert "worker lost" in executor.failure_message()
+    assert "checked inline" in executor.failure_message()
+
+
+def test_batch_failing_inline_too_is_reported(executor, monkeypatch):
+    def check_inline(texts, language):
+        raise RuntimeError("LanguageTool unavailable")
+    
+    monkeypatch.setattr(executor, 'check_inline', check_inline)
+    executor.submit('batch', ["Текст."])
+    
+    assert list(executor.wait_all()) == []
+    assert executor.failed_batches == 1
+    assert "no spelling results" in executor.failure_message()
+
+
+def test_no_failures_no_message(monkeypatch):
+    assert SpellCheckExecutor().failure_message() is None
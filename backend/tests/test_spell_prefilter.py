@@ -0,0 +1,52 @@
+import pytest
+
+from app.services.spell_prefilter import SpellPreFilter
+
+
+@pytest.fixture
+def prefilter(tmp_path):
+    wordlist = tmp_path / "words.txt"
+    wordlist.write_text("ми\nпрацюємо\nщодня\nпам'ять\nсвіжа\nкава\nчорний\nбілий\n", encoding='utf-8')
+    prefilter = SpellPreFilter(str(wordlist))
+    prefilter.load()
+    return prefilter
+
+
+def test_known_sentence_is_skipped(prefilter):
+    assert prefilter.filter(["Ми працюємо щодня."]) == []
+
+
+def test_unknown_word_is_checked(prefilter):
+    assert prefilter.filter(["Ми працуємо щодня."]) == ["Ми працуємо щодня."]
+
+
+def test_whitelist_and_latin_words_are_known(prefilter):
+    assert not prefilter.needs_check("Свіжа кава Lavazza.", {"свіжа"})
+    assert prefilter.needs_check("Свіжа кава Лавацца.")
+    assert not prefilter.needs_check("Свіжа кава Лавацца.", {"лавацца"})
+
+
+def test_apostrophes_and_compound_words(prefilter):
+    assert not prefilter.needs_check("Пам’ять свіжа.")
+    assert not prefilter.needs_check("Пам'ять свіжа.")
+    assert not prefilter.needs_check("Кава чорний-білий.")
+    assert prefilter.needs_check("Кава чорний-сірий.")
+
+
+@pytest.mark.parametrize("sentence", [
+    "Ми працюємо щодня , кава.",  # space before punctuation
+    "Ми працюємо щодня,кава.",  # missing space after punctuation
+    "Ми працюємо працюємо щодня.",  # repeated word
+    "Ми працюємо \"щодня\".",  # straight quotes
+    "ми працюємо щодня.",  # lowercase start
+    "Ми прaцюємо щодня.",  # Latin "a" inside a Cyrillic word
+])
+def test_suspicious_patterns_are_checked(prefilter, sentence):
+    assert prefilter.needs_check(sentence)
+
+
+def test_missing_word_list_disables_filter(tmp_path):
+    prefilter = SpellPreFilter(str(tmp_path / "missing.marisa"))
+    sentences = ["Ми працюємо щодня.", "Абракадабра."]
+    assert not prefilter.enabled
+    assert prefilter.filter(sentences) == sentences
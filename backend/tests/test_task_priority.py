@@ -0,0 +1,50 @@
+import pytest
+
+from app.core.config import settings
+from app.models.scan_session import ScanPriority
+from app.tasks.scan_website import scan_task_priority, task_priority
+
+
+@pytest.fixture(autouse=True)
+def priorities(monkeypatch):
+    monkeypatch.setattr(settings, 'SCAN_SCHEDULED_PRIORITY_OFFSET', 3)
+    monkeypatch.setattr(settings, 'SCAN_FAIR_SHARE_PAGES', 200)
+
+
+def test_scheduled_scans_start_below_interactive():
+    assert task_priority(ScanPriority.INTERACTIVE) == 0
+    assert task_priority(ScanPriority.SCHEDULED) == 3
+
+
+def test_priority_drops_with_pages_before():
+    assert task_priority(ScanPriority.INTERACTIVE, 199) == 0
+    assert task_priority(ScanPriority.INTERACTIVE, 200) == 1
+    assert task_priority(ScanPriority.SCHEDULED, 1000) == 8
+    # Never below the lowest priority
+    assert task_priority(ScanPriority.SCHEDULED, 10000) == 9
+
+
+def test_weight_scales_the_fair_share():
+    assert task_priority(ScanPriority.INTERACTIVE, 400, weight=2) == 1
+    assert task_priority(ScanPriority.INTERACTIVE, 400, weight=0.5) == 4
+    # Invalid weights count as 1
+    assert task_priority(ScanPriority.INTERACTIVE, 400, weight=0) == 2
+    assert task_priority(ScanPriority.INTERACTIVE, 400, weight=-1) == 2
+
+
+def test_scan_task_priority_without_fanout(monkeypatch):
+    monkeypatch.setattr(settings, 'SCAN_FANOUT_ENABLED', False)
+    
+    assert scan_task_priority(ScanPriority.INTERACTIVE, {'max_pages': 100}) == 0
+    assert scan_task_priority(ScanPriority.INTERACTIVE, {'max_pages': 1000}) == 5
+    assert scan_task_priority(ScanPriority.INTERACTIVE, {'max_pages': 1000, 'scan_weight': 5}) == 1
+    assert scan_task_priority(ScanPriority.SCHEDULED, {'max_pages': 500}) == 5
+    assert scan_task_priority(ScanPriority.SCHEDULED, None) == 3
+
+
+def test_scan_task_priority_with_fanout(monkeypatch):
+    monkeypatch.setattr(settings, 'SCAN_FANOUT_ENABLED', True)
+    
+    # The page checks are prioritized instead
+    assert scan_task_priority(ScanPriority.INTERACTIVE, {'max_pages': 1000}) == 0
+    assert scan_task_priority(ScanPriority.SCHEDULED, {'max_pages': 1000}) == 3
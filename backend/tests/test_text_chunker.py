@@ -0,0 +1,61 @@
+from app.services.text_chunker import TextChunker
+
+
+def test_split_sentences_keeps_offsets():
+    text = "Перше речення. Друге речення!\nТретій абзац"
+    sentences = TextChunker().split_sentences(text)
+    
+    assert [sentence for _, sentence in sentences] == ["Перше речення.", "Друге речення!", "Третій абзац"]
+    for offset, sentence in sentences:
+        assert text[offset:offset + len(sentence)] == sentence
+
+
+def test_abbreviations_do_not_end_sentences():
+    sentences = TextChunker().split_sentences("Адреса: м. Київ, вул. Хрещатик, 1. Працюємо щодня.")
+    
+    assert [sentence for _, sentence in sentences] == [
+        "Адреса: м. Київ, вул. Хрещатик, 1.",
+        "Працюємо щодня.",
+    ]
+
+
+def test_long_segments_are_split_at_word_boundaries():
+    chunker = TextChunker(target_size=100, max_size=20)
+    text = "слово " * 10
+    
+    segments = chunker.split_long(text.strip(), 5)
+    
+    assert all(len(segment) <= 20 for _, segment in segments)
+    assert " ".join(segment for _, segment in segments) == text.strip()
+    assert segments[0][0] == 5
+    for offset, segment in segments:
+        assert text[offset - 5:offset - 5 + len(segment)] == segment
+
+
+def test_pack_respects_target_size():
+    chunker = TextChunker(target_size=30, max_size=100)
+    segments = ["a" * 10, "b" * 10, "c" * 10, "d" * 25]
+    
+    chunks = chunker.pack(segments)
+    
+    assert [text for text, _ in chunks] == ["a" * 10 + "\n\n" + "b" * 10, "c" * 10, "d" * 25]
+    assert [offsets for _, offsets in chunks] == [[0, 12], [0], [0]]
+
+
+def test_unpack_maps_matches_to_segments():
+    chunker = TextChunker(target_size=1000, max_size=1000)
+    segments = ["Перше речення.", "Друге речення."]
+    [(text, offsets)] = chunker.pack(segments)
+    
+    second = text.index("речення", offsets[1])
+    matches = [
+        {'offset': 0, 'length': 5},
+        {'offset': second, 'length': 7},
+        # Spans the separator: dropped
+        {'offset': offsets[1] - 3, 'length': 5},
+    ]
+    
+    results = chunker.unpack(segments, offsets, matches)
+    
+    assert results["Перше речення."] == [{'offset': 0, 'length': 5}]
+    assert results["Друге речення."] == [{'offset': 6, 'length': 7}]
@@ -0,0 +1,60 @@
+from bs4 import BeautifulSoup
+
+from app.services.source_index import SourceIndex
+from app.services.text_extractor import TextExtractor
+
+
+HTML = """<html><body>
+<div id="menu"><ul><li>Головна</li><li>Контакти</li></ul></div>
+<div><h1>Заголовок</h1><p>Перший абзац.</p><p>Другий <b>абзац</b>.</p></div>
+<script>var x = "не текст";</script>
+</body></html>"""
+
+
+def extract(html):
+    return TextExtractor().extract(BeautifulSoup(html, 'lxml'), SourceIndex(html))
+
+
+def test_blocks_are_split_by_block_elements():
+    blocks = extract(HTML)
+    
+    assert [(block['tag'], block['text']) for block in blocks] == [
+        ('li', 'Головна'),
+        ('li', 'Контакти'),
+        ('h1', 'Заголовок'),
+        ('p', 'Перший абзац.'),
+        ('p', 'Другий абзац .'),
+    ]
+
+
+def test_dom_paths():
+    paths = [block['path'] for block in extract(HTML)]
+    
+    assert paths == [
+        'div#menu > ul > li:nth-of-type(1)',
+        'div#menu > ul > li:nth-of-type(2)',
+        'body > div:nth-of-type(2) > h1',
+        'body > div:nth-of-type(2) > p:nth-of-type(1)',
+        'body > div:nth-of-type(2) > p:nth-of-type(2)',
+    ]
+
+
+def test_dom_path_counts_equal_siblings():
+    # Siblings with the same content are still told apart
+    soup = BeautifulSoup("<ul>" + "<li>Пункт</li>" * 300 + "</ul>", 'lxml')
+    positions = {}
+    
+    paths = [TextExtractor.dom_path(li, positions) for li in soup.find_all('li')]
+    
+    assert paths[0] == 'body > ul > li:nth-of-type(1)'
+    assert paths[-1] == 'body > ul > li:nth-of-type(300)'
+    assert len(set(paths)) == 300
+
+
+def test_locate_maps_offsets_to_source():
+    html = "<html><body>\n<p>Перший рядок\nдругий рядок</p></body></html>"
+    [block] = extract(html)
+    
+    assert block['text'] == 'Перший рядок другий рядок'
+    assert TextExtractor.locate(block, 0) == (2, 4)
+    assert TextExtractor.locate(block, block['text'].index('другий')) == (3, 1)
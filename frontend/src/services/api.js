@@ -41,14 +41,23 @@ export default {
     return api.get(`/scans/${id}`)
   },
   
-  createScan(websiteId) {
-    return api.post('/scans/', { website_id: websiteId })
+  createScan(websiteId, force = false) {
+    return api.post('/scans/', { website_id: websiteId, force })
+  },
+  
+  cancelScan(id) {
+    return api.post(`/scans/${id}/cancel`)
   },
   
   getScanStatus(id) {
     return api.get(`/scans/${id}/status`)
   },
   
+  // Server-Sent Events stream of a scan's live progress (for EventSource)
+  scanEventsUrl(id) {
+    return `${API_URL}/scans/${id}/events`
+  },
+  
   deleteScan(id) {
     return api.delete(`/scans/${id}`)
   },